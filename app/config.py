@@ -0,0 +1,13 @@
+# app/config.py
+"""
+Dashboard defaults, importable without pulling in the compute chain.
+"""
+
+DEFAULT_CONFIG = {
+    "symbol": "SOL",
+    "history_days": 30,
+    "bars_per_day": 24,
+    "capital_usd": 10000,
+    "leverage": 2,
+    "horizon_days": 7
+}
@@ -1,8 +1,92 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
 import streamlit as st
 
-from .data.store.price_store import get_current_price, get_price_history
-from .core.ta.ta_aggregator import aggregate_ta_signals
+# `streamlit run app/main.py` only puts app/ on sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from telemetry import startup  # first, so its clock starts before the rest
+
+# Light imports only: the snapshot path renders without importing the
+# compute chain or the HTTP sources; those load on first fallback use.
+from app.config import DEFAULT_CONFIG
+from data.store.snapshot_store import read_latest_snapshot
+from telemetry import metrics
+
+startup.mark("imports")
+
+REFRESH_SECONDS = 60   # one upstream fetch per interval, shared by all sessions
+SPOT_TTL_SECONDS = 15
+SNAPSHOT_POLL_SECONDS = 5
+SNAPSHOT_MAX_AGE_SECONDS = 3 * 60   # worker silent this long -> inline pipeline
+HISTORY_CHART_DAYS = 7
+
+# Metrics file written by `python -m app.snapshot_worker --metrics-file ...`
+WORKER_METRICS_FILE = os.environ.get("DEFITUNA_METRICS_FILE")
+
+
+# -----------------------
+# CACHED STAGES (shared across sessions)
+# -----------------------
+@st.cache_data(ttl=SNAPSHOT_POLL_SECONDS, show_spinner=False)
+def load_snapshot(symbol: str):
+    # Written by app/snapshot_worker.py; None if no worker is running
+    return read_latest_snapshot(symbol)
+
+
+@st.cache_data(ttl=REFRESH_SECONDS, show_spinner=False)
+def load_price_history(symbol: str, days: int):
+    from data.store.price_store import get_bars
+
+    return get_bars(symbol, days=days)
+
+
+@st.cache_data(ttl=SPOT_TTL_SECONDS, show_spinner=False)
+def load_current_price(symbol: str):
+    from data.store.price_store import get_current_price
+
+    return get_current_price(symbol)
 
+
+@st.cache_data(ttl=REFRESH_SECONDS, show_spinner=False)
+def load_recommendation_history(symbol: str, days: int):
+    # Recorded by the snapshot worker; empty without one
+    from data.store.pipeline_history import history
+
+    return history(
+        symbol,
+        start=int((time.time() - days * 86_400) * 1000),
+        columns=["current_price", "fusion_confidence", "balanced_range_low", "balanced_range_high"]
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_pipeline(version: str, config_json: str, _price_df):
+    # Keyed on version (latest bar + config hash); the frame itself is
+    # not hashed (leading underscore).
+    from app.pipeline import run_pipeline
+
+    return run_pipeline(_price_df, json.loads(config_json))
+
+
+def invalidate_pipeline_cache():
+    """
+    Drop cached prices and pipeline results for every session,
+    e.g. after a config change or a bad upstream response.
+    """
+    load_snapshot.clear()
+    load_price_history.clear()
+    load_current_price.clear()
+    cached_pipeline.clear()
+
+
+# -----------------------
+# PAGE
+# -----------------------
 st.set_page_config(
     page_title="DeFiTuna LP Dashboard",
     layout="wide"
@@ -11,27 +95,154 @@ st.set_page_config(
 st.title("DeFiTuna LP Dashboard")
 st.caption("Multi-Range Liquidity Intelligence System")
 
-symbol = "SOL"
+config = dict(DEFAULT_CONFIG)
+symbol = config["symbol"]
+
+with st.sidebar:
+    if st.button("Force refresh"):
+        invalidate_pipeline_cache()
+
+    # Process-wide and one-way: ticking starts recording for every
+    # session; unticking only hides this session's panel, so one viewer
+    # can't switch off metrics others (or DEFITUNA_METRICS=1) turned on
+    show_debug = st.checkbox("Debug metrics", value=metrics.is_enabled())
+    if show_debug:
+        metrics.enable(True)
 
 # -----------------------
-# PRICE
+# STATE: worker snapshot, or inline cached pipeline as fallback
 # -----------------------
-current_price = get_current_price(symbol)
-price_history = get_price_history(symbol, days=30)
+snapshot = load_snapshot(symbol)
+
+# A dead or stalled worker leaves its last snapshot behind; don't serve it
+# forever. Judged by the worker's heartbeat: on quiet data a healthy worker
+# keeps an old snapshot, since it only publishes on change.
+if snapshot is not None:
+    silent_seconds = time.time() - snapshot.get("heartbeat_ms", 0) / 1000
+    if silent_seconds > SNAPSHOT_MAX_AGE_SECONDS:
+        st.warning(
+            f"Snapshot worker last seen {silent_seconds / 60:.0f} min ago "
+            "(is it running?); computing inline instead."
+        )
+        snapshot = None
+
+if snapshot is not None:
+    state = snapshot["pipeline"]
+    fa = snapshot["fa"]
+    current_price = state["current_price"]
+else:
+    from app.pipeline import data_version
 
-st.subheader("SOL Price")
-st.metric("Current Price", f"${current_price:,.2f}")
+    # History first: a fresh last bar doubles as the spot price
+    price_history = load_price_history(symbol, config["history_days"])
+    current_price = load_current_price(symbol)
+    fa = None
+
+    if price_history.empty:
+        st.error("No price history available.")
+        st.stop()
+
+    state = cached_pipeline(
+        data_version(price_history, config),
+        json.dumps(config, sort_keys=True),
+        price_history
+    )
+
+# -----------------------
+# PRICE
+# -----------------------
+st.subheader(f"{symbol} Price")
+st.metric("Current Price", f"${(current_price or state['current_price']):,.2f}")
+st.caption(
+    f"Data version {state['version']}"
+    + (" · from background snapshot" if snapshot is not None else "")
+)
 
 # -----------------------
 # TECHNICAL ANALYSIS
 # -----------------------
-ta = aggregate_ta_signals(price_history)
+ta = state["ta"]
 
 st.subheader("Technical Analysis")
-st.metric("TA Score", ta["score"])
-st.write("Volatility Regime:", ta["volatility_regime"])
-st.write("Trend Strength:", ta["trend_strength"])
+st.metric("TA Score", ta["ta_score"])
+st.write("Volatility Regime:", ta["volatility"])
+st.write("Trend Strength:", ta["trend"])
 
 st.subheader("Technical Drivers")
 for d in ta["drivers"]:
     st.write("•", d)
+
+# -----------------------
+# MARKET STATE
+# -----------------------
+fusion = state["fusion"]
+
+st.subheader("Market State")
+col1, col2, col3 = st.columns(3)
+col1.metric("Direction", fusion["direction"])
+col2.metric("Regime", state["regime"])
+col3.metric("Confidence", fusion["confidence"])
+
+# -----------------------
+# FUNDAMENTALS (snapshot only; never fetched on the request path)
+# -----------------------
+if fa is not None:
+    st.subheader("Fundamental Analysis")
+    st.metric("FA Score", fa["fa_score"])
+    for d in fa["drivers"]:
+        st.write("•", d)
+
+# -----------------------
+# RANGES + SCENARIOS
+# -----------------------
+st.subheader("LP Ranges")
+st.table(state["multi_ranges"]["ranges"])
+
+st.subheader("Capital Scenarios")
+st.table(state["scenarios"])
+
+# Older snapshots predate the calendar
+if state.get("events"):
+    st.write(f"High-impact events within {config['horizon_days']} days")
+    st.table([{k: e[k] for k in ("start", "name", "kind", "asset")} for e in state["events"]])
+
+startup.mark("first_render")
+
+# -----------------------
+# RECOMMENDATION HISTORY (worker-recorded, on demand: reading it loads
+# numpy / pandas, which the snapshot path otherwise never imports)
+# -----------------------
+if st.checkbox(f"Show recommendation history ({HISTORY_CHART_DAYS}d)"):
+    rec_history = load_recommendation_history(symbol, HISTORY_CHART_DAYS)
+    if rec_history.empty:
+        st.info("No history recorded yet (it is written by the snapshot worker).")
+    else:
+        st.subheader(f"Recommendation History ({HISTORY_CHART_DAYS}d)")
+        st.line_chart(rec_history[["current_price", "balanced_range_low", "balanced_range_high"]])
+        st.line_chart(rec_history[["fusion_confidence"]])
+
+# -----------------------
+# DEBUG PANEL (optional)
+# -----------------------
+if show_debug:
+    st.subheader("Debug: Stage Metrics")
+    m = metrics.snapshot()
+
+    st.write("Stage latency (ms, this process)")
+    st.table([{"stage": k, **v} for k, v in m["stages"].items()] or [{"stage": "none recorded yet"}])
+
+    st.write("Cache hit ratios")
+    st.table([{"cache": k, **v} for k, v in m["caches"].items()] or [{"cache": "none recorded yet"}])
+
+    st.write("Upstream errors")
+    st.json(m["errors"])
+
+    st.write("Cold start (ms since telemetry.startup import, first script run)")
+    st.json({"marks": startup.marks(), "heavy_modules_loaded": startup.loaded_heavy_modules()})
+
+    st.download_button("Download Prometheus text", metrics.to_prometheus(), file_name="defituna.prom")
+
+    if WORKER_METRICS_FILE and os.path.exists(WORKER_METRICS_FILE):
+        with st.expander("Snapshot worker metrics"):
+            with open(WORKER_METRICS_FILE) as f:
+                st.code(f.read())
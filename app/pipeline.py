@@ -0,0 +1,106 @@
+# app/pipeline.py
+"""
+The dashboard's compute chain as one pure function of (prices, config),
+so results can be cached and shared by data version.
+"""
+
+import hashlib
+import json
+import math
+
+from core.ai.regime_detector import detect_market_regime
+from core.backtest.signals import VOL_WINDOW
+from core.fa.calendar.economic_calendar import upcoming_events
+from core.market_state.market_state_engine import derive_market_state
+from core.scenario.scenario_engine import run_scenario_engine
+from core.strategy.fusion_engine import fuse_signals
+from core.strategy.multi_range_engine import generate_multi_ranges
+from core.ta.fused import compute_indicators
+from core.ta.inputs import close_series
+from core.ta.ta_aggregator import run_ta
+from telemetry.metrics import span
+
+
+def config_hash(config: dict) -> str:
+    blob = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode()).hexdigest()[:12]
+
+
+def data_version(price_df, config: dict) -> str:
+    """
+    Cache key for pipeline results: latest bar timestamp + its close +
+    config hash. Bars are keyed by open time, so the last bar keeps its
+    timestamp while its close updates; the close moves the version too.
+    Unchanged data and config -> same version -> same results.
+    """
+    if not len(price_df):
+        return f"empty|{config_hash(config)}"
+    last_bar = price_df.index[-1].isoformat()
+    last_close = float(close_series(price_df).iloc[-1])
+    return f"{last_bar}|{last_close!r}|{config_hash(config)}"
+
+
+def daily_volatility_pct(prices, bars_per_day: int) -> float:
+    vol = compute_indicators(prices, vol_window=VOL_WINDOW)["volatility"]
+    if vol is None:
+        return 0.0
+    return vol * math.sqrt(bars_per_day) * 100
+
+
+def run_pipeline(price_df, config: dict) -> dict:
+    """
+    price -> TA -> market state / regime -> fusion -> ranges -> scenarios.
+
+    Calendar events are looked up relative to the last bar, so the
+    result stays a function of (prices, config) between file edits.
+    """
+    prices = close_series(price_df).to_numpy(dtype=float)
+    current_price = float(prices[-1])
+
+    with span("ta"):
+        ta = run_ta(price_df)
+    with span("market_state"):
+        market_state = derive_market_state(ta)
+    with span("regime"):
+        regime = detect_market_regime(price_df)
+    with span("fusion"):
+        fusion = fuse_signals(price_df, ta_output=ta)
+
+    with span("ranges"):
+        volatility_pct = daily_volatility_pct(prices, config["bars_per_day"])
+        multi_ranges = generate_multi_ranges(
+            current_price,
+            volatility_pct,
+            fusion["direction"],
+            capital=config["capital_usd"],
+            leverage=config["leverage"]
+        )
+
+    with span("scenarios"):
+        scenarios = run_scenario_engine(
+            {
+                "final_direction": fusion["direction"],
+                "final_confidence": fusion["confidence"],
+                "multi_ranges": multi_ranges
+            },
+            capital_usd=config["capital_usd"],
+            leverage=config["leverage"],
+            horizon_days=config["horizon_days"]
+        )
+
+    with span("calendar"):
+        events = upcoming_events(config["horizon_days"], now=price_df.index[-1])
+
+    return {
+        "version": data_version(price_df, config),
+        "last_bar": price_df.index[-1].isoformat(),
+        "current_price": current_price,
+        "ta": ta,
+        "market_state": market_state,
+        "regime": regime,
+        "fusion": fusion,
+        "volatility_pct": round(volatility_pct, 2),
+        "multi_ranges": multi_ranges,
+        "scenarios": scenarios,
+        "events": events
+    }
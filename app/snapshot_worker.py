@@ -0,0 +1,201 @@
+# app/snapshot_worker.py
+"""
+Background snapshot builder: runs the full chain off the request path
+and publishes immutable snapshots the dashboard only has to read.
+
+    python -m app.snapshot_worker --symbol SOL
+
+Each stage refreshes on its own cadence. FA news runs on its own
+thread, so a slow feed delays only the FA part of the next snapshot,
+never the price / TA part.
+
+Every tick also writes a heartbeat, so the dashboard can tell a quiet
+market (no new snapshot) from a dead worker.
+
+Every new pipeline result is also appended to the pipeline history
+(data/store/pipeline_history.py); its retention / compaction runs as
+the slow "history" stage.
+
+--metrics-file enables instrumentation and rewrites the file (Prometheus
+text, or JSON for *.json) after every tick; the dashboard's debug panel
+shows it when DEFITUNA_METRICS_FILE points at the same path.
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import DEFAULT_CONFIG
+from app.pipeline import data_version, run_pipeline
+from core.fa.fa_aggregator import aggregate_fa_signals
+from data.store.pipeline_history import apply_retention, record_pipeline
+from data.store.price_store import get_bars
+from data.store.snapshot_store import publish_snapshot, write_heartbeat
+from telemetry.metrics import enable, span, write_metrics
+
+log = logging.getLogger("snapshot_worker")
+
+STAGE_CADENCE_SECONDS = {
+    "prices": 60,
+    "fa": 15 * 60,
+    "history": 6 * 3600
+}
+
+TICK_SECONDS = 1.0
+HEARTBEAT_SECONDS = 10.0   # well under the dashboard's SNAPSHOT_MAX_AGE_SECONDS
+
+
+class SnapshotWorker:
+
+    def __init__(
+        self,
+        config: dict | None = None,
+        cadence: dict | None = None,
+        metrics_file: str | None = None
+    ):
+        self.config = dict(DEFAULT_CONFIG, **(config or {}))
+        self.cadence = dict(STAGE_CADENCE_SECONDS, **(cadence or {}))
+        self.symbol = self.config["symbol"]
+
+        self._last_run = {stage: 0.0 for stage in self.cadence}
+        self._fa_pool = ThreadPoolExecutor(max_workers=1)
+        self._fa_future = None
+
+        self.price_df = None
+        self.pipeline = None
+        self.fa = None
+        self.stage_seconds = {}
+        self._published_key = None
+        self._heartbeat_at = 0.0
+        self.metrics_file = metrics_file
+
+    # -----------------------------
+    # STAGES
+    # -----------------------------
+    def _due(self, stage: str, now: float) -> bool:
+        return now - self._last_run[stage] >= self.cadence[stage]
+
+    def _run_prices(self):
+        t0 = time.perf_counter()
+        df = get_bars(self.symbol, days=self.config["history_days"])
+        self.stage_seconds["prices"] = round(time.perf_counter() - t0, 4)
+
+        if df.empty:
+            return
+
+        # Only recompute the chain when the data version moved
+        if self.pipeline is None or data_version(df, self.config) != self.pipeline["version"]:
+            t0 = time.perf_counter()
+            self.pipeline = run_pipeline(df, self.config)
+            self.stage_seconds["pipeline"] = round(time.perf_counter() - t0, 4)
+            try:
+                with span("history"):
+                    record_pipeline(self.symbol, self.pipeline)
+            except OSError:
+                log.exception("Could not record pipeline history")
+        self.price_df = df
+
+    def _poll_fa(self, now: float):
+        if self._fa_future is not None and self._fa_future.done():
+            try:
+                self.fa = self._fa_future.result()
+            except Exception:
+                log.exception("FA refresh failed; keeping previous FA")
+            self._fa_future = None
+
+        if self._fa_future is None and self._due("fa", now):
+            self._last_run["fa"] = now
+            self._fa_future = self._fa_pool.submit(self._timed_fa)
+
+    def _timed_fa(self) -> dict:
+        t0 = time.perf_counter()
+        with span("fa"):
+            fa = aggregate_fa_signals()
+        self.stage_seconds["fa"] = round(time.perf_counter() - t0, 4)
+        return fa
+
+    # -----------------------------
+    # LOOP
+    # -----------------------------
+    def tick(self, now: float | None = None):
+        now = time.time() if now is None else now
+
+        if self._due("prices", now):
+            self._last_run["prices"] = now
+            try:
+                self._run_prices()
+            except Exception:
+                log.exception("Price refresh failed; keeping previous snapshot")
+
+        self._poll_fa(now)
+
+        if self._due("history", now):
+            self._last_run["history"] = now
+            try:
+                log.info("History retention: %s", apply_retention(self.symbol))
+            except Exception:
+                log.exception("History retention failed")
+
+        self._publish_if_changed()
+
+        if now - self._heartbeat_at >= HEARTBEAT_SECONDS:
+            try:
+                write_heartbeat(self.symbol)
+                self._heartbeat_at = now
+            except OSError:
+                log.exception("Could not write heartbeat")
+
+        if self.metrics_file:
+            write_metrics(self.metrics_file)
+
+    def _publish_if_changed(self):
+        if self.pipeline is None:
+            return
+
+        fa_key = None if self.fa is None else (self.fa["fa_score"], tuple(self.fa["drivers"]))
+        key = (self.pipeline["version"], fa_key)
+        if key == self._published_key:
+            return
+
+        publish_snapshot(self.symbol, {
+            "symbol": self.symbol,
+            "config": self.config,
+            "pipeline": self.pipeline,
+            "fa": self.fa,
+            "stage_seconds": dict(self.stage_seconds)
+        })
+        self._published_key = key
+        log.info("Published snapshot %s", self.pipeline["version"])
+
+    def run_forever(self):
+        try:
+            while True:
+                self.tick()
+                time.sleep(TICK_SECONDS)
+        finally:
+            self._fa_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard snapshot builder")
+    parser.add_argument("--symbol", default=DEFAULT_CONFIG["symbol"])
+    parser.add_argument("--prices-every", type=float, default=STAGE_CADENCE_SECONDS["prices"])
+    parser.add_argument("--fa-every", type=float, default=STAGE_CADENCE_SECONDS["fa"])
+    parser.add_argument("--metrics-file", help="write stage metrics here after every tick")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    if args.metrics_file:
+        enable()
+
+    SnapshotWorker(
+        config={"symbol": args.symbol},
+        cadence={"prices": args.prices_every, "fa": args.fa_every},
+        metrics_file=args.metrics_file
+    ).run_forever()
+
+
+if __name__ == "__main__":
+    main()
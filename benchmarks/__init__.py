@@ -0,0 +1 @@
+# offline benchmarks
@@ -0,0 +1,73 @@
+# benchmarks/bench_router.py
+"""
+PriceRouter tail latency against a degraded source, with and without
+hedging, plus an outage that should trip the circuit breaker. Fully
+offline (in-process fake sources).
+
+    python -m benchmarks.bench_router --requests 400
+"""
+
+import argparse
+import time
+
+from data.router.price_router import PriceRouter
+from data.sources.fake_sources import FakePriceSource
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def _run(label: str, router: PriceRouter, n_requests: int) -> dict:
+    latencies = []
+    failures = 0
+    for _ in range(n_requests):
+        t0 = time.perf_counter()
+        try:
+            router.spot("sol")
+        except RuntimeError:
+            failures += 1
+        latencies.append(time.perf_counter() - t0)
+
+    latencies.sort()
+    return {
+        "label": label,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 1),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 1),
+        "max_ms": round(latencies[-1] * 1000, 1),
+        "failures": failures,
+        "health": router.status(),
+    }
+
+
+def _sources(seed: int):
+    # Primary: fastest on median, but 5% of calls stall for a second
+    primary = FakePriceSource("primary", latency_ms=5, tail_ms=1000, tail_rate=0.05, seed=seed)
+    backup = FakePriceSource("backup", latency_ms=25, seed=seed + 1)
+    return primary, backup
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--hedge-after", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for label, hedge_after in (("no_hedge", None), ("hedged", args.hedge_after)):
+        router = PriceRouter(_sources(args.seed), hedge_after=hedge_after)
+        print(_run(label, router, args.requests))
+        router.close()
+
+    # Outage: primary fails every call; the breaker should take it out
+    primary, backup = _sources(args.seed)
+    router = PriceRouter([primary, backup], hedge_after=args.hedge_after, cooldown=1.0)
+    primary.degrade(error_rate=1.0)
+    result = _run("primary_down", router, args.requests)
+    result["primary_calls"] = primary.calls
+    print(result)
+    router.close()
+
+
+if __name__ == "__main__":
+    main()
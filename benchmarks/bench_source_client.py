@@ -0,0 +1,78 @@
+# benchmarks/bench_source_client.py
+"""
+Bare requests.get vs the pooled SourceClient against the local fake
+CoinGecko server. Fully offline.
+
+    python -m benchmarks.bench_source_client --requests 500 --threads 8
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from data.sources.fake_coingecko import serve
+from data.sources.http_client import SourceClient
+
+
+def _run(label: str, call, n_requests: int, threads: int) -> dict:
+    latencies = []
+
+    def one(i):
+        t0 = time.perf_counter()
+        call(i)
+        latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one, range(n_requests)))
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "label": label,
+        "requests": n_requests,
+        "throughput_rps": round(n_requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, base_url = serve(latency_ms=args.latency_ms, error_rate=args.error_rate)
+
+    # Distinct "to" values so the response cache does not flatter the client
+    def params(i):
+        return {"vs_currency": "usd", "from": 1_700_000_000, "to": 1_700_003_600 + i}
+
+    def bare(i):
+        r = requests.get(f"{base_url}/coins/solana/market_chart/range", params=params(i), timeout=10)
+        r.raise_for_status()
+        r.json()
+
+    client = SourceClient(base_url, rate_per_sec=1e6, burst=1e6, pool_size=args.threads)
+
+    def pooled(i):
+        client.get_json("coins/solana/market_chart/range", params=params(i))
+
+    def cached(i):
+        client.get_json("simple/price", params={"ids": "solana", "vs_currencies": "usd"}, cache_ttl=60)
+
+    try:
+        for label, call in [("requests.get", bare), ("SourceClient", pooled), ("SourceClient+cache", cached)]:
+            print(_run(label, call, args.requests, args.threads))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
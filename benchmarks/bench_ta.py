@@ -0,0 +1,81 @@
+# benchmarks/bench_ta.py
+"""
+Fused TA kernel vs the per-module indicator path on long hourly
+histories. Fully offline (synthetic GBM prices).
+
+    python -m benchmarks.bench_ta --bars 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.ta.fused import compute_indicators
+from core.ta.ma_20 import ma_20
+from core.ta.ma_200 import ma_200
+from core.ta.rsi import calculate_rsi
+from core.ta.trend_strength import trend_strength
+from core.ta.volatility import calculate_volatility
+
+
+def synthetic_hourly(n_bars: int, seed: int = 7) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(0.0, 0.01, n_bars)
+    prices = 150.0 * np.exp(np.cumsum(log_returns))
+    index = pd.date_range("2020-01-01", periods=n_bars, freq="h")
+    return pd.Series(prices, index=index)
+
+
+def per_module(series: pd.Series) -> dict:
+    return {
+        "rsi": calculate_rsi(series),
+        "above_ma20": ma_20(series),
+        "above_ma200": ma_200(series),
+        "trend": trend_strength(series),
+        "volatility": calculate_volatility(series.to_frame("close"))["volatility"],
+    }
+
+
+def fused(series: pd.Series) -> dict:
+    return compute_indicators(series.to_numpy(dtype=float))
+
+
+def _best_of(fn, arg, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for n in args.bars:
+        series = synthetic_hourly(n)
+
+        old, new = per_module(series), fused(series)
+        assert np.isclose(old["rsi"], new["rsi"])
+        assert bool(old["above_ma20"]) == new["above_ma20"]
+        assert bool(old["above_ma200"]) == new["above_ma200"]
+        assert old["trend"] == new["trend"]
+        assert np.isclose(old["volatility"], new["volatility"])
+
+        t_old = _best_of(per_module, series, args.repeat)
+        t_new = _best_of(fused, series, args.repeat)
+        print({
+            "bars": n,
+            "per_module_ms": round(t_old * 1000, 3),
+            "fused_ms": round(t_new * 1000, 3),
+            "speedup": round(t_old / t_new, 1),
+        })
+
+
+if __name__ == "__main__":
+    main()
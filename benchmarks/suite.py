@@ -0,0 +1,318 @@
+# benchmarks/suite.py
+"""
+Benchmark harness for the compute hot paths: TA, regime detection,
+range generation and scenarios (single and portfolio). Fully offline
+(synthetic GBM prices; socket connects are refused while stages run).
+
+Every stage runs on a (bars x symbols) price matrix for each size in
+--bars and each count in --symbols, and reports latency, throughput
+(price cells per second) and peak traced memory.
+
+    python -m benchmarks.suite --bars 1000 100000 10000000 --symbols 1 8 32
+    python -m benchmarks.suite --save benchmarks/baselines/local.json
+    python -m benchmarks.suite --compare benchmarks/baselines/local.json
+
+With --compare, results slower (or heavier) than the baseline by more
+than --threshold are flagged and the exit code is 1.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import socket
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from core.ai.regime_detector import detect_market_regime, detect_market_regime_batch
+from core.scenario.monte_carlo import run_monte_carlo_scenarios
+from core.scenario.portfolio import run_portfolio_scenarios
+from core.scenario.scenario_engine import run_scenario_engine
+from core.strategy.multi_range_engine import (
+    MODE_WIDTH_FACTORS,
+    MODES,
+    compute_range_bounds,
+    generate_multi_ranges
+)
+from core.ta.batch import compute_indicators_batch, score_indicators_batch
+from core.ta.fused import compute_indicators
+
+DEFAULT_BARS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_SYMBOLS = [1, 8, 32]
+MAX_CELLS = 20_000_000          # bars x symbols; bigger combinations are skipped
+MC_PATHS = 2_000                # Monte Carlo paths per symbol
+
+THRESHOLD = 0.25                # relative slowdown that counts as a regression
+MEMORY_THRESHOLD = 0.25
+NOISE_FLOOR_MS = 0.5            # ignore differences below this
+
+
+# -----------------------------
+# SYNTHETIC DATA
+# -----------------------------
+def synthetic_matrix(n_bars: int, n_symbols: int, seed: int = 7) -> np.ndarray:
+    """
+    (n_bars x n_symbols) hourly GBM prices, one independent walk per column.
+    """
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(0.0, 0.01, (n_bars, n_symbols))
+    start = rng.uniform(1.0, 200.0, n_symbols)
+    return start * np.exp(np.cumsum(log_returns, axis=0))
+
+
+# -----------------------------
+# STAGES
+# -----------------------------
+def stage_ta_fused(matrix: np.ndarray):
+    return [compute_indicators(matrix[:, j]) for j in range(matrix.shape[1])]
+
+
+def stage_ta_batch(matrix: np.ndarray):
+    return score_indicators_batch(compute_indicators_batch(matrix), with_drivers=False)
+
+
+def stage_regime(matrix: np.ndarray):
+    return [detect_market_regime(pd.Series(matrix[:, j])) for j in range(matrix.shape[1])]
+
+
+def stage_regime_batch(matrix: np.ndarray):
+    return detect_market_regime_batch(matrix)
+
+
+def stage_ranges(matrix: np.ndarray):
+    # Multi-range bounds at every bar, direction from the 1-bar move
+    sign = np.sign(np.diff(matrix, axis=0, prepend=matrix[:1]))
+    return {
+        mode: compute_range_bounds(matrix, 3.0, sign, MODE_WIDTH_FACTORS[mode])
+        for mode in MODES
+    }
+
+
+def _fusion(price: float) -> dict:
+    return {
+        "final_direction": "Bullish",
+        "final_confidence": 0.6,
+        "multi_ranges": generate_multi_ranges(price, 3.0, "Bullish")
+    }
+
+
+def stage_scenarios(matrix: np.ndarray):
+    return [run_scenario_engine(_fusion(p)) for p in matrix[-1]]
+
+
+def stage_monte_carlo(matrix: np.ndarray):
+    return [
+        run_monte_carlo_scenarios(
+            _fusion(matrix[-1, j]),
+            matrix[-1, j],
+            n_paths=MC_PATHS,
+            model="bootstrap",
+            historical_prices=matrix[:, j],
+            seed=j
+        )
+        for j in range(matrix.shape[1])
+    ]
+
+
+def stage_portfolio(matrix: np.ndarray):
+    # One LP position per price cell: 100 units at that price
+    prices = matrix.ravel()
+    modes = np.array(MODES, dtype=object)
+    return run_portfolio_scenarios(
+        {
+            "capital_usd": prices * 100,
+            "leverage": np.full(len(prices), 2.0),
+            "mode": modes[np.arange(len(prices)) % len(MODES)],
+            "width_pct": np.full(len(prices), 3.0)
+        },
+        direction="Bullish",
+        confidence=0.6
+    )
+
+
+STAGES = {
+    "ta_fused": stage_ta_fused,
+    "ta_batch": stage_ta_batch,
+    "regime": stage_regime,
+    "regime_batch": stage_regime_batch,
+    "ranges": stage_ranges,
+    "scenarios": stage_scenarios,
+    "portfolio": stage_portfolio,
+    "monte_carlo": stage_monte_carlo,
+}
+
+
+# -----------------------------
+# MEASUREMENT
+# -----------------------------
+@contextlib.contextmanager
+def no_network():
+    """
+    Any socket connect inside the block raises, so a stage that
+    reaches for the network fails loudly instead of skewing timings.
+    """
+    def refuse(*args, **kwargs):
+        raise RuntimeError("benchmarks must run offline")
+
+    original = socket.socket.connect, socket.socket.connect_ex, socket.create_connection
+    socket.socket.connect = socket.socket.connect_ex = refuse
+    socket.create_connection = refuse
+    try:
+        yield
+    finally:
+        socket.socket.connect, socket.socket.connect_ex, socket.create_connection = original
+
+
+def measure(fn, matrix: np.ndarray, repeat: int) -> dict:
+    """
+    Timings come from untraced runs (tracemalloc slows allocation-heavy
+    code); peak memory from one extra traced run.
+    """
+    fn(matrix)  # warm-up
+
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(matrix)
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        fn(matrix)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "median_ms": round(median * 1000, 3),
+        "best_ms": round(min(times) * 1000, 3),
+        "cells_per_sec": round(matrix.size / median) if median > 0 else None,
+        "peak_mb": round(peak / 2**20, 3),
+    }
+
+
+def run_suite(bars, symbols, stages, repeat: int = 5, max_cells: int = MAX_CELLS, seed: int = 7) -> list[dict]:
+    results = []
+    with no_network():
+        for n_symbols in symbols:
+            for n_bars in bars:
+                if n_bars * n_symbols > max_cells:
+                    continue
+                matrix = synthetic_matrix(n_bars, n_symbols, seed)
+                for name in stages:
+                    row = {"stage": name, "bars": n_bars, "symbols": n_symbols}
+                    row.update(measure(STAGES[name], matrix, repeat))
+                    results.append(row)
+                    print(json.dumps(row), flush=True)
+                del matrix
+    return results
+
+
+# -----------------------------
+# BASELINES
+# -----------------------------
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def _key(row: dict) -> tuple:
+    return row["stage"], row["bars"], row["symbols"]
+
+
+def save_baseline(path: str, results: list[dict]):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "environment": environment(),
+            "results": results
+        }, f, indent=2)
+
+
+def compare(
+    results: list[dict],
+    baseline: dict,
+    threshold: float = THRESHOLD,
+    memory_threshold: float = MEMORY_THRESHOLD,
+    noise_floor_ms: float = NOISE_FLOOR_MS
+) -> list[dict]:
+    """
+    Returns one entry per result that regressed against the baseline.
+    Results without a baseline counterpart are ignored.
+    """
+    previous = {_key(r): r for r in baseline["results"]}
+    regressions = []
+
+    for row in results:
+        old = previous.get(_key(row))
+        if old is None:
+            continue
+
+        # Best-of-N is far less noisy than the median for this check
+        slower = (
+            row["best_ms"] > old["best_ms"] * (1 + threshold)
+            and row["best_ms"] - old["best_ms"] > noise_floor_ms
+        )
+        heavier = row["peak_mb"] > old["peak_mb"] * (1 + memory_threshold) and row["peak_mb"] - old["peak_mb"] > 1.0
+
+        if slower or heavier:
+            regressions.append({
+                "stage": row["stage"],
+                "bars": row["bars"],
+                "symbols": row["symbols"],
+                "best_ms": [old["best_ms"], row["best_ms"]],
+                "peak_mb": [old["peak_mb"], row["peak_mb"]],
+                "slower": slower,
+                "heavier": heavier,
+            })
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite for the compute hot paths")
+    parser.add_argument("--bars", type=int, nargs="+", default=DEFAULT_BARS)
+    parser.add_argument("--symbols", type=int, nargs="+", default=DEFAULT_SYMBOLS)
+    parser.add_argument("--stages", nargs="+", choices=sorted(STAGES), default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-cells", type=int, default=MAX_CELLS)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--memory-threshold", type=float, default=MEMORY_THRESHOLD)
+    args = parser.parse_args()
+
+    results = run_suite(args.bars, args.symbols, args.stages, args.repeat, args.max_cells, args.seed)
+
+    if args.save:
+        save_baseline(args.save, results)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("environment") != environment():
+            print("warning: baseline was recorded in a different environment", file=sys.stderr)
+
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+        for r in regressions:
+            print("REGRESSION", json.dumps(r))
+        if regressions:
+            sys.exit(1)
+        print("no regressions")
+
+
+if __name__ == "__main__":
+    main()
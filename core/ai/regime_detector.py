@@ -1,5 +1,12 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
 
+from core.ta.array_ops import nan_std, tail_mean, valid_bars
+from core.ta.inputs import close_series
+
 
 def detect_market_regime(price_input) -> str:
     """
@@ -10,16 +17,9 @@ def detect_market_regime(price_input) -> str:
     # -----------------------------
     # Normalize input to Series
     # -----------------------------
-    if isinstance(price_input, pd.DataFrame):
-        # Try common column names
-        for col in ["close", "Close", "price", "Price"]:
-            if col in price_input.columns:
-                price_series = price_input[col]
-                break
-        else:
-            return "Unknown"
-    else:
-        price_series = pd.Series(price_input)
+    price_series = close_series(price_input)
+    if price_series is None:
+        return "Unknown"
 
     price_series = price_series.astype(float).dropna()
 
@@ -55,3 +55,241 @@ def detect_market_regime(price_input) -> str:
         return "High-Risk"
 
     return "Choppy"
+
+
+def detect_market_regime_batch(matrix: np.ndarray, n_valid: np.ndarray | None = None) -> np.ndarray:
+    """
+    detect_market_regime for every column of a (time x symbol) matrix
+    at once. Columns with fewer than 60 trailing bars are "Unknown".
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if n_valid is None:
+        n_valid = valid_bars(matrix)
+
+    labels = np.full(matrix.shape[1], "Unknown", dtype=object)
+    if matrix.shape[0] < 60:
+        return labels
+
+    # -----------------------------
+    # Moving-average spread now vs 4 bars back
+    # -----------------------------
+    spread_latest = tail_mean(matrix, 20, n_valid) - tail_mean(matrix, 50, n_valid)
+    spread_prev = (
+        tail_mean(matrix, 20, n_valid, offset=4)
+        - tail_mean(matrix, 50, n_valid, offset=4)
+    )
+
+    # -----------------------------
+    # Volatility (last 20 vs last 60 returns)
+    # -----------------------------
+    tail = matrix[-61:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = np.diff(tail, axis=0) / tail[:-1]
+    returns[~np.isfinite(returns)] = np.nan
+
+    recent_vol = nan_std(returns[-20:])
+    long_vol = nan_std(returns[-60:])
+
+    # -----------------------------
+    # Same rules as detect_market_regime
+    # -----------------------------
+    with np.errstate(invalid="ignore"):
+        trending = (np.abs(spread_latest) > np.abs(spread_prev)) & (recent_vol <= long_vol)
+        high_risk = recent_vol > long_vol * 1.5
+
+    ready = n_valid >= 60
+    labels[ready] = np.select(
+        [trending[ready], high_risk[ready]],
+        ["Trending", "High-Risk"],
+        default="Choppy"
+    )
+    return labels
+
+
+# -----------------------------
+# FULL-HISTORY SERIES
+# -----------------------------
+REGIME_LABELS = ("Unknown", "Trending", "High-Risk", "Choppy")
+UNKNOWN, TRENDING, HIGH_RISK, CHOPPY = range(4)
+
+MIN_BARS = 60
+CONTEXT_BARS = 61     # prices behind one label: 60 returns (MA50 at t-4 needs only 54)
+MEMO_SIZE = 64
+
+
+def _trailing_mean(x: np.ndarray, window: int) -> np.ndarray:
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] >= window:
+        c = np.cumsum(np.concatenate(([0.0], x)))
+        out[window - 1:] = (c[window:] - c[:-window]) / window
+    return out
+
+
+def _trailing_std(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Sample std over the last `window` values, or over all of them while
+    fewer are available (like .iloc[-window:].std()). NaN below 2 values.
+    """
+    n = x.shape[0]
+    c1 = np.cumsum(np.concatenate(([0.0], x)))
+    c2 = np.cumsum(np.concatenate(([0.0], x * x)))
+    end = np.arange(1, n + 1)
+    count = np.minimum(end, window)
+    s1 = c1[end] - c1[end - count]
+    s2 = c2[end] - c2[end - count]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = (s2 - s1 * s1 / count) / (count - 1)
+    return np.sqrt(np.maximum(var, 0.0))
+
+
+def _codes_finite(p: np.ndarray, offset: int = 0) -> np.ndarray:
+    """
+    Codes for a gap-free series; `offset` is how many valid bars came
+    before p[0] (only used for the 60-bar minimum).
+    """
+    n = p.shape[0]
+    codes = np.full(n, UNKNOWN, dtype=np.int8)
+    if n == 0:
+        return codes
+
+    spread = _trailing_mean(p, 20) - _trailing_mean(p, 50)
+    spread_prev = np.full(n, np.nan)
+    spread_prev[4:] = spread[:-4]
+
+    # returns[i] is the return into bar i + 1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = p[1:] / p[:-1] - 1
+    recent_vol = np.full(n, np.nan)
+    long_vol = np.full(n, np.nan)
+    recent_vol[1:] = _trailing_std(returns, 20)
+    long_vol[1:] = _trailing_std(returns, 60)
+
+    with np.errstate(invalid="ignore"):
+        trending = (np.abs(spread) > np.abs(spread_prev)) & (recent_vol <= long_vol)
+        high_risk = recent_vol > long_vol * 1.5
+
+    codes[:] = np.select([trending, high_risk], [TRENDING, HIGH_RISK], default=CHOPPY)
+    codes[: max(0, MIN_BARS - 1 - offset)] = UNKNOWN
+    return codes
+
+
+def regime_codes(prices) -> np.ndarray:
+    """
+    detect_market_regime for every bar of a history in one pass:
+    codes[t] == the label for prices[:t + 1], as an int8 index into
+    REGIME_LABELS. Non-finite bars are skipped (like dropna) and coded
+    Unknown.
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    finite = np.isfinite(p)
+
+    if finite.all():
+        return _codes_finite(p)
+
+    codes = np.full(p.shape[0], UNKNOWN, dtype=np.int8)
+    codes[finite] = _codes_finite(p[finite])
+    return codes
+
+
+def _as_categorical(codes: np.ndarray) -> pd.Categorical:
+    return pd.Categorical.from_codes(codes, categories=list(REGIME_LABELS))
+
+
+# -----------------------------
+# MEMO: (key, version) -> codes, extended on append
+# -----------------------------
+_memo = OrderedDict()   # key -> {"version", "raw_tail", "context", "n_valid", "codes"}
+_memo_lock = threading.Lock()
+
+
+def _memo_entry(version, p: np.ndarray, codes: np.ndarray, valid: np.ndarray, n_valid: int) -> dict:
+    """
+    valid: the trailing finite prices of p (at least CONTEXT_BARS of them
+    when available); n_valid: how many finite prices p has in total.
+    """
+    return {
+        "version": version,
+        "raw_tail": p[-CONTEXT_BARS:].copy(),
+        "context": valid[-CONTEXT_BARS:].copy(),
+        "n_valid": n_valid,
+        "codes": codes
+    }
+
+
+def _extend(entry: dict, version, p: np.ndarray) -> dict | None:
+    """
+    Memo entry for p if it is entry's series plus appended bars, else
+    None. Only the new bars (plus CONTEXT_BARS of history) are computed.
+    """
+    n_old = entry["codes"].shape[0]
+    if p.shape[0] < n_old:
+        return None
+
+    tail = entry["raw_tail"]
+    if not np.array_equal(p[n_old - tail.shape[0]:n_old], tail, equal_nan=True):
+        return None
+    if entry["n_valid"] < MIN_BARS:
+        return None
+
+    new = p[n_old:]
+    finite = np.isfinite(new)
+    context = entry["context"]
+    valid = np.concatenate((context, new[finite]))
+
+    new_codes = np.full(new.shape[0], UNKNOWN, dtype=np.int8)
+    new_codes[finite] = _codes_finite(
+        valid,
+        offset=entry["n_valid"] - context.shape[0]
+    )[context.shape[0]:]
+
+    codes = np.concatenate((entry["codes"], new_codes))
+    return _memo_entry(version, p, codes, valid, entry["n_valid"] + int(finite.sum()))
+
+
+def detect_regime_series(price_input, key=None, version=None) -> pd.Series:
+    """
+    Regime label for every bar, as a categorical Series
+    (categories REGIME_LABELS) aligned with the input's index.
+
+    key / version: memoize per key (e.g. symbol) and data version.
+    Same version -> cached result; a new version whose history extends
+    the cached one -> only the appended bars are computed; anything
+    else -> full recompute.
+    """
+    series = close_series(price_input)
+    if series is None:
+        return pd.Series(pd.Categorical([], categories=list(REGIME_LABELS)), dtype="category")
+
+    p = series.to_numpy(dtype=np.float64)
+
+    if key is None:
+        codes = regime_codes(p)
+    else:
+        with _memo_lock:
+            entry = _memo.get(key)
+
+        if (
+            entry is not None and version is not None
+            and entry["version"] == version and entry["codes"].shape[0] == p.shape[0]
+        ):
+            codes = entry["codes"]
+        else:
+            fresh = _extend(entry, version, p) if entry is not None else None
+            if fresh is None:
+                codes = regime_codes(p)
+                valid = p[np.isfinite(p)]
+                fresh = _memo_entry(version, p, codes, valid, int(valid.shape[0]))
+            codes = fresh["codes"]
+
+            with _memo_lock:
+                _memo[key] = fresh
+                _memo.move_to_end(key)
+                while len(_memo) > MEMO_SIZE:
+                    _memo.popitem(last=False)
+
+    return pd.Series(_as_categorical(codes), index=series.index, name="regime")
+
+
+def clear_regime_memo():
+    with _memo_lock:
+        _memo.clear()
@@ -0,0 +1,83 @@
+# core/ai/streaming_regime.py
+
+from collections import deque
+
+from core.ta.streaming import RollingMean, RollingStd
+
+MIN_BARS = 60
+SPREAD_LAG = 4      # detect_market_regime compares spread[-1] vs spread[-5]
+
+
+class StreamingRegimeDetector:
+    """
+    Incremental counterpart of detect_market_regime: one price per
+    update(), constant time, same labels as the batch function.
+    """
+
+    def __init__(self):
+        self._prev = None
+        self._count = 0
+        self._ma_fast = RollingMean(20)
+        self._ma_slow = RollingMean(50)
+        self._spreads = deque(maxlen=SPREAD_LAG + 1)
+        self._recent_vol = RollingStd(20)
+        self._long_vol = RollingStd(60)
+
+    def update(self, price: float) -> str:
+        price = float(price)
+        self._count += 1
+
+        if self._prev is not None and self._prev != 0:
+            r = price / self._prev - 1
+            self._recent_vol.update(r)
+            self._long_vol.update(r)
+        self._prev = price
+
+        fast = self._ma_fast.update(price)
+        slow = self._ma_slow.update(price)
+        self._spreads.append(
+            fast - slow if fast is not None and slow is not None else None
+        )
+
+        return self.value
+
+    @property
+    def value(self) -> str:
+        if self._count < MIN_BARS:
+            return "Unknown"
+
+        spread_latest = self._spreads[-1]
+        spread_prev = self._spreads[0]
+        recent_vol = self._recent_vol.value
+        long_vol = self._long_vol.value
+
+        if abs(spread_latest) > abs(spread_prev) and recent_vol <= long_vol:
+            return "Trending"
+
+        if recent_vol > long_vol * 1.5:
+            return "High-Risk"
+
+        return "Choppy"
+
+    def snapshot(self) -> dict:
+        return {
+            "prev": self._prev,
+            "count": self._count,
+            "ma_fast": self._ma_fast.snapshot(),
+            "ma_slow": self._ma_slow.snapshot(),
+            "spreads": list(self._spreads),
+            "recent_vol": self._recent_vol.snapshot(),
+            "long_vol": self._long_vol.snapshot()
+        }
+
+    @classmethod
+    def restore(cls, state: dict):
+        obj = cls()
+        obj._prev = state["prev"]
+        obj._count = state["count"]
+        obj._ma_fast = RollingMean.restore(state["ma_fast"])
+        obj._ma_slow = RollingMean.restore(state["ma_slow"])
+        obj._spreads.extend(state["spreads"])
+        obj._recent_vol = RollingStd.restore(state["recent_vol"])
+        obj._long_vol = RollingStd.restore(state["long_vol"])
+        return obj
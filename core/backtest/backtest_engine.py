@@ -0,0 +1,262 @@
+# core/backtest/backtest_engine.py
+
+import numpy as np
+import pandas as pd
+
+from core.ai.regime_detector import CHOPPY, HIGH_RISK, TRENDING, regime_codes
+from core.backtest.signals import compute_signal_series
+from core.scenario.scenario_engine import FEE_RATE_7D
+from core.strategy.multi_range_engine import (
+    ALLOCATION,
+    DIRECTIONAL_SKEW,
+    MIN_WIDTH,
+    MODE_WIDTH_FACTORS,
+    MODES,
+    VOL_MULTIPLIER,
+    compute_range_bounds
+)
+from core.strategy.range_engine import generate_range_bounds
+
+WARMUP_BARS = 200   # MA200 needs this much history before the first range
+
+# Concentrated liquidity: a position's share of pool fees scales with
+# 1 / range width. FEE_RATE_7D is the yield of each mode at its default
+# width on the floor (2 x MIN_WIDTH x mode factor, low to high); a range
+# twice as wide earns half as much per bar in range.
+FEE_REFERENCE_WIDTH = {
+    mode: 2 * MIN_WIDTH * MODE_WIDTH_FACTORS[mode] / 100
+    for mode in MODES
+}
+
+# generate_range has no allocation / fee tier of its own: run it on the
+# full exposure at the Balanced fee rate and reference width.
+SINGLE_MODE = "Single"
+SINGLE_FEE_RATE_7D = FEE_RATE_7D["Balanced"]
+SINGLE_FEE_REFERENCE_WIDTH = FEE_REFERENCE_WIDTH["Balanced"]
+
+# time_in_range is also reported per regime of the bar being held
+REGIME_FIELDS = (
+    (TRENDING, "time_in_range_trending"),
+    (HIGH_RISK, "time_in_range_high_risk"),
+    (CHOPPY, "time_in_range_choppy")
+)
+
+
+def default_range_config() -> dict:
+    """
+    The multi_range_engine constants as one overridable dict
+    (see core/optimize for sweeps over it).
+    """
+    return {
+        "min_width": MIN_WIDTH,
+        "vol_multiplier": VOL_MULTIPLIER,
+        "width_factors": dict(MODE_WIDTH_FACTORS),
+        "skew": DIRECTIONAL_SKEW,
+        "allocation": dict(ALLOCATION)
+    }
+
+
+# -----------------------------
+# DIVERGENCE LOSS
+# -----------------------------
+def divergence_loss(p0, p1, low, high):
+    """
+    Loss of a concentrated-liquidity position opened at p0 on [low, high]
+    and closed at p1, versus holding the tokens it started with, as a
+    fraction of its opening value. The narrower the range, the larger
+    the loss for the same move (and it stops growing once p1 leaves the
+    range, where the position is all one token).
+    """
+    p0 = np.asarray(p0, dtype=np.float64)
+    sa = np.sqrt(np.maximum(low, p0 * 1e-9))
+    sb = np.sqrt(high)
+
+    def amounts(price):
+        sp = np.sqrt(np.clip(price, sa * sa, sb * sb))
+        return 1 / sp - 1 / sb, sp - sa          # token / quote per unit liquidity
+
+    x0, y0 = amounts(p0)
+    x1, y1 = amounts(p1)
+    opened = x0 * p0 + y0
+    return (x0 * p1 + y0 - (x1 * p1 + y1)) / opened
+
+
+# -----------------------------
+# RANGE WALKS
+# -----------------------------
+def _walk_fixed(prices, start, every, bounds_at):
+    """
+    Rebalance every `every` bars. Ranges set at the close of bar r cover
+    bars r+1 .. r+every. Fully vectorized.
+    Returns (in_range bool per active bar, range width per active bar as
+    a fraction of the rebalance price, summed divergence loss fraction,
+    rebalance count).
+    """
+    n = prices.shape[0]
+    rebalance_bars = np.arange(start, n - 1, every)
+    if rebalance_bars.shape[0] == 0:
+        return np.zeros(0, dtype=bool), np.zeros(0), 0.0, 0
+
+    low, high = bounds_at(rebalance_bars)
+    width = (high - low) / prices[rebalance_bars]
+    closes = np.minimum(rebalance_bars + every, n - 1)
+    divergence = divergence_loss(prices[rebalance_bars], prices[closes], low, high).sum()
+
+    active = np.arange(start + 1, n)
+    segment = (active - start - 1) // every
+    p = prices[active]
+    in_range = (p >= low[segment]) & (p <= high[segment])
+
+    return in_range, width[segment], float(divergence), rebalance_bars.shape[0]
+
+
+def _walk_on_exit(prices, start, every, bounds_at):
+    """
+    Rebalance every `every` bars or as soon as price leaves the range.
+    One NumPy slice per rebalance, not per bar.
+    """
+    n = prices.shape[0]
+    in_range = np.zeros(max(0, n - start - 1), dtype=bool)
+    width = np.zeros(in_range.shape[0])
+    divergence = 0.0
+    r = start
+    count = 0
+
+    while r < n - 1:
+        low, high = bounds_at(np.array([r]))
+        end = min(r + every, n - 1)
+        window = prices[r + 1:end + 1]
+        inside = (window >= low[0]) & (window <= high[0])
+
+        exits = np.flatnonzero(~inside)
+        stop = exits[0] if exits.shape[0] else inside.shape[0] - 1
+
+        in_range[r - start:r - start + stop + 1] = inside[:stop + 1]
+        width[r - start:r - start + stop + 1] = (high[0] - low[0]) / prices[r]
+        divergence += float(divergence_loss(prices[r], prices[r + stop + 1], low[0], high[0]))
+        count += 1
+        r = r + stop + 1
+
+    return in_range, width, divergence, count
+
+
+# -----------------------------
+# PUBLIC API
+# -----------------------------
+def backtest_ranges(
+    prices,
+    rebalance_every: int = 24,
+    rebalance_on_exit: bool = False,
+    capital_usd: float = 10000,
+    leverage: float = 2,
+    bars_per_day: int = 24,
+    warmup: int = WARMUP_BARS,
+    rebalance_cost_pct: float = 0.0,
+    config: dict | None = None,
+    signals: dict | None = None
+) -> dict:
+    """
+    Replays one price history and rebuilds the Defensive / Balanced /
+    Aggressive ranges (generate_multi_ranges) and the single range
+    (generate_range) on a rebalance schedule, using the TA direction
+    and volatility as they were at each rebalance bar.
+
+    rebalance_every:   bars between scheduled rebalances
+    rebalance_on_exit: also rebalance as soon as price leaves the range
+    config:            overrides for default_range_config()
+    signals:           precomputed compute_signal_series output (reused
+                       across runs, e.g. by parameter sweeps)
+
+    Returns {mode: {time_in_range, time_in_range_<regime>, rebalances,
+                    fees_usd, costs_usd, divergence_usd, net_usd}}
+    where <regime> is trending / high_risk / choppy (None when no
+    held bar had that regime). Fees accrue per bar in range, scaled by
+    concentration (see FEE_REFERENCE_WIDTH); divergence_usd is the loss
+    versus holding realized at each rebalance (divergence_loss). Wider
+    ranges stay in range longer and lose less, but earn less per bar.
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    cfg = default_range_config()
+    cfg.update(config or {})
+
+    if signals is None:
+        signals = compute_signal_series(p, bars_per_day=bars_per_day)
+
+    start = max(warmup, int(np.argmax(np.isfinite(signals["volatility_pct"]))))
+    if start >= p.shape[0] - 1:
+        return {}
+
+    sign = signals["direction_sign"]
+    vol = np.nan_to_num(signals["volatility_pct"])
+    regime = signals["regime"] if "regime" in signals else regime_codes(p)
+    held_regime = regime[start + 1:]
+    exposure = capital_usd * leverage
+    walk = _walk_on_exit if rebalance_on_exit else _walk_fixed
+    bars_per_week = 7 * bars_per_day
+
+    def summarize(in_range, width, divergence, rebalances, allocated, fee_rate_7d, reference_width):
+        concentration = reference_width / np.maximum(width, 1e-12)
+        fees = allocated * fee_rate_7d * (in_range * concentration).sum() / bars_per_week
+        costs = allocated * rebalance_cost_pct / 100 * rebalances
+        loss = allocated * divergence
+        out = {"time_in_range": round(float(in_range.mean()) if in_range.shape[0] else 0.0, 4)}
+        for code, field in REGIME_FIELDS:
+            held = held_regime == code
+            out[field] = round(float(in_range[held].mean()), 4) if held.any() else None
+        out.update({
+            "rebalances": int(rebalances),
+            "fees_usd": round(float(fees), 2),
+            "costs_usd": round(float(costs), 2),
+            "divergence_usd": round(float(loss), 2),
+            "net_usd": round(float(fees - costs - loss), 2)
+        })
+        return out
+
+    results = {}
+
+    for mode in MODES:
+        def bounds_at(bars, mode=mode):
+            low, high, _ = compute_range_bounds(
+                p[bars], vol[bars], sign[bars],
+                cfg["width_factors"][mode],
+                min_width=cfg["min_width"],
+                vol_multiplier=cfg["vol_multiplier"],
+                skew=cfg["skew"]
+            )
+            return low, high
+
+        in_range, width, divergence, rebalances = walk(p, start, rebalance_every, bounds_at)
+        results[mode] = summarize(
+            in_range, width, divergence, rebalances,
+            exposure * cfg["allocation"][mode],
+            FEE_RATE_7D[mode],
+            FEE_REFERENCE_WIDTH[mode]
+        )
+
+    def single_bounds_at(bars):
+        return generate_range_bounds(p[bars], vol[bars], sign[bars])
+
+    in_range, width, divergence, rebalances = walk(p, start, rebalance_every, single_bounds_at)
+    results[SINGLE_MODE] = summarize(
+        in_range, width, divergence, rebalances, exposure, SINGLE_FEE_RATE_7D, SINGLE_FEE_REFERENCE_WIDTH
+    )
+
+    return results
+
+
+def backtest_matrix(prices, **kwargs) -> pd.DataFrame:
+    """
+    backtest_ranges for every column of a (time x symbol) DataFrame.
+    Leading NaNs (shorter histories) are dropped per column.
+
+    Returns one row per (symbol, mode).
+    """
+    rows = []
+    for symbol in prices.columns:
+        series = prices[symbol].to_numpy(dtype=np.float64)
+        series = series[np.argmax(np.isfinite(series)):] if np.isfinite(series).any() else series[:0]
+
+        for mode, stats in backtest_ranges(series, **kwargs).items():
+            rows.append({"symbol": symbol, "mode": mode, **stats})
+
+    return pd.DataFrame(rows)
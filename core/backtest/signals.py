@@ -0,0 +1,107 @@
+# core/backtest/signals.py
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from core.ai.regime_detector import regime_codes
+from core.ta.batch import score_indicators_batch
+from core.strategy.fusion_engine import BEARISH_TA_SCORE, BULLISH_TA_SCORE
+from core.ta.fused import MA_FAST, MA_SLOW, RSI_PERIOD, TREND_LOOKBACK
+
+# Direction as the live pipeline sets it (fuse_signals): thresholds on
+# run_ta's score, rescaled to its 0-100 scale. The regime only feeds
+# fusion's confidence, which the range engines don't take.
+BULLISH_SCORE = BULLISH_TA_SCORE * 100
+BEARISH_SCORE = BEARISH_TA_SCORE * 100
+
+VOL_WINDOW = 24   # bars of returns behind each volatility reading
+
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean; NaN for the first window-1 bars."""
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] >= window:
+        c = np.cumsum(np.concatenate(([0.0], x)))
+        out[window - 1:] = (c[window:] - c[:-window]) / window
+    return out
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sample std (ddof=1); NaN for the first window-1 bars."""
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] >= window:
+        out[window - 1:] = sliding_window_view(x, window).std(axis=1, ddof=1)
+    return out
+
+
+def compute_signal_series(
+    prices,
+    bars_per_day: int = 24,
+    vol_window: int = VOL_WINDOW
+) -> dict:
+    """
+    run_ta's score / trend for every bar of a history in one pass,
+    plus the direction and volatility_pct the range engines take.
+
+    Bar t only uses prices[:t + 1], so the series is free of lookahead.
+
+    Returns arrays of len(prices):
+        ta_score (int, 0-100), trend ("Bullish" / ...),
+        direction_sign (+1 / -1 / 0), volatility_pct (daily, %),
+        regime (int8 codes into regime_detector.REGIME_LABELS)
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    n = p.shape[0]
+
+    # -----------------------------
+    # Indicators per bar
+    # -----------------------------
+    delta = np.diff(p, prepend=np.nan)
+    gain = np.clip(np.nan_to_num(delta), 0, None)
+    loss = -np.clip(np.nan_to_num(delta), None, 0)
+    avg_gain = rolling_mean(gain, RSI_PERIOD)
+    avg_loss = rolling_mean(loss, RSI_PERIOD)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rsi = np.where(
+            avg_loss == 0,
+            np.where(avg_gain > 0, 100.0, np.nan),
+            100 - 100 / (1 + avg_gain / avg_loss)
+        )
+    rsi[:RSI_PERIOD] = np.nan   # first bar has no delta
+
+    momentum = np.full(n, np.nan)
+    if n >= TREND_LOOKBACK:
+        momentum[TREND_LOOKBACK - 1:] = p[TREND_LOOKBACK - 1:] - p[:n - TREND_LOOKBACK + 1]
+
+    scored = score_indicators_batch({
+        "last": p,
+        "rsi": rsi,
+        "ma20": rolling_mean(p, MA_FAST),
+        "ma200": rolling_mean(p, MA_SLOW),
+        "momentum": momentum
+    }, with_drivers=False)
+
+    score = scored["ta_score"]
+
+    # -----------------------------
+    # Direction + volatility for the range engines
+    # -----------------------------
+    with np.errstate(invalid="ignore"):
+        sign = np.where(
+            score >= BULLISH_SCORE, 1,
+            np.where(score <= BEARISH_SCORE, -1, 0)
+        ).astype(np.int8)
+
+        returns = np.diff(p, prepend=np.nan) / np.concatenate(([np.nan], p[:-1]))
+    vol_pct = np.full(n, np.nan)
+    if n > vol_window:
+        vol_pct[vol_window:] = rolling_std(returns[1:], vol_window)[vol_window - 1:]
+    vol_pct = vol_pct * np.sqrt(bars_per_day) * 100
+
+    return {
+        "ta_score": score,
+        "trend": scored["trend"],
+        "direction_sign": sign,
+        "volatility_pct": vol_pct,
+        "regime": regime_codes(p)
+    }
@@ -1,11 +1,273 @@
-def fetch_economic_events():
+# core/fa/calendar/economic_calendar.py
+"""
+File-backed economic calendar (FOMC, CPI, NFP, token unlocks, ...).
+
+Events are loaded from every *.csv / *.json file in CALENDAR_DIR:
+
+    CSV:  name,kind,start,end,impact,asset
+          FOMC rate decision,FOMC,2026-10-28T18:00:00Z,,high,
+          SOL unlock,UNLOCK,2026-11-01,2026-11-03,medium,SOL
+
+    JSON: [{"name": ..., "kind": ..., "start": ..., ...}, ...]
+          (or {"events": [...]})
+
+start / end are ISO dates or datetimes (UTC when no offset is given);
+end defaults to start. impact is high / medium / low.
+
+The files are parsed once into sorted interval indexes (one per impact
+level), so "which events overlap the next N days" is a bisect plus the
+matches. The index is rebuilt only when a file's mtime or size changes,
+and the directory is checked at most every CHECK_SECONDS.
+"""
+
+import csv
+import json
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+
+from data.store.paths import STORE_DIR
+from telemetry.metrics import record_error
+
+# ---------------------------------------
+# CONFIG
+# ---------------------------------------
+CALENDAR_DIR = os.environ.get("DEFITUNA_CALENDAR_DIR", os.path.join(STORE_DIR, "calendar"))
+CHECK_SECONDS = 30.0
+SIGNAL_HORIZON_DAYS = 2      # look-ahead for the FA signal
+MAX_DRIVERS = 3
+
+IMPACTS = ("high", "medium", "low")
+IMPACT_SCORE = {"high": -0.15, "medium": -0.05, "low": 0.0}   # event risk is risk-off
+MIN_SCORE = -0.3
+
+DAY = 86_400.0
+
+
+def _to_epoch(value) -> float:
+    """
+    datetime / pandas Timestamp / ISO string / epoch seconds -> epoch seconds.
+    Naive values are taken as UTC.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+# ---------------------------------------
+# PARSING
+# ---------------------------------------
+def _read_rows(path: str) -> list:
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            return list(csv.DictReader(f))
+    with open(path) as f:
+        data = json.load(f)
+    rows = data.get("events", []) if isinstance(data, dict) else data
+    if not isinstance(rows, list):
+        raise ValueError(f"expected a list of events, got {type(rows).__name__}")
+    return rows
+
+
+def _parse_event(row: dict, source: str) -> dict:
+    start = _to_epoch(row["start"])
+    end = _to_epoch(row["end"]) if row.get("end") else start
+    if end < start:
+        raise ValueError("end before start")
+
+    impact = (row.get("impact") or "medium").strip().lower()
+    if impact not in IMPACTS:
+        raise ValueError(f"unknown impact {impact!r}")
+
+    return {
+        "name": row["name"].strip(),
+        "kind": (row.get("kind") or "").strip().upper(),
+        "start": _iso(start),
+        "end": _iso(end),
+        "impact": impact,
+        "asset": (row.get("asset") or "").strip().upper() or None,
+        "source": source,
+        "_start": start,
+        "_end": end
+    }
+
+
+def load_events(directory: str = CALENDAR_DIR) -> list:
+    """
+    Every valid event in `directory`, sorted by start. Bad rows and
+    unreadable files are skipped (and counted as calendar errors).
+    """
+    events = []
+    for path in sorted(_calendar_files(directory)):
+        name = os.path.basename(path)
+        try:
+            rows = _read_rows(path)
+        except (OSError, ValueError, csv.Error) as e:
+            record_error("calendar", type(e).__name__)
+            continue
+        for row in rows:
+            try:
+                events.append(_parse_event(row, name))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                record_error("calendar", "bad_row")
+
+    events.sort(key=lambda e: (e["_start"], e["_end"], e["name"]))
+    return events
+
+
+def _calendar_files(directory: str) -> list:
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return []
+    with entries:
+        return [
+            e.path for e in entries
+            if e.is_file() and e.name.endswith((".csv", ".json"))
+        ]
+
+
+def _signature(directory: str) -> tuple:
+    out = []
+    for path in sorted(_calendar_files(directory)):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        out.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+# ---------------------------------------
+# INTERVAL INDEX
+# ---------------------------------------
+class IntervalIndex:
+    """
+    Events sorted by start, with the longest duration kept aside: an
+    event overlapping [lo, hi] must start in [lo - longest, hi], which
+    two bisects find; only that slice is checked against its end.
+    """
+
+    def __init__(self, events: list):
+        self.events = events
+        self.starts = [e["_start"] for e in events]
+        self.longest = max((e["_end"] - e["_start"] for e in events), default=0.0)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def overlapping(self, lo: float, hi: float) -> list:
+        i = bisect_left(self.starts, lo - self.longest)
+        j = bisect_right(self.starts, hi)
+        return [e for e in self.events[i:j] if e["_end"] >= lo]
+
+
+class EconomicCalendar:
+
+    def __init__(self, directory: str = CALENDAR_DIR, check_interval: float = CHECK_SECONDS):
+        self.directory = directory
+        self.check_interval = check_interval
+        self.loads = 0       # times the files were actually parsed
+
+        self._signature = None
+        self._checked_at = float("-inf")
+        self._indexes = {None: IntervalIndex([])}
+        self._lock = threading.Lock()
+
+    def _current(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at >= self.check_interval:
+                self._checked_at = now
+                signature = _signature(self.directory)
+                if signature != self._signature:
+                    events = load_events(self.directory)
+                    self._indexes = {None: IntervalIndex(events)}
+                    for impact in IMPACTS:
+                        self._indexes[impact] = IntervalIndex([e for e in events if e["impact"] == impact])
+                    self._signature = signature
+                    self.loads += 1
+            return self._indexes
+
+    def reload(self):
+        with self._lock:
+            self._checked_at = float("-inf")
+            self._signature = None
+
+    def between(self, start, end, impact: str | None = None, asset: str | None = None) -> list:
+        """
+        Events overlapping [start, end], sorted by start.
+        impact: "high" / "medium" / "low", or None for all.
+        asset:  keep events for this asset plus asset-less (macro) ones.
+        """
+        found = self._current()[impact].overlapping(_to_epoch(start), _to_epoch(end))
+        if asset is not None:
+            asset = asset.upper()
+            found = [e for e in found if e["asset"] in (None, asset)]
+        return [{k: v for k, v in e.items() if not k.startswith("_")} for e in found]
+
+    def upcoming(self, horizon_days: float, impact: str | None = "high", now=None, asset: str | None = None) -> list:
+        """
+        Events overlapping the next `horizon_days` from `now`
+        (default: the current time).
+        """
+        start = time.time() if now is None else _to_epoch(now)
+        return self.between(start, start + horizon_days * DAY, impact=impact, asset=asset)
+
+
+# ---------------------------------------
+# SHARED CALENDAR
+# ---------------------------------------
+_calendar = None
+_calendar_lock = threading.Lock()
+
+
+def get_calendar() -> EconomicCalendar:
+    global _calendar
+    with _calendar_lock:
+        if _calendar is None:
+            _calendar = EconomicCalendar()
+        return _calendar
+
+
+def upcoming_events(horizon_days: float, impact: str | None = "high", now=None, asset: str | None = None) -> list:
+    return get_calendar().upcoming(horizon_days, impact=impact, now=now, asset=asset)
+
+
+def fetch_economic_events(horizon_days: float = SIGNAL_HORIZON_DAYS, now=None):
     """
-    Placeholder economic calendar signal.
-    Later this can be connected to real APIs.
+    Calendar FA signal: scheduled event risk over the next
+    `horizon_days`. Neutral (0.0) when nothing notable is coming up.
+
+    Returns:
+    {
+        "score": float,
+        "drivers": [string],
+        "events": [{"name", "kind", "start", "end", "impact", "asset", "source"}]
+    }
     """
+    events = upcoming_events(horizon_days, impact=None, now=now)
+    notable = [e for e in events if IMPACT_SCORE[e["impact"]]]
+
+    score = max(MIN_SCORE, sum(IMPACT_SCORE[e["impact"]] for e in notable))
+
+    drivers = [
+        f"Calendar: {e['name']} ({e['impact']} impact) {e['start'][:16].replace('T', ' ')} UTC"
+        for e in sorted(notable, key=lambda e: IMPACTS.index(e["impact"]))[:MAX_DRIVERS]
+    ]
 
-    # Neutral by default (no major events)
     return {
-        "score": 0.0,
-        "events": []
+        "score": round(score, 3),
+        "drivers": drivers,
+        "events": events
     }
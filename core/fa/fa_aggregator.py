@@ -1,6 +1,7 @@
-from core.fa.news.crypto_news import fetch_crypto_news
-from core.fa.news.macro_news import fetch_macro_news
-from core.fa.news.geopolitical_news import fetch_geopolitical_news
+from core.fa.news.feed_fetcher import fetch_feeds
+from core.fa.news.crypto_news import CRYPTO_RSS_FEEDS, fetch_crypto_news
+from core.fa.news.macro_news import MACRO_RSS_FEEDS, fetch_macro_news
+from core.fa.news.geopolitical_news import GEOPOLITICAL_RSS_FEEDS, fetch_geopolitical_news
 from core.fa.calendar.economic_calendar import fetch_economic_events
 
 
@@ -15,10 +16,21 @@ def aggregate_fa_signals():
     score = 0.0
     drivers = []
 
+    # -----------------------------
+    # FETCH ALL FEEDS (concurrent, each URL once)
+    # -----------------------------
+    feeds = fetch_feeds(
+        CRYPTO_RSS_FEEDS + MACRO_RSS_FEEDS + GEOPOLITICAL_RSS_FEEDS
+    )
+
+    # Near-duplicate clusters already counted this cycle: a story
+    # carried by several feeds (or modules) scores once
+    seen = set()
+
     # -----------------------------
     # CRYPTO NEWS
     # -----------------------------
-    crypto = fetch_crypto_news()
+    crypto = fetch_crypto_news(feeds, seen)
     if crypto:
         score += crypto.get("score", 0.0)
         drivers.extend(crypto.get("drivers", []))
@@ -26,7 +38,7 @@ def aggregate_fa_signals():
     # -----------------------------
     # MACRO NEWS
     # -----------------------------
-    macro = fetch_macro_news()
+    macro = fetch_macro_news(feeds, seen)
     if macro:
         score += macro.get("score", 0.0)
         drivers.extend(macro.get("drivers", []))
@@ -34,7 +46,7 @@ def aggregate_fa_signals():
     # -----------------------------
     # GEOPOLITICAL RISK
     # -----------------------------
-    geo = fetch_geopolitical_news()
+    geo = fetch_geopolitical_news(feeds, seen)
     if geo:
         score += geo.get("score", 0.0)
         drivers.extend(geo.get("drivers", []))
@@ -1,10 +1,13 @@
-import feedparser
-import time
+from core.fa.news.dedup import mark_duplicates
+from core.fa.news.feed_fetcher import fetch_feeds
+from core.fa.news.headline_scorer import score_items
 
 # ---------------------------------------
 # CONFIG
 # ---------------------------------------
-NEWS_REFRESH_SECONDS = 15 * 60  # 15 minutes
+NEWS_REFRESH_SECONDS = 15 * 60  # 15 minutes (served from the feed cache)
+ITEMS_PER_FEED = 10
+SCORE_WEIGHT = 0.5              # module score = mean headline score x weight
 
 CRYPTO_RSS_FEEDS = [
     "https://cointelegraph.com/rss",
@@ -12,84 +15,57 @@ CRYPTO_RSS_FEEDS = [
     "https://www.coindesk.com/arc/outboundfeeds/rss/"
 ]
 
-# ---------------------------------------
-# IN-MEMORY CACHE
-# ---------------------------------------
-_cache = {
-    "timestamp": 0,
-    "data": None
-}
-
 
 # ---------------------------------------
 # PUBLIC API
 # ---------------------------------------
-def fetch_crypto_news():
+def fetch_crypto_news(feeds: dict | None = None, seen: set | None = None):
     """
+    feeds: optional {url: entries} already fetched this cycle
+    (see fa_aggregator); fetched here otherwise.
+    seen: clusters already counted this cycle by other modules;
+    matching headlines are kept in items but flagged "duplicate".
+
     Returns:
     {
         "score": float,
         "drivers": [string],
         "items": [
-            {"title": str, "link": str}
+            {"title": str, "link": str, "score": float, "hits": [str],
+             "cluster": int, "duplicate": bool}
         ]
     }
     """
 
-    now = time.time()
-
-    # -----------------------------
-    # CACHE CHECK
-    # -----------------------------
-    if (
-        _cache["data"] is not None
-        and (now - _cache["timestamp"]) < NEWS_REFRESH_SECONDS
-    ):
-        return _cache["data"]
-
     items = []
-    drivers = []
-    score = 0.0
 
     # -----------------------------
     # FETCH RSS FEEDS
     # -----------------------------
-    for feed_url in CRYPTO_RSS_FEEDS:
-        try:
-            feed = feedparser.parse(feed_url)
-
-            for entry in feed.entries[:3]:
-                title = entry.get("title", "").strip()
-                link = entry.get("link", "").strip()
+    if feeds is None:
+        feeds = fetch_feeds(CRYPTO_RSS_FEEDS, max_age=NEWS_REFRESH_SECONDS)
 
-                if not title or not link:
-                    continue
+    for feed_url in CRYPTO_RSS_FEEDS:
+        for entry in feeds.get(feed_url, [])[:ITEMS_PER_FEED]:
+            title = entry.get("title", "").strip()
+            link = entry.get("link", "").strip()
 
-                items.append({
-                    "title": title,
-                    "link": link
-                })
+            if not title or not link:
+                continue
 
-        except Exception:
-            continue
+            items.append({
+                "title": title,
+                "link": link
+            })
 
     # -----------------------------
-    # SCORING LOGIC (LIGHTWEIGHT)
+    # HEADLINE SCORING (cached per headline, each story once)
     # -----------------------------
-    if items:
-        score = 0.3
-        drivers.append("Recent crypto market news activity detected")
+    mark_duplicates(items, seen)
+    score, drivers = score_items(items, SCORE_WEIGHT, "Crypto news")
 
-    result = {
+    return {
         "score": score,
         "drivers": drivers,
         "items": items
     }
-
-    # -----------------------------
-    # CACHE SAVE
-    # -----------------------------
-    _cache["data"] = result
-    _cache["timestamp"] = now
-
-    return result
@@ -0,0 +1,251 @@
+# core/fa/news/dedup.py
+"""
+Near-duplicate headline clustering across feeds.
+
+A headline is reduced to word shingles (words + word pairs) of its
+normalized text, after stripping a trailing source tag ("... - Reuters",
+"... | CoinDesk"). Two headlines are the same story when the Jaccard
+similarity of their shingles reaches `threshold` AND the lexicon scores
+them with the same polarity, so "Fed raises rates..." never absorbs
+"Fed cuts rates...".
+
+Lookups are sub-linear (MinHash + LSH banding): the MinHash signature
+is cut into bands of ROWS values and each band is a hash-bucket key,
+so only headlines sharing a whole band with the new one are compared,
+and those candidates are checked on their exact shingle sets. Exact
+repeats (the same headline on every refresh) are resolved by key
+without hashing.
+
+The index is bounded by entry count and age (least recently seen
+evicted first), so it can run indefinitely.
+
+    python -m core.fa.news.dedup     # checks CHECK_PAIRS
+"""
+
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from core.fa.news.headline_scorer import get_scorer, normalize
+
+BANDS = 16
+ROWS = 4                     # P(candidate) = 1 - (1 - J^ROWS)^BANDS: 0.99 at J=0.7
+THRESHOLD = 0.7              # Jaccard of word shingles to join a cluster
+MAX_ENTRIES = 20_000
+MAX_AGE_SECONDS = 3 * 86_400
+
+# " - Reuters", " | CoinDesk", " — BBC News": a short trailing source tag
+_SOURCE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)   # fixed, so signatures are stable across runs
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(BANDS * ROWS)
+]
+
+# (headline, headline, same story?) -- run `python -m core.fa.news.dedup`
+CHECK_PAIRS = [
+    ("Fed raises rates by 25 basis points", "Fed cuts rates by 25 basis points", False),
+    ("Solana price surges after network upgrade", "Solana price plunges after network outage", False),
+    ("SEC sues Binance over unregistered securities offerings",
+     "SEC sues Coinbase over unregistered securities offerings", False),
+    ("Bitcoin hits record high - Reuters", "Bitcoin hits record high", True),
+    ("Ethereum upgrade goes live on mainnet | CoinDesk", "Ethereum upgrade goes live on mainnet", True),
+    ("SEC approves spot Solana ETF, shares jump", "SEC approves spot Solana ETF as shares jump", True),
+    ("Fed cuts interest rates by half a point amid slowing economy",
+     "Fed cuts interest rates by half a point amid a slowing economy", True),
+]
+
+
+def strip_source(headline: str) -> str:
+    return _SOURCE_SUFFIX.sub("", (headline or "").strip())
+
+
+def _text(headline: str) -> str:
+    return normalize(strip_source(headline))
+
+
+def _key(text: str) -> bytes:
+    return hashlib.sha1(text.encode()).digest()
+
+
+def shingles(headline: str) -> frozenset:
+    """
+    Word and word-pair hashes of the normalized, source-stripped headline.
+    """
+    words = _text(headline).split()
+    tokens = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return frozenset(
+        int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "big")
+        for t in tokens
+    )
+
+
+def minhash(shingle_set: frozenset) -> tuple:
+    if not shingle_set:
+        return (0,) * len(_PERMUTATIONS)
+    return tuple(min((a * h + b) % _PRIME for h in shingle_set) for a, b in _PERMUTATIONS)
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def polarity(headline: str) -> int:
+    score = get_scorer().score(strip_source(headline))["score"]
+    return (score > 0) - (score < 0)
+
+
+class NearDuplicateIndex:
+    """
+    assign(headline) -> cluster id, stable while any headline of the
+    cluster stays in the index.
+    """
+
+    def __init__(
+        self,
+        threshold: float = THRESHOLD,
+        max_entries: int = MAX_ENTRIES,
+        max_age: float = MAX_AGE_SECONDS
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self._bands = [{} for _ in range(BANDS)]   # band -> {entry key}
+        # entry key -> (signature, shingles, polarity, cluster, last_seen),
+        # least recently seen first
+        self._entries = OrderedDict()
+        self._next_cluster = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _band_keys(signature: tuple):
+        for i in range(BANDS):
+            yield i, signature[i * ROWS:(i + 1) * ROWS]
+
+    def _nearest(self, signature: tuple, shingle_set: frozenset, sign: int):
+        candidates = set()
+        for i, band in self._band_keys(signature):
+            candidates.update(self._bands[i].get(band, ()))
+
+        best, best_similarity = None, self.threshold
+        for key in candidates:
+            _, other, other_sign, _, _ = self._entries[key]
+            if other_sign != sign:
+                continue
+            s = jaccard(shingle_set, other)
+            if s >= best_similarity:
+                best, best_similarity = key, s
+        return best
+
+    def _remove(self, key: bytes):
+        signature = self._entries.pop(key)[0]
+        for i, band in self._band_keys(signature):
+            bucket = self._bands[i][band]
+            bucket.discard(key)
+            if not bucket:
+                del self._bands[i][band]
+
+    def _evict(self, now: float):
+        while self._entries:
+            oldest, entry = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_entries and now - entry[4] < self.max_age:
+                break
+            self._remove(oldest)
+
+    def assign(self, headline: str, now: float | None = None) -> int:
+        now = time.time() if now is None else now
+        key = _key(_text(headline))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # Seen before: refresh, so a story still in the feeds stays indexed
+                self._entries[key] = entry[:4] + (now,)
+                self._entries.move_to_end(key)
+                self._evict(now)
+                return entry[3]
+
+        shingle_set = shingles(headline)
+        signature = minhash(shingle_set)
+        sign = polarity(headline)
+
+        with self._lock:
+            match = self._nearest(signature, shingle_set, sign)
+            if match is not None:
+                cluster = self._entries[match][3]
+            else:
+                cluster = self._next_cluster
+                self._next_cluster += 1
+
+            if key not in self._entries:
+                for i, band in self._band_keys(signature):
+                    self._bands[i].setdefault(band, set()).add(key)
+            self._entries[key] = (signature, shingle_set, sign, cluster, now)
+            self._entries.move_to_end(key)
+
+            self._evict(now)
+            return cluster
+
+
+# -----------------------------
+# SHARED INDEX
+# -----------------------------
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> NearDuplicateIndex:
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = NearDuplicateIndex()
+        return _index
+
+
+def mark_duplicates(items: list, seen: set | None = None) -> list:
+    """
+    Tags [{"title", ...}] in place with "cluster" and "duplicate".
+    The first item of each cluster is kept; later ones, and items whose
+    cluster is already in `seen` (shared across modules in one
+    aggregation cycle), are duplicates. Adds the new clusters to `seen`.
+    """
+    index = get_index()
+    seen = set() if seen is None else seen
+    for item in items:
+        cluster = index.assign(item["title"])
+        item["cluster"] = cluster
+        item["duplicate"] = cluster in seen
+        seen.add(cluster)
+    return items
+
+
+def check(pairs=CHECK_PAIRS) -> list:
+    """
+    Pairs whose clustering (in a fresh index, either order) disagrees
+    with the expectation.
+    """
+    failures = []
+    for a, b, same in pairs:
+        for first, second in ((a, b), (b, a)):
+            index = NearDuplicateIndex()
+            if (index.assign(first) == index.assign(second)) != same:
+                failures.append((first, second, same))
+    return failures
+
+
+if __name__ == "__main__":
+    failed = check()
+    for first, second, same in failed:
+        print(f"FAIL ({'same' if same else 'different'} story expected): {first!r} / {second!r}")
+    print(f"{len(CHECK_PAIRS)} pairs checked, {len(failed)} failure(s)")
+    raise SystemExit(1 if failed else 0)
@@ -0,0 +1,166 @@
+# core/fa/news/feed_fetcher.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from data.store.paths import STORE_DIR
+from telemetry.metrics import record_cache, record_error, span
+
+# ---------------------------------------
+# CONFIG
+# ---------------------------------------
+FEED_TIMEOUT_SECONDS = 8
+MAX_WORKERS = 8
+
+# Within this window a feed is served from disk without any request
+FEED_MIN_REFRESH_SECONDS = 60
+
+FEED_CACHE_DIR = os.path.join(STORE_DIR, "feeds")
+
+USER_AGENT = "defituna-lp-dashboard/1.0 (+feedparser)"
+
+
+def _entry_to_dict(entry) -> dict:
+    return {
+        "title": entry.get("title", "").strip(),
+        "link": entry.get("link", "").strip(),
+        "published": entry.get("published", ""),
+        "summary": entry.get("summary", "")
+    }
+
+
+# ---------------------------------------
+# PERSISTENT CACHE (one JSON file per feed)
+# ---------------------------------------
+def _cache_path(url: str) -> str:
+    digest = hashlib.sha1(url.encode()).hexdigest()
+    return os.path.join(FEED_CACHE_DIR, f"{digest}.json")
+
+
+def _load_record(url: str) -> dict | None:
+    try:
+        with open(_cache_path(url)) as f:
+            record = json.load(f)
+        return record if record.get("url") == url else None
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _save_record(record: dict):
+    os.makedirs(FEED_CACHE_DIR, exist_ok=True)
+    final = _cache_path(record["url"])
+    tmp = f"{final}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(record, f)
+    os.replace(tmp, final)
+
+
+def _fetch_one(url: str, timeout: float, max_age: float) -> list:
+    record = _load_record(url)
+    now = time.time()
+
+    if record is not None and now - record["checked_at"] < max_age:
+        record_cache("feed", True)
+        return record["entries"]
+
+    # Loaded on first network use; fresh-from-disk reads never import them
+    import feedparser
+    import requests
+
+    # -----------------------------
+    # CONDITIONAL GET
+    # -----------------------------
+    headers = {"User-Agent": USER_AGENT}
+    if record is not None:
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+
+    try:
+        with span("feed.fetch"):
+            r = requests.get(url, timeout=timeout, headers=headers)
+
+        if r.status_code == 304 and record is not None:
+            record_cache("feed", True)
+            record["checked_at"] = now
+            _save_record(record)
+            return record["entries"]
+
+        r.raise_for_status()
+
+    except requests.RequestException as e:
+        record_error("feed", type(e).__name__)
+        # Stale entries beat no entries
+        if record is not None:
+            return record["entries"]
+        raise
+
+    record_cache("feed", False)
+    with span("feed.parse"):
+        feed = feedparser.parse(r.content)
+        entries = [_entry_to_dict(e) for e in feed.entries]
+
+    _save_record({
+        "url": url,
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+        "checked_at": now,
+        "entries": entries
+    })
+
+    return entries
+
+
+# ---------------------------------------
+# PUBLIC API
+# ---------------------------------------
+def fetch_feeds(
+    urls,
+    timeout: float = FEED_TIMEOUT_SECONDS,
+    max_age: float = FEED_MIN_REFRESH_SECONDS
+) -> dict:
+    """
+    Fetches every unique feed URL concurrently, each parsed once.
+    Feeds are revalidated with ETag / Last-Modified; a 304 reuses
+    the entries cached on disk without re-parsing.
+
+    Returns:
+    {
+        url: [{"title", "link", "published", "summary"}, ...]
+    }
+
+    Feeds that fail or miss the deadline fall back to their cached
+    entries (or []), so one slow source never holds up the rest.
+    """
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return {}
+
+    pool = ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(unique)))
+    try:
+        futures = {
+            pool.submit(_fetch_one, url, timeout, max_age): url
+            for url in unique
+        }
+
+        # requests' timeout is per socket op; this bounds the whole cycle
+        wait(futures, timeout=timeout)
+
+        results = {}
+        for future, url in futures.items():
+            if future.done() and future.exception() is None:
+                results[url] = future.result()
+            else:
+                record_error("feed", "deadline" if not future.done() else type(future.exception()).__name__)
+                record = _load_record(url)
+                results[url] = record["entries"] if record else []
+
+        return results
+
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
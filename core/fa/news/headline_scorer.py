@@ -0,0 +1,195 @@
+# core/fa/news/headline_scorer.py
+"""
+Scores headlines against the weighted lexicon (core/fa/news/lexicon.py).
+
+All phrases are compiled into one Aho-Corasick automaton, so a headline
+is scanned once regardless of lexicon size. Results are cached by a
+hash of the normalized headline: a refresh only scores headlines it
+has not seen before.
+"""
+
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict, deque
+
+from core.fa.news.lexicon import LEXICON
+
+CACHE_SIZE = 20_000
+
+_NON_WORD = re.compile(r"[^a-z0-9$%'-]+")
+
+
+def normalize(text: str) -> str:
+    """
+    Lower-case, collapse everything but word characters to single
+    spaces, and pad with spaces so every word is space-delimited.
+    """
+    return " " + _NON_WORD.sub(" ", text.lower()).strip() + " "
+
+
+def _pattern(phrase: str) -> str:
+    # "hack*" -> " hack" (any ending); "war" -> " war " (whole word)
+    phrase = phrase.lower().strip()
+    if phrase.endswith("*"):
+        return " " + normalize(phrase[:-1]).strip()
+    return normalize(phrase)
+
+
+class HeadlineScorer:
+    """
+    score(headline) -> {"score", "hits"}
+
+    score: sum of matched phrase weights squashed into (-1, 1) by tanh
+    hits:  [(phrase, weight), ...] in headline order
+
+    Overlapping matches resolve leftmost-longest, so "etf inflows"
+    counts once rather than also as "inflows".
+    """
+
+    def __init__(self, lexicon: dict = LEXICON, cache_size: int = CACHE_SIZE):
+        self.lexicon = dict(lexicon)
+        self._build(self.lexicon)
+
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.scored = 0     # headlines actually scanned (cache misses)
+
+    # -----------------------------
+    # AUTOMATON
+    # -----------------------------
+    def _build(self, lexicon: dict):
+        goto = [{}]
+        fail = [0]
+        out = [[]]   # state -> [(pattern_length, phrase)]
+
+        for phrase in lexicon:
+            pattern = _pattern(phrase)
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    fail.append(0)
+                    out.append([])
+                state = nxt
+            out[state].append((len(pattern), phrase))
+
+        # Breadth-first failure links; outputs inherit their fail state's
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def _matches(self, text: str) -> list:
+        goto, fail, out = self._goto, self._fail, self._out
+        found = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, phrase in out[state]:
+                found.append((i + 1 - length, i + 1, phrase))
+        return found
+
+    # -----------------------------
+    # SCORING
+    # -----------------------------
+    def _score_text(self, text: str) -> dict:
+        # Leftmost-longest, non-overlapping. Patterns share their
+        # delimiting spaces, so allow a one-character overlap.
+        hits = []
+        last_end = 0
+        for start, end, phrase in sorted(self._matches(text), key=lambda m: (m[0], -(m[1] - m[0]))):
+            if start >= last_end - 1:
+                hits.append((phrase, self.lexicon[phrase]))
+                last_end = end
+
+        raw = sum(weight for _, weight in hits)
+        return {"score": round(math.tanh(raw), 4), "hits": hits}
+
+    def score(self, headline: str) -> dict:
+        text = normalize(headline or "")
+        key = hashlib.sha1(text.encode()).digest()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        result = self._score_text(text)
+
+        with self._lock:
+            self.scored += 1
+            self._cache[key] = result
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def score_many(self, headlines) -> list:
+        return [self.score(h) for h in headlines]
+
+
+# -----------------------------
+# SHARED SCORER
+# -----------------------------
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def get_scorer() -> HeadlineScorer:
+    global _scorer
+    with _scorer_lock:
+        if _scorer is None:
+            _scorer = HeadlineScorer()
+        return _scorer
+
+
+def score_items(items: list, weight: float, label: str, max_drivers: int = 2) -> tuple:
+    """
+    Scores [{"title", ...}] in place (adds "score" and "hits") and
+    returns (module_score, drivers).
+
+    module_score: mean headline score x weight, so a feed of mostly
+    neutral headlines stays near 0.
+    drivers: the strongest-scoring headlines, described.
+
+    Items flagged "duplicate" (see core/fa/news/dedup.py) are scored
+    but left out of both, so a story counts once however many feeds
+    carry it.
+    """
+    scorer = get_scorer()
+    for item in items:
+        result = scorer.score(item["title"])
+        item["score"] = result["score"]
+        item["hits"] = [phrase.rstrip("*") for phrase, _ in result["hits"]]
+
+    unique = [item for item in items if not item.get("duplicate")]
+    if not unique:
+        return 0.0, []
+
+    mean = sum(item["score"] for item in unique) / len(unique)
+
+    drivers = []
+    strongest = sorted((i for i in unique if i["score"]), key=lambda i: -abs(i["score"]))
+    for item in strongest[:max_drivers]:
+        tone = "supportive" if item["score"] > 0 else "risk-off"
+        drivers.append(f"{label} {tone}: {item['title']} ({', '.join(item['hits'])})")
+
+    return round(mean * weight, 3), drivers
@@ -0,0 +1,198 @@
+# core/fa/news/lexicon.py
+"""
+Weighted headline lexicon: phrase -> impact in [-1, 1] on crypto risk
+appetite (positive = supportive, negative = risk-off).
+
+Phrases are matched on whole words of the lower-cased headline; a
+trailing * matches any word ending ("exploit*" -> exploit, exploited,
+exploits). Stems that start unrelated words (hack -> hackathon,
+bear -> bearing, surg -> surgeon) list their forms instead.
+"""
+
+LEXICON = {
+    # -----------------------------
+    # SECURITY / EXCHANGE RISK
+    # -----------------------------
+    "hack": -0.6,
+    "hacks": -0.6,
+    "hacked": -0.6,
+    "hacker": -0.6,
+    "hackers": -0.6,
+    "hacking": -0.6,
+    "exploit*": -0.6,
+    "drained": -0.6,
+    "stolen": -0.5,
+    "breach*": -0.5,
+    "rug pull*": -0.6,
+    "ponzi": -0.5,
+    "scam*": -0.3,
+    "phishing": -0.3,
+    "bridge attack*": -0.6,
+    "withdrawals halted": -0.8,
+    "halts withdrawals": -0.8,
+    "paused withdrawals": -0.7,
+    "insolven*": -0.8,
+    "bankrupt*": -0.7,
+    "chapter 11": -0.7,
+    "liquidat*": -0.4,
+    "depeg*": -0.7,
+    "outage": -0.3,
+    "network halt*": -0.6,
+    "delist*": -0.4,
+    "fraud": -0.5,
+    "money laundering": -0.4,
+    "arrested": -0.3,
+    "indicted": -0.4,
+
+    # -----------------------------
+    # REGULATION
+    # -----------------------------
+    "etf approv*": 0.7,
+    "approves etf": 0.7,
+    "approves spot": 0.6,
+    "etf launch*": 0.5,
+    "etf inflow*": 0.4,
+    "etf outflow*": -0.4,
+    "etf reject*": -0.5,
+    "rejects etf": -0.5,
+    "etf delay*": -0.2,
+    "sec sues": -0.5,
+    "sec lawsuit": -0.5,
+    "sec charges": -0.5,
+    "lawsuit": -0.2,
+    "crackdown": -0.5,
+    "ban": -0.4,
+    "bans": -0.4,
+    "banned": -0.4,
+    "banning": -0.4,
+    "regulatory clarity": 0.4,
+    "stablecoin bill": 0.3,
+    "market structure bill": 0.3,
+    "legal tender": 0.4,
+    "strategic reserve": 0.5,
+    "settlement": 0.1,
+    "dismiss*": 0.2,
+    "wins case": 0.4,
+
+    # -----------------------------
+    # ADOPTION / FLOWS
+    # -----------------------------
+    "adoption": 0.3,
+    "partnership": 0.2,
+    "integrat*": 0.15,
+    "launches": 0.1,
+    "mainnet": 0.2,
+    "upgrade": 0.15,
+    "institutional": 0.2,
+    "treasury buys": 0.4,
+    "accumulat*": 0.2,
+    "inflow*": 0.2,
+    "outflow*": -0.2,
+    "all-time high": 0.4,
+    "record high": 0.4,
+    "rally": 0.3,
+    "rallies": 0.3,
+    "rallied": 0.3,
+    "rallying": 0.3,
+    "surge": 0.3,
+    "surges": 0.3,
+    "surged": 0.3,
+    "surging": 0.3,
+    "soar*": 0.3,
+    "rebound*": 0.2,
+    "breakout": 0.2,
+    "bull": 0.2,
+    "bulls": 0.2,
+    "bullish": 0.2,
+    "crash*": -0.5,
+    "plung*": -0.4,
+    "tumbl*": -0.3,
+    "slump*": -0.3,
+    "sell-off": -0.4,
+    "selloff": -0.4,
+    "bear": -0.2,
+    "bears": -0.2,
+    "bearish": -0.2,
+    "capitulat*": -0.4,
+    "fear": -0.2,
+
+    # -----------------------------
+    # MONETARY POLICY / MACRO
+    # -----------------------------
+    "rate cut*": 0.5,
+    "cuts rates": 0.5,
+    "cuts interest rates": 0.5,
+    "rate hike*": -0.5,
+    "raises rates": -0.5,
+    "raises interest rates": -0.5,
+    "holds rates": 0.0,
+    "hawkish": -0.4,
+    "dovish": 0.4,
+    "quantitative easing": 0.4,
+    "quantitative tightening": -0.3,
+    "balance sheet runoff": -0.2,
+    "inflation cools": 0.4,
+    "inflation eases": 0.4,
+    "inflation rises": -0.4,
+    "inflation jumps": -0.4,
+    "hot inflation": -0.4,
+    "cpi": -0.05,
+    "stagflation": -0.5,
+    "recession": -0.4,
+    "soft landing": 0.3,
+    "job losses": -0.3,
+    "layoffs": -0.2,
+    "unemployment rises": -0.3,
+    "strong jobs": 0.1,
+    "gdp contract*": -0.4,
+    "gdp grow*": 0.2,
+    "default": -0.5,
+    "debt ceiling": -0.3,
+    "government shutdown": -0.3,
+    "bank failure": -0.5,
+    "bank run": -0.6,
+    "bailout": -0.2,
+    "yields surge": -0.3,
+    "yields fall": 0.2,
+    "dollar strengthens": -0.2,
+    "dollar weakens": 0.2,
+    "stimulus": 0.3,
+    "tariff*": -0.3,
+    "trade war": -0.5,
+    "trade deal": 0.3,
+
+    # -----------------------------
+    # GEOPOLITICS
+    # -----------------------------
+    "sanction*": -0.4,
+    "war": -0.5,
+    "invasion": -0.7,
+    "invades": -0.7,
+    "missile*": -0.5,
+    "airstrike*": -0.5,
+    "strikes on": -0.4,
+    "military escalation": -0.6,
+    "escalate": -0.3,
+    "escalates": -0.3,
+    "escalated": -0.3,
+    "escalating": -0.3,
+    "escalation": -0.3,
+    "nuclear": -0.4,
+    "terror*": -0.5,
+    "coup": -0.5,
+    "unrest": -0.3,
+    "protests": -0.15,
+    "martial law": -0.6,
+    "embargo": -0.4,
+    "blockade": -0.4,
+    "conflict": -0.3,
+    "ceasefire": 0.4,
+    "truce": 0.3,
+    "peace talks": 0.3,
+    "peace deal": 0.5,
+    "de-escalat*": 0.3,
+    "summit": 0.05,
+    "election": -0.05,
+    "oil spike*": -0.3,
+    "oil prices surge": -0.3,
+}
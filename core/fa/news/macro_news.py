@@ -1,29 +1,43 @@
-import feedparser
+from core.fa.news.dedup import mark_duplicates
+from core.fa.news.feed_fetcher import fetch_feeds
+from core.fa.news.headline_scorer import score_items
 
+MACRO_RSS_FEEDS = [
+    "https://www.reuters.com/rssFeed/worldNews",
+    "https://www.investing.com/rss/news_285.rss"
+]
 
-def fetch_macro_news():
+ITEMS_PER_FEED = 10
+SCORE_WEIGHT = 0.3   # module score = mean headline score x weight
+
+
+def fetch_macro_news(feeds: dict | None = None, seen: set | None = None):
     """
     Fetch macro-economic news and return a normalized FA signal.
+
+    feeds: optional {url: entries} already fetched this cycle
+    (see fa_aggregator); fetched here otherwise.
+    seen: clusters already counted this cycle by other modules;
+    matching headlines are kept in items but flagged "duplicate".
     """
 
-    feeds = [
-        "https://www.reuters.com/rssFeed/worldNews",
-        "https://www.investing.com/rss/news_285.rss"
-    ]
+    if feeds is None:
+        feeds = fetch_feeds(MACRO_RSS_FEEDS)
 
     items = []
-    score = 0.0
 
-    for url in feeds:
-        feed = feedparser.parse(url)
-        for entry in feed.entries[:5]:
+    for url in MACRO_RSS_FEEDS:
+        for entry in feeds.get(url, [])[:ITEMS_PER_FEED]:
             items.append({
                 "title": entry.get("title", ""),
                 "link": entry.get("link", "")
             })
-            score -= 0.03  # macro news adds slight risk bias
+
+    mark_duplicates(items, seen)
+    score, drivers = score_items(items, SCORE_WEIGHT, "Macro news")
 
     return {
-        "score": round(score, 3),
+        "score": score,
+        "drivers": drivers,
         "items": items
     }
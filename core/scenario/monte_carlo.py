@@ -0,0 +1,181 @@
+# core/scenario/monte_carlo.py
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.scenario.scenario_engine import FEE_RATE_7D
+
+MODES = ("Defensive", "Balanced", "Aggressive")
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def log_returns(prices) -> np.ndarray:
+    p = np.asarray(prices, dtype=np.float64)
+    p = p[np.isfinite(p) & (p > 0)]
+    return np.diff(np.log(p))
+
+
+def _simulate_chunk(task: dict) -> dict:
+    """
+    One chunk of paths. Top-level so it can run in a worker process.
+    Memory is O(chunk_size x steps) regardless of the total path count.
+    """
+    rng = np.random.default_rng(task["seed"])
+    n, steps = task["n"], task["steps"]
+
+    # -----------------------------
+    # Per-step log returns
+    # -----------------------------
+    if task["model"] == "bootstrap":
+        pool = task["returns"]
+        steps_lr = pool[rng.integers(0, len(pool), size=(n, steps))]
+    else:
+        steps_lr = rng.normal(task["drift"], task["step_vol"], size=(n, steps))
+
+    paths = task["price"] * np.exp(np.cumsum(steps_lr, axis=1))
+    terminal_move = paths[:, -1] / task["price"] - 1
+
+    # -----------------------------
+    # Time in range → fees, per mode
+    # -----------------------------
+    lows, highs = task["lows"], task["highs"]
+    time_in_range = np.empty((len(lows), n), dtype=np.float32)
+    for i in range(len(lows)):
+        in_range = (paths >= lows[i]) & (paths <= highs[i])
+        time_in_range[i] = in_range.mean(axis=1)
+
+    allocated = task["allocated"][:, None]
+    fees = allocated * task["fee_rates"][:, None] * time_in_range
+    price_pnl = allocated * terminal_move[None, :]
+
+    return {
+        "time_in_range": time_in_range,
+        "fees": fees.astype(np.float32),
+        "price_pnl": price_pnl.astype(np.float32)
+    }
+
+
+def _summarize(values: np.ndarray, percentiles) -> dict:
+    out = {"mean": round(float(values.mean()), 4)}
+    for q, v in zip(percentiles, np.percentile(values, percentiles)):
+        out[f"p{q}"] = round(float(v), 4)
+    return out
+
+
+def run_monte_carlo_scenarios(
+    fusion_output,
+    current_price,
+    capital_usd=10000,
+    leverage=2,
+    horizon_days=7,
+    n_paths=100_000,
+    steps_per_day=24,
+    model="gbm",
+    step_vol=None,
+    drift=0.0,
+    historical_prices=None,
+    seed=None,
+    chunk_size=20_000,
+    workers=None,
+    percentiles=PERCENTILES
+):
+    """
+    Monte Carlo counterpart of run_scenario_engine.
+
+    Simulates `n_paths` price paths over `horizon_days` and, for each
+    Defensive / Balanced / Aggressive range, measures time-in-range,
+    fees earned while in range, and price PnL on the allocated capital.
+
+    model:
+        "gbm"       -> normal log returns with `step_vol` (per step) and
+                       `drift`; step_vol is estimated from
+                       historical_prices when not given
+        "bootstrap" -> log returns resampled from historical_prices
+                       (their bar spacing should match steps_per_day)
+
+    Seedable: each chunk gets a child seed spawned from `seed`, so a
+    given (seed, chunk_size) gives the same result with or without
+    workers. workers > 1 spreads chunks over a process pool.
+    """
+
+    exposure = capital_usd * leverage
+    ranges = fusion_output["multi_ranges"]["ranges"]
+    allocation = fusion_output["multi_ranges"]["allocation"]
+    steps = max(1, int(round(horizon_days * steps_per_day)))
+
+    # -----------------------------
+    # Return model
+    # -----------------------------
+    returns = None
+    if model == "bootstrap":
+        if historical_prices is None:
+            raise ValueError("bootstrap model needs historical_prices")
+        returns = log_returns(historical_prices)
+        if len(returns) == 0:
+            raise ValueError("historical_prices has no usable returns")
+    elif model == "gbm":
+        if step_vol is None:
+            if historical_prices is None:
+                raise ValueError("gbm model needs step_vol or historical_prices")
+            step_vol = float(np.std(log_returns(historical_prices), ddof=1))
+    else:
+        raise ValueError(f"Unknown model: {model}")
+
+    allocated = np.array([exposure * allocation[m] for m in MODES])
+    base_task = {
+        "steps": steps,
+        "model": model,
+        "returns": returns,
+        "step_vol": step_vol,
+        "drift": drift,
+        "price": float(current_price),
+        "lows": np.array([ranges[m]["range_low"] for m in MODES], dtype=np.float64),
+        "highs": np.array([ranges[m]["range_high"] for m in MODES], dtype=np.float64),
+        "allocated": allocated,
+        # Fee rates are per 7 days; scale to the horizon
+        "fee_rates": np.array([FEE_RATE_7D[m] * horizon_days / 7 for m in MODES])
+    }
+
+    # -----------------------------
+    # Chunked simulation
+    # -----------------------------
+    sizes = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        sizes.append(n_paths % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [dict(base_task, n=n, seed=s) for n, s in zip(sizes, seeds)]
+
+    if workers and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, tasks))
+    else:
+        chunks = [_simulate_chunk(t) for t in tasks]
+
+    tir = np.concatenate([c["time_in_range"] for c in chunks], axis=1)
+    fees = np.concatenate([c["fees"] for c in chunks], axis=1)
+    price_pnl = np.concatenate([c["price_pnl"] for c in chunks], axis=1)
+    net = fees + price_pnl
+
+    # -----------------------------
+    # Distributions per mode
+    # -----------------------------
+    results = {}
+    for i, mode in enumerate(MODES):
+        results[mode] = {
+            "allocated_usd": round(float(allocated[i]), 2),
+            "time_in_range": _summarize(tir[i], percentiles),
+            "fees": _summarize(fees[i], percentiles),
+            "price_pnl": _summarize(price_pnl[i], percentiles),
+            "net_pnl": _summarize(net[i], percentiles),
+            "prob_loss": round(float((net[i] < 0).mean()), 4)
+        }
+
+    return {
+        "model": model,
+        "n_paths": n_paths,
+        "horizon_days": horizon_days,
+        "steps": steps,
+        "seed": seed,
+        "modes": results
+    }
@@ -0,0 +1,162 @@
+# core/scenario/portfolio.py
+"""
+Portfolio counterpart of run_scenario_engine: the same allocation,
+liquidity floor, fee and price-move math, for a whole table of LP
+positions at once, as array operations.
+
+A position is one row:
+    capital_usd, leverage, mode          required
+    allocation                           share of capital x leverage in
+                                         this position (default 1.0)
+    pool                                 label for the per-pool totals
+    width_pct                            range half-width in %, for the
+                                         price shocks (default: never
+                                         leaves its range)
+    fee_rate_7d, liquidity_floor         default from the mode
+    direction, confidence                default from the call arguments
+
+A position with allocation = ALLOCATION[mode] reproduces the matching
+mode of run_scenario_engine exactly.
+"""
+
+import numpy as np
+import pandas as pd
+
+from core.scenario.scenario_engine import BEARISH_MOVE, BULLISH_MOVE, FEE_RATE_7D
+from core.strategy.multi_range_engine import LIQUIDITY_FLOOR, MODES, direction_sign
+
+# Uniform price shocks applied to every position
+SHOCKS = (-0.20, -0.10, -0.05, 0.0, 0.05, 0.10, 0.20)
+
+
+def _column(positions, name: str, default) -> np.ndarray:
+    if name in positions:
+        return np.asarray(positions[name], dtype=np.float64)
+    return np.full(len(positions), default, dtype=np.float64)
+
+
+def _mode_codes(modes) -> np.ndarray:
+    codes = pd.Categorical(modes, categories=list(MODES)).codes
+    if (codes < 0).any():
+        unknown = sorted(set(pd.Series(modes)[codes < 0].astype(str)))
+        raise ValueError(f"Unknown mode(s): {unknown}; expected one of {list(MODES)}")
+    return codes
+
+
+def _totals(frame: pd.DataFrame) -> dict:
+    return {c: round(float(v), 2) for c, v in frame.sum().items()}
+
+
+def run_portfolio_scenarios(
+    positions,
+    direction: str = "Neutral",
+    confidence: float = 0.0,
+    horizon_days=7,
+    shocks=SHOCKS
+) -> dict:
+    """
+    positions: DataFrame (or dict of equal-length columns), see module
+    docstring.
+
+    Returns:
+    {
+        "positions": DataFrame, one row per position (input order):
+            exposure_usd, allocated_usd, liquidity_floor_usd,
+            fees_24h, fees_7d, price_appreciation, net_scenario
+        "totals":   {column: sum} over the portfolio
+        "by_mode":  {mode: {column: sum}}
+        "by_pool":  {pool: {column: sum}}  (only with a "pool" column)
+        "shocks":   DataFrame indexed by move: fees_7d, price_pnl,
+                    net, in_range_pct (share of allocated USD whose
+                    range still holds the shocked price)
+    }
+
+    Per-position values are unrounded; aggregates are rounded to cents.
+    """
+    if not isinstance(positions, pd.DataFrame):
+        positions = pd.DataFrame(positions)
+
+    mode = _mode_codes(positions["mode"])
+
+    # -----------------------------
+    # Allocation + liquidity floor
+    # -----------------------------
+    exposure = (
+        np.asarray(positions["capital_usd"], dtype=np.float64)
+        * np.asarray(positions["leverage"], dtype=np.float64)
+    )
+    allocated = exposure * _column(positions, "allocation", 1.0)
+
+    mode_floor = np.array([LIQUIDITY_FLOOR[m] for m in MODES])
+    floor = mode_floor[mode] if "liquidity_floor" not in positions else _column(positions, "liquidity_floor", 0.0)
+    liquidity_floor_usd = allocated * floor
+
+    # -----------------------------
+    # Fees (7d baseline)
+    # -----------------------------
+    mode_fee = np.array([FEE_RATE_7D[m] for m in MODES])
+    fee_rate = mode_fee[mode] if "fee_rate_7d" not in positions else _column(positions, "fee_rate_7d", 0.0)
+    fees_7d = allocated * fee_rate
+    fees_24h = fees_7d / horizon_days
+
+    # -----------------------------
+    # Directional price scenario
+    # -----------------------------
+    sign = direction_sign(positions["direction"]) if "direction" in positions else direction_sign([direction])
+    move = np.where(sign > 0, BULLISH_MOVE, np.where(sign < 0, BEARISH_MOVE, 0.0))
+    price_appreciation = allocated * move * _column(positions, "confidence", confidence)
+
+    breakdown = pd.DataFrame({
+        "exposure_usd": exposure,
+        "allocated_usd": allocated,
+        "liquidity_floor_usd": liquidity_floor_usd,
+        "fees_24h": fees_24h,
+        "fees_7d": fees_7d,
+        "price_appreciation": price_appreciation,
+        "net_scenario": fees_7d + price_appreciation
+    }, index=positions.index)
+
+    # -----------------------------
+    # Aggregates
+    # -----------------------------
+    columns = list(breakdown.columns)
+    sums_by_mode = np.stack([
+        np.bincount(mode, weights=breakdown[c].to_numpy(), minlength=len(MODES))
+        for c in columns
+    ], axis=1)
+    result = {
+        "positions": breakdown,
+        "totals": _totals(breakdown),
+        "by_mode": {
+            m: {c: round(float(v), 2) for c, v in zip(columns, sums_by_mode[i])}
+            for i, m in enumerate(MODES)
+            if (mode == i).any()
+        }
+    }
+    if "pool" in positions:
+        grouped = breakdown.groupby(positions["pool"].to_numpy(), sort=True).sum()
+        result["by_pool"] = {
+            pool: {c: round(float(v), 2) for c, v in zip(columns, row)}
+            for pool, row in zip(grouped.index, grouped.to_numpy())
+        }
+
+    # -----------------------------
+    # Price shocks (positions x moves)
+    # -----------------------------
+    shocks = np.asarray(shocks, dtype=np.float64)
+    half_width = _column(positions, "width_pct", np.inf) / 100
+    in_range = (np.abs(shocks)[None, :] <= half_width[:, None]).astype(np.float64)
+
+    total_allocated = allocated.sum()
+    shocked_fees = fees_7d @ in_range
+    price_pnl = total_allocated * shocks
+    result["shocks"] = pd.DataFrame({
+        "fees_7d": np.round(shocked_fees, 2),
+        "price_pnl": np.round(price_pnl, 2),
+        "net": np.round(shocked_fees + price_pnl, 2),
+        "in_range_pct": np.round(
+            (allocated @ in_range) / total_allocated * 100 if total_allocated else np.zeros(len(shocks)), 2
+        )
+    }, index=pd.Index(shocks, name="move"))
+
+    return result
@@ -1,5 +1,17 @@
 # core/scenario/scenario_engine.py
 
+# 7-day fee yield per mode (simple model)
+FEE_RATE_7D = {
+    "Defensive": 0.003,
+    "Balanced": 0.005,
+    "Aggressive": 0.008
+}
+
+# Directional price scenario
+BULLISH_MOVE = 0.03     # +3% scenario
+BEARISH_MOVE = -0.02    # stress scenario
+
+
 def run_scenario_engine(
     fusion_output,
     capital_usd=10000,
@@ -32,11 +44,7 @@ def run_scenario_engine(
         # -----------------------------
         width = range_info["width_pct"]
 
-        fee_factor = (
-            0.003 if mode == "Defensive"
-            else 0.005 if mode == "Balanced"
-            else 0.008
-        )
+        fee_factor = FEE_RATE_7D[mode]
 
         estimated_fees_7d = allocated_usd * fee_factor
         estimated_fees_24h = estimated_fees_7d / horizon_days
@@ -47,11 +55,11 @@ def run_scenario_engine(
         appreciation_usd = 0.0
 
         if direction == "Bullish":
-            assumed_move = 0.03  # +3% scenario
+            assumed_move = BULLISH_MOVE
             appreciation_usd = allocated_usd * assumed_move * confidence
 
         elif direction == "Bearish":
-            assumed_move = -0.02  # stress scenario
+            assumed_move = BEARISH_MOVE
             appreciation_usd = allocated_usd * assumed_move * confidence
 
         # Neutral → 0
@@ -1,36 +1,42 @@
 # core/strategy/fusion_engine.py
 
-from core.ta.ta_aggregator import aggregate_ta_signals
-from core.ai.regime_detection import detect_regime
+from core.ta.ta_aggregator import run_ta
+from core.ai.regime_detector import detect_market_regime
 from core.ai.confidence_calibrator import calibrate_confidence
 
+# Direction thresholds on the 0-1 TA score (run_ta's 0-100 / 100);
+# the backtester replays the same rule (core/backtest/signals.py)
+BULLISH_TA_SCORE = 0.7
+BEARISH_TA_SCORE = 0.3
 
-def fuse_signals(price_df):
+
+def fuse_signals(price_df, ta_output=None):
     """
     Fuse TA + regime into a single market state.
+
+    ta_output: run_ta(price_df) if the caller already has it.
     """
 
     # --- Technical Analysis ---
-    ta_output = aggregate_ta_signals(price_df)
+    if ta_output is None:
+        ta_output = run_ta(price_df)
 
-    ta_score = ta_output.get("ta_score", 0.0)
-    volatility_regime = ta_output.get("volatility_regime", "Unavailable")
-    trend_strength = ta_output.get("trend_strength", "Unavailable")
+    # run_ta scores 0-100; direction / confidence work on 0-1
+    ta_score = ta_output.get("ta_score", 0.0) / 100
+    volatility_regime = ta_output.get("volatility", "Unavailable")
+    trend_strength = ta_output.get("trend", "Unavailable")
     drivers = ta_output.get("drivers", [])
 
     # --- Direction logic ---
-    if ta_score >= 0.7:
+    if ta_score >= BULLISH_TA_SCORE:
         direction = "Bullish"
-    elif ta_score <= 0.3:
+    elif ta_score <= BEARISH_TA_SCORE:
         direction = "Bearish"
     else:
         direction = "Neutral"
 
     # --- Regime Detection ---
-    regime = detect_regime(
-        volatility_regime=volatility_regime,
-        trend_strength=trend_strength
-    )
+    regime = detect_market_regime(price_df)
 
     # --- Confidence Calibration ---
     confidence = calibrate_confidence(
@@ -1,5 +1,36 @@
 # core/strategy/multi_range_engine.py
 
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# CONFIG
+# -----------------------------
+MIN_WIDTH = 3.0        # %
+VOL_MULTIPLIER = 1.5   # volatility sensitivity
+DIRECTIONAL_SKEW = 1.2 # extra room on the side the market is leaning
+
+MODES = ("Defensive", "Balanced", "Aggressive")
+
+MODE_WIDTH_FACTORS = {
+    "Defensive": 1.5,
+    "Balanced": 1.0,
+    "Aggressive": 0.6
+}
+
+LIQUIDITY_FLOOR = {
+    "Defensive": 0.50,
+    "Balanced": 0.30,
+    "Aggressive": 0.15
+}
+
+ALLOCATION = {
+    "Defensive": 0.30,
+    "Balanced": 0.40,
+    "Aggressive": 0.30
+}
+
+
 def generate_multi_ranges(
     current_price,
     volatility_pct,
@@ -25,30 +56,11 @@ def generate_multi_ranges(
     except Exception:
         volatility_pct = 0.0
 
-    # -----------------------------
-    # CONFIG
-    # -----------------------------
-    MIN_WIDTH = 3.0        # %
-    VOL_MULTIPLIER = 1.5   # volatility sensitivity
-
     base_width = max(MIN_WIDTH, volatility_pct * VOL_MULTIPLIER)
 
     width_map = {
-        "Defensive": base_width * 1.5,
-        "Balanced": base_width,
-        "Aggressive": base_width * 0.6
-    }
-
-    liquidity_floor = {
-        "Defensive": 0.50,
-        "Balanced": 0.30,
-        "Aggressive": 0.15
-    }
-
-    allocation = {
-        "Defensive": 0.30,
-        "Balanced": 0.40,
-        "Aggressive": 0.30
+        mode: base_width * MODE_WIDTH_FACTORS[mode]
+        for mode in MODES
     }
 
     ranges = {}
@@ -58,9 +70,9 @@ def generate_multi_ranges(
 
         if direction == "Bullish":
             low = current_price - half_width
-            high = current_price + (half_width * 1.2)
+            high = current_price + (half_width * DIRECTIONAL_SKEW)
         elif direction == "Bearish":
-            low = current_price - (half_width * 1.2)
+            low = current_price - (half_width * DIRECTIONAL_SKEW)
             high = current_price + half_width
         else:
             low = current_price - half_width
@@ -70,10 +82,112 @@ def generate_multi_ranges(
             "range_low": round(max(low, 0), 2),
             "range_high": round(high, 2),
             "width_pct": round(width_pct, 2),
-            "liquidity_floor": liquidity_floor[mode]
+            "liquidity_floor": LIQUIDITY_FLOOR[mode]
         }
 
     return {
         "ranges": ranges,
-        "allocation": allocation
+        "allocation": dict(ALLOCATION)
     }
+
+
+# -----------------------------
+# VECTORIZED VARIANTS
+# -----------------------------
+def direction_sign(directions) -> np.ndarray:
+    """
+    "Bullish" -> 1, "Bearish" -> -1, anything else -> 0.
+    """
+    d = np.asarray(directions, dtype=object)
+    return np.where(d == "Bullish", 1, np.where(d == "Bearish", -1, 0)).astype(np.int8)
+
+
+def compute_range_bounds(
+    prices,
+    volatility_pct,
+    sign,
+    width_factor,
+    min_width=MIN_WIDTH,
+    vol_multiplier=VOL_MULTIPLIER,
+    skew=DIRECTIONAL_SKEW
+):
+    """
+    Array form of the per-mode math in generate_multi_ranges.
+    All arguments broadcast against each other; `sign` comes from
+    direction_sign(). Returns unrounded (low, high, width_pct).
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    width_pct = np.maximum(min_width, np.asarray(volatility_pct, dtype=np.float64) * vol_multiplier)
+    width_pct = width_pct * width_factor
+
+    half_width = width_pct / 100 * prices
+    low = prices - half_width * np.where(sign < 0, skew, 1.0)
+    high = prices + half_width * np.where(sign > 0, skew, 1.0)
+
+    return np.maximum(low, 0.0), high, np.broadcast_to(width_pct, low.shape)
+
+
+def generate_multi_ranges_grid(
+    prices,
+    volatilities,
+    directions,
+    min_width=None,
+    vol_multiplier=None,
+    round_output: bool = True
+) -> pd.DataFrame:
+    """
+    generate_multi_ranges over the full cartesian product of
+    prices x volatilities x directions x min_width x vol_multiplier x mode,
+    computed as array operations.
+
+    min_width / vol_multiplier default to the module constants.
+
+    Returns one row per combination with columns:
+        price, volatility_pct, direction, min_width, vol_multiplier, mode,
+        range_low, range_high, width_pct, liquidity_floor, allocation
+    """
+    prices = np.atleast_1d(np.asarray(prices, dtype=np.float64))
+    vols = np.atleast_1d(np.asarray(volatilities, dtype=np.float64))
+    dirs = np.atleast_1d(np.asarray(directions, dtype=object))
+    min_widths = np.atleast_1d(np.asarray(MIN_WIDTH if min_width is None else min_width, dtype=np.float64))
+    multipliers = np.atleast_1d(np.asarray(VOL_MULTIPLIER if vol_multiplier is None else vol_multiplier, dtype=np.float64))
+    modes = np.arange(len(MODES))
+
+    # Index grid, flattened: one row per combination
+    ip, iv, idr, imw, imu, im = (
+        g.ravel() for g in np.meshgrid(
+            np.arange(len(prices)), np.arange(len(vols)), np.arange(len(dirs)),
+            np.arange(len(min_widths)), np.arange(len(multipliers)), modes,
+            indexing="ij"
+        )
+    )
+
+    width_factors = np.array([MODE_WIDTH_FACTORS[m] for m in MODES])
+    floors = np.array([LIQUIDITY_FLOOR[m] for m in MODES])
+    allocations = np.array([ALLOCATION[m] for m in MODES])
+
+    low, high, width_pct = compute_range_bounds(
+        prices[ip],
+        vols[iv],
+        direction_sign(dirs)[idr],
+        width_factors[im],
+        min_width=min_widths[imw],
+        vol_multiplier=multipliers[imu]
+    )
+
+    if round_output:
+        low, high, width_pct = np.round(low, 2), np.round(high, 2), np.round(width_pct, 2)
+
+    return pd.DataFrame({
+        "price": prices[ip],
+        "volatility_pct": vols[iv],
+        "direction": dirs[idr],
+        "min_width": min_widths[imw],
+        "vol_multiplier": multipliers[imu],
+        "mode": pd.Categorical.from_codes(im, categories=list(MODES)),
+        "range_low": low,
+        "range_high": high,
+        "width_pct": width_pct,
+        "liquidity_floor": floors[im],
+        "allocation": allocations[im]
+    })
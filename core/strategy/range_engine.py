@@ -1,5 +1,15 @@
 # core/strategy/range_engine.py
 
+import numpy as np
+
+# Directional skew: the width multiplier on the side away from the
+# market's lean (near) and on the side it is leaning toward (far)
+SKEW_NEAR = 0.6
+SKEW_FAR = 1.4
+
+FALLBACK_VOLATILITY_PCT = 2.0
+
+
 def generate_range(price, volatility_pct, direction):
     """
     Generate a single active liquidity range.
@@ -11,16 +21,16 @@ def generate_range(price, volatility_pct, direction):
 
     # Fallback volatility
     if volatility_pct <= 0:
-        volatility_pct = 2.0
+        volatility_pct = FALLBACK_VOLATILITY_PCT
 
     width = price * (volatility_pct / 100)
 
     if direction == "Bullish":
-        lower = price - width * 0.6
-        upper = price + width * 1.4
+        lower = price - width * SKEW_NEAR
+        upper = price + width * SKEW_FAR
     elif direction == "Bearish":
-        lower = price - width * 1.4
-        upper = price + width * 0.6
+        lower = price - width * SKEW_FAR
+        upper = price + width * SKEW_NEAR
     else:
         lower = price - width
         upper = price + width
@@ -30,3 +40,20 @@ def generate_range(price, volatility_pct, direction):
         "upper": round(upper, 2),
         "width_pct": round((upper - lower) / price * 100, 2)
     }
+
+
+def generate_range_bounds(prices, volatility_pct, sign):
+    """
+    Array form of generate_range (unrounded).
+    sign: +1 Bullish, -1 Bearish, 0 Neutral (see multi_range_engine.direction_sign).
+    Returns (lower, upper).
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    vol = np.asarray(volatility_pct, dtype=np.float64)
+    vol = np.where(vol <= 0, FALLBACK_VOLATILITY_PCT, vol)
+
+    width = prices * (vol / 100)
+    lower = prices - width * np.where(sign > 0, SKEW_NEAR, np.where(sign < 0, SKEW_FAR, 1.0))
+    upper = prices + width * np.where(sign > 0, SKEW_FAR, np.where(sign < 0, SKEW_NEAR, 1.0))
+
+    return lower, upper
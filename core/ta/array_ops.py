@@ -0,0 +1,43 @@
+# core/ta/array_ops.py
+"""
+NaN-aware column helpers for (time x symbol) price matrices.
+"""
+
+import numpy as np
+
+
+def valid_bars(matrix: np.ndarray) -> np.ndarray:
+    """
+    Trailing run of non-NaN bars per column. Ragged histories are
+    expected to be right-aligned (leading NaNs); a NaN on the last
+    row means the symbol is stale and gets 0.
+    """
+    t = matrix.shape[0]
+    rows = np.arange(t)[:, None]
+    last_nan = np.where(np.isnan(matrix), rows, -1).max(axis=0)
+    return (t - 1 - last_nan).astype(np.int64)
+
+
+def nan_std(values: np.ndarray) -> np.ndarray:
+    """
+    Column-wise sample std (ddof=1) ignoring NaN; NaN below 2 values.
+    Same as np.nanstd(ddof=1) without its warnings on short columns.
+    """
+    n = np.sum(~np.isnan(values), axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(values, axis=0) / n
+        var = np.nansum((values - mean) ** 2, axis=0) / (n - 1)
+    return np.where(n >= 2, np.sqrt(var), np.nan)
+
+
+def tail_mean(matrix: np.ndarray, window: int, n_valid: np.ndarray, offset: int = 0) -> np.ndarray:
+    """
+    Mean of the `window` bars ending `offset` bars before the last one,
+    NaN where a column has too few bars.
+    """
+    end = matrix.shape[0] - offset
+    if end < window:
+        return np.full(matrix.shape[1], np.nan)
+    with np.errstate(invalid="ignore"):
+        mean = matrix[end - window:end].mean(axis=0)
+    return np.where(n_valid >= window + offset, mean, np.nan)
@@ -0,0 +1,169 @@
+# core/ta/batch.py
+
+import numpy as np
+import pandas as pd
+
+from core.ai.regime_detector import detect_market_regime_batch
+from core.ta.array_ops import nan_std, tail_mean, valid_bars
+from core.ta.fused import MA_FAST, MA_SLOW, RSI_PERIOD, TREND_LOOKBACK
+
+
+def _as_matrix(prices, symbols=None):
+    """
+    (time x symbol) DataFrame or 2-D array -> (float64 matrix, symbol list).
+    """
+    if isinstance(prices, pd.DataFrame):
+        return prices.to_numpy(dtype=np.float64), [str(c) for c in prices.columns]
+
+    matrix = np.asarray(prices, dtype=np.float64)
+    if matrix.ndim != 2:
+        raise ValueError("Expected a 2-D (time x symbol) price matrix")
+    if symbols is None:
+        symbols = [str(i) for i in range(matrix.shape[1])]
+    return matrix, list(symbols)
+
+
+def compute_indicators_batch(matrix: np.ndarray, n_valid: np.ndarray | None = None) -> dict:
+    """
+    Column-wise version of core.ta.fused.compute_indicators.
+    Every value is an array over symbols; missing values are NaN.
+    """
+    if n_valid is None:
+        n_valid = valid_bars(matrix)
+    t, s = matrix.shape
+    last = matrix[-1] if t else np.full(s, np.nan)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # -----------------------------
+        # RSI
+        # -----------------------------
+        rsi = np.full(s, np.nan)
+        if t >= RSI_PERIOD + 1:
+            delta = np.diff(matrix[-(RSI_PERIOD + 1):], axis=0)
+            avg_gain = np.clip(delta, 0, None).sum(axis=0) / RSI_PERIOD
+            avg_loss = -np.clip(delta, None, 0).sum(axis=0) / RSI_PERIOD
+            rsi = np.where(
+                avg_loss == 0,
+                np.where(avg_gain > 0, 100.0, np.nan),
+                100 - 100 / (1 + avg_gain / avg_loss)
+            )
+            rsi = np.where(n_valid >= RSI_PERIOD + 1, rsi, np.nan)
+
+        # -----------------------------
+        # MOVING AVERAGES / MOMENTUM
+        # -----------------------------
+        ma20 = tail_mean(matrix, MA_FAST, n_valid)
+        ma200 = tail_mean(matrix, MA_SLOW, n_valid)
+
+        momentum = np.full(s, np.nan)
+        if t >= TREND_LOOKBACK:
+            momentum = np.where(
+                n_valid >= TREND_LOOKBACK,
+                last - matrix[-TREND_LOOKBACK],
+                np.nan
+            )
+
+        # -----------------------------
+        # VOLATILITY (all valid returns)
+        # -----------------------------
+        volatility = np.full(s, np.nan)
+        if t >= 3:
+            returns = np.diff(matrix, axis=0) / matrix[:-1]
+            returns[~np.isfinite(returns)] = np.nan
+            volatility = np.where(n_valid >= 3, nan_std(returns), np.nan)
+
+    return {
+        "last": last,
+        "rsi": rsi,
+        "ma20": ma20,
+        "ma200": ma200,
+        "momentum": momentum,
+        "volatility": volatility,
+        "n_valid": n_valid
+    }
+
+
+def score_indicators_batch(ind: dict, with_drivers: bool = True) -> dict:
+    """
+    Column-wise version of core.ta.ta_aggregator.score_indicators.
+    with_drivers=False skips building the per-column driver lists
+    (e.g. when scoring every bar of a history).
+    """
+    rsi, last = ind["rsi"], ind["last"]
+    ma20, ma200, momentum = ind["ma20"], ind["ma200"], ind["momentum"]
+
+    has_rsi = ~np.isnan(rsi)
+    with np.errstate(invalid="ignore"):
+        oversold = has_rsi & (rsi < 30)
+        overbought = has_rsi & (rsi > 70)
+        ma20_sign = np.where(np.isnan(ma20), 0, np.where(last > ma20, 1, -1))
+        ma200_sign = np.where(np.isnan(ma200), 0, np.where(last > ma200, 1, -1))
+
+    score = 50 + 15 * oversold - 15 * overbought + 10 * ma20_sign + 10 * ma200_sign
+    score = np.clip(score, 0, 100).astype(np.int64)
+
+    trend = np.select(
+        [np.isnan(momentum), momentum > 0, momentum < 0],
+        ["Insufficient data", "Bullish", "Bearish"],
+        default="Neutral"
+    )
+
+    if not with_drivers:
+        return {"ta_score": score, "trend": trend}
+
+    rsi_driver = np.select(
+        [oversold, overbought, has_rsi],
+        ["RSI: Oversold (Bullish)", "RSI: Overbought (Bearish)", "RSI: Neutral"],
+        default=""
+    )
+    ma20_driver = np.select(
+        [ma20_sign > 0, ma20_sign < 0],
+        ["MA20: Bullish", "MA20: Bearish"],
+        default="MA20: Insufficient data"
+    )
+    ma200_driver = np.select(
+        [ma200_sign > 0, ma200_sign < 0],
+        ["MA200: Bullish", "MA200: Bearish"],
+        default="MA200: Insufficient data"
+    )
+
+    drivers = [
+        ([r] if r else []) + [m20, m200, f"Trend: {tr}"]
+        for r, m20, m200, tr in zip(rsi_driver, ma20_driver, ma200_driver, trend)
+    ]
+
+    return {
+        "ta_score": score,
+        "trend": trend,
+        "drivers": drivers
+    }
+
+
+def evaluate_symbols(prices, symbols=None) -> pd.DataFrame:
+    """
+    TA score, drivers and regime for every column of a
+    (time x symbol) price matrix in one vectorized pass.
+
+    Symbols with too little history get the same "Insufficient data"
+    drivers / "Unknown" regime the single-symbol functions return.
+
+    Returns a DataFrame indexed by symbol.
+    """
+    matrix, symbols = _as_matrix(prices, symbols)
+    n_valid = valid_bars(matrix)
+
+    ind = compute_indicators_batch(matrix, n_valid)
+    scored = score_indicators_batch(ind)
+    regime = detect_market_regime_batch(matrix, n_valid)
+
+    return pd.DataFrame({
+        "ta_score": scored["ta_score"],
+        "trend": scored["trend"],
+        "rsi": ind["rsi"],
+        "ma20": ind["ma20"],
+        "ma200": ind["ma200"],
+        "volatility": ind["volatility"],
+        "regime": regime,
+        "bars": n_valid,
+        "drivers": scored["drivers"]
+    }, index=pd.Index(symbols, name="symbol"))
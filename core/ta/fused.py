@@ -0,0 +1,115 @@
+# core/ta/fused.py
+
+import math
+
+import numpy as np
+
+from core.ta.volatility import classify_volatility
+
+RSI_PERIOD = 14
+MA_FAST = 20
+MA_SLOW = 200
+TREND_LOOKBACK = 20
+
+
+def compute_indicators(
+    prices,
+    rsi_period: int = RSI_PERIOD,
+    vol_window: int | None = None
+) -> dict:
+    """
+    Fused TA kernel: every indicator run_ta needs, from one float array,
+    touching only the tail window each indicator reads.
+
+    Matches the per-module functions (rsi / ma_20 / ma_200 /
+    trend_strength / volatility) on the last bar.
+
+    vol_window: number of trailing returns for volatility
+                (None = full history, like calculate_volatility).
+
+    Returns:
+    {
+        "last": float | None,
+        "rsi": float | None,
+        "ma20": float | None,  "above_ma20": bool | None,
+        "ma200": float | None, "above_ma200": bool | None,
+        "momentum": float | None,
+        "trend": str,
+        "volatility": float | None,
+        "volatility_regime": str | None
+    }
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    n = p.shape[0]
+
+    out = {
+        "last": None,
+        "rsi": None,
+        "ma20": None,
+        "above_ma20": None,
+        "ma200": None,
+        "above_ma200": None,
+        "momentum": None,
+        "trend": "Insufficient data",
+        "volatility": None,
+        "volatility_regime": None
+    }
+    if n == 0:
+        return out
+
+    last = float(p[-1])
+    out["last"] = last
+
+    # -----------------------------
+    # RSI (simple averages over last `period` deltas)
+    # -----------------------------
+    if n >= rsi_period + 1:
+        delta = np.diff(p[-(rsi_period + 1):])
+        avg_gain = delta[delta > 0].sum() / rsi_period
+        avg_loss = -delta[delta < 0].sum() / rsi_period
+
+        if avg_loss == 0:
+            out["rsi"] = 100.0 if avg_gain > 0 else math.nan
+        else:
+            out["rsi"] = float(100 - 100 / (1 + avg_gain / avg_loss))
+
+    # -----------------------------
+    # MOVING AVERAGES
+    # -----------------------------
+    if n >= MA_FAST:
+        ma20 = float(p[-MA_FAST:].mean())
+        out["ma20"] = ma20
+        out["above_ma20"] = bool(last > ma20)
+
+    if n >= MA_SLOW:
+        ma200 = float(p[-MA_SLOW:].mean())
+        out["ma200"] = ma200
+        out["above_ma200"] = bool(last > ma200)
+
+    # -----------------------------
+    # MOMENTUM / TREND
+    # -----------------------------
+    if n >= TREND_LOOKBACK:
+        momentum = last - float(p[-TREND_LOOKBACK])
+        out["momentum"] = momentum
+
+        if momentum > 0:
+            out["trend"] = "Bullish"
+        elif momentum < 0:
+            out["trend"] = "Bearish"
+        else:
+            out["trend"] = "Neutral"
+
+    # -----------------------------
+    # VOLATILITY (std of simple returns)
+    # -----------------------------
+    window = p if vol_window is None else p[-(vol_window + 1):]
+    if window.shape[0] >= 3:
+        returns = np.diff(window) / window[:-1]
+        returns = returns[np.isfinite(returns)]
+        if returns.shape[0] >= 2:
+            vol = float(returns.std(ddof=1))
+            out["volatility"] = vol
+            out["volatility_regime"] = classify_volatility(vol)
+
+    return out
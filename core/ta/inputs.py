@@ -0,0 +1,19 @@
+# core/ta/inputs.py
+
+import pandas as pd
+
+# Canonical bars (data/normalize) use "close"; raw CoinGecko frames "price"
+PRICE_COLUMNS = ["close", "Close", "price", "Price"]
+
+
+def close_series(price_input) -> pd.Series | None:
+    """
+    Price series from canonical bars, a raw source frame or a Series.
+    None if a DataFrame has no known price column.
+    """
+    if isinstance(price_input, pd.DataFrame):
+        for col in PRICE_COLUMNS:
+            if col in price_input.columns:
+                return price_input[col]
+        return None
+    return pd.Series(price_input)
@@ -1,5 +1,8 @@
+from core.ta.inputs import close_series
+
+
 def calculate_ma_crossover(price_df):
-    close = price_df["close"]
+    close = close_series(price_df)
     ma20 = close.rolling(20).mean()
     ma200 = close.rolling(200).mean()
 
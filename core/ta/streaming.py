@@ -0,0 +1,343 @@
+# core/ta/streaming.py
+"""
+Incremental (O(1) per tick) versions of the core/ta indicators.
+
+Each class takes one price (or value) at a time via update() and can be
+snapshotted to plain Python data and restored later, e.g. to persist
+state between worker runs. Results match the batch functions on the
+same history (up to float rounding).
+"""
+
+import math
+from collections import deque
+
+from core.ta.ta_aggregator import score_indicators
+from core.ta.volatility import classify_volatility
+
+# Running sums are recomputed exactly this often (in multiples of the
+# window) so float drift stays bounded; amortized cost is still O(1).
+RESYNC_WINDOWS = 64
+
+
+class RollingMean:
+    """Mean of the last `window` values (running sum)."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values = deque(maxlen=window)
+        self._sum = 0.0
+        self._since_resync = 0
+
+    def update(self, x: float) -> float | None:
+        if len(self._values) == self.window:
+            self._sum -= self._values[0]
+        self._values.append(x)
+        self._sum += x
+
+        self._since_resync += 1
+        if self._since_resync >= self.window * RESYNC_WINDOWS:
+            self._sum = math.fsum(self._values)
+            self._since_resync = 0
+
+        return self.value
+
+    @property
+    def value(self) -> float | None:
+        if len(self._values) < self.window:
+            return None
+        return self._sum / self.window
+
+    def snapshot(self) -> dict:
+        return {"window": self.window, "values": list(self._values)}
+
+    @classmethod
+    def restore(cls, state: dict):
+        obj = cls(state["window"])
+        obj._values.extend(state["values"])
+        obj._sum = math.fsum(obj._values)
+        return obj
+
+
+class RollingStd:
+    """
+    Sample std (ddof=1) of the last `window` values, or of every value
+    seen when window is None (Welford's algorithm).
+    """
+
+    def __init__(self, window: int | None = None):
+        self.window = window
+        self._values = deque(maxlen=window) if window else None
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0          # Welford (unbounded)
+        self._sum = 0.0         # windowed sums
+        self._sumsq = 0.0
+        self._since_resync = 0
+
+    def update(self, x: float) -> float | None:
+        if self.window is None:
+            self._n += 1
+            d = x - self._mean
+            self._mean += d / self._n
+            self._m2 += d * (x - self._mean)
+            return self.value
+
+        if len(self._values) == self.window:
+            old = self._values[0]
+            self._sum -= old
+            self._sumsq -= old * old
+        self._values.append(x)
+        self._sum += x
+        self._sumsq += x * x
+
+        self._since_resync += 1
+        if self._since_resync >= self.window * RESYNC_WINDOWS:
+            self._resync()
+
+        return self.value
+
+    def _resync(self):
+        self._sum = math.fsum(self._values)
+        self._sumsq = math.fsum(v * v for v in self._values)
+        self._since_resync = 0
+
+    @property
+    def count(self) -> int:
+        return self._n if self.window is None else len(self._values)
+
+    @property
+    def value(self) -> float | None:
+        n = self.count
+        if n < 2:
+            return None
+        if self.window is None:
+            return math.sqrt(self._m2 / (n - 1))
+        var = (self._sumsq - self._sum * self._sum / n) / (n - 1)
+        return math.sqrt(max(var, 0.0))
+
+    def snapshot(self) -> dict:
+        if self.window is None:
+            return {"window": None, "n": self._n, "mean": self._mean, "m2": self._m2}
+        return {"window": self.window, "values": list(self._values)}
+
+    @classmethod
+    def restore(cls, state: dict):
+        obj = cls(state["window"])
+        if obj.window is None:
+            obj._n, obj._mean, obj._m2 = state["n"], state["mean"], state["m2"]
+        else:
+            obj._values.extend(state["values"])
+            obj._resync()
+        return obj
+
+
+class StreamingRSI:
+    """
+    RSI over `period` price deltas.
+
+    smoothing="simple" matches calculate_rsi (rolling means);
+    smoothing="wilder" uses Wilder's exponential smoothing seeded
+    with the first simple average.
+    """
+
+    def __init__(self, period: int = 14, smoothing: str = "simple"):
+        if smoothing not in ("simple", "wilder"):
+            raise ValueError(f"Unknown RSI smoothing: {smoothing}")
+        self.period = period
+        self.smoothing = smoothing
+        self._prev = None
+        self._gains = RollingMean(period)
+        self._losses = RollingMean(period)
+        self._avg_gain = None   # Wilder state
+        self._avg_loss = None
+
+    def update(self, price: float) -> float | None:
+        if self._prev is None:
+            self._prev = price
+            return None
+
+        delta = price - self._prev
+        self._prev = price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        avg_gain = self._gains.update(gain)
+        avg_loss = self._losses.update(loss)
+
+        if self.smoothing == "wilder":
+            if self._avg_gain is None:
+                self._avg_gain, self._avg_loss = avg_gain, avg_loss
+            else:
+                p = self.period
+                self._avg_gain = (self._avg_gain * (p - 1) + gain) / p
+                self._avg_loss = (self._avg_loss * (p - 1) + loss) / p
+
+        return self.value
+
+    @property
+    def value(self) -> float | None:
+        if self.smoothing == "wilder":
+            avg_gain, avg_loss = self._avg_gain, self._avg_loss
+        else:
+            avg_gain, avg_loss = self._gains.value, self._losses.value
+
+        if avg_gain is None:
+            return None
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else math.nan
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+    def snapshot(self) -> dict:
+        return {
+            "period": self.period,
+            "smoothing": self.smoothing,
+            "prev": self._prev,
+            "gains": self._gains.snapshot(),
+            "losses": self._losses.snapshot(),
+            "avg_gain": self._avg_gain,
+            "avg_loss": self._avg_loss
+        }
+
+    @classmethod
+    def restore(cls, state: dict):
+        obj = cls(state["period"], state["smoothing"])
+        obj._prev = state["prev"]
+        obj._gains = RollingMean.restore(state["gains"])
+        obj._losses = RollingMean.restore(state["losses"])
+        obj._avg_gain = state["avg_gain"]
+        obj._avg_loss = state["avg_loss"]
+        return obj
+
+
+class StreamingTrend:
+    """Momentum over `lookback` bars, as trend_strength."""
+
+    def __init__(self, lookback: int = 20):
+        self.lookback = lookback
+        self._prices = deque(maxlen=lookback)
+
+    def update(self, price: float) -> str:
+        self._prices.append(price)
+        return self.value
+
+    @property
+    def momentum(self) -> float | None:
+        if len(self._prices) < self.lookback:
+            return None
+        return self._prices[-1] - self._prices[0]
+
+    @property
+    def value(self) -> str:
+        momentum = self.momentum
+        if momentum is None:
+            return "Insufficient data"
+        if momentum > 0:
+            return "Bullish"
+        elif momentum < 0:
+            return "Bearish"
+        return "Neutral"
+
+    def snapshot(self) -> dict:
+        return {"lookback": self.lookback, "prices": list(self._prices)}
+
+    @classmethod
+    def restore(cls, state: dict):
+        obj = cls(state["lookback"])
+        obj._prices.extend(state["prices"])
+        return obj
+
+
+class StreamingVolatility:
+    """Std of simple returns, as calculate_volatility (window=None → all returns)."""
+
+    def __init__(self, window: int | None = None):
+        self._prev = None
+        self._std = RollingStd(window)
+
+    def update(self, price: float) -> float | None:
+        if self._prev is not None and self._prev != 0:
+            self._std.update(price / self._prev - 1)
+        self._prev = price
+        return self.value
+
+    @property
+    def value(self) -> float | None:
+        return self._std.value
+
+    def snapshot(self) -> dict:
+        return {"prev": self._prev, "std": self._std.snapshot()}
+
+    @classmethod
+    def restore(cls, state: dict):
+        obj = cls()
+        obj._prev = state["prev"]
+        obj._std = RollingStd.restore(state["std"])
+        return obj
+
+
+class StreamingTA:
+    """
+    Incremental counterpart of compute_indicators + run_ta.
+
+        ta = StreamingTA()
+        for price in ticks:
+            ta.update(price)
+        ta.result()   # same shape as run_ta()
+    """
+
+    def __init__(self, rsi_period: int = 14, vol_window: int | None = None):
+        self.last = None
+        self.rsi = StreamingRSI(rsi_period)
+        self.ma20 = RollingMean(20)
+        self.ma200 = RollingMean(200)
+        self.trend = StreamingTrend(20)
+        self.vol = StreamingVolatility(vol_window)
+
+    def update(self, price: float):
+        price = float(price)
+        self.last = price
+        self.rsi.update(price)
+        self.ma20.update(price)
+        self.ma200.update(price)
+        self.trend.update(price)
+        self.vol.update(price)
+
+    def indicators(self) -> dict:
+        """Same keys as core.ta.fused.compute_indicators."""
+        ma20, ma200, vol = self.ma20.value, self.ma200.value, self.vol.value
+        return {
+            "last": self.last,
+            "rsi": self.rsi.value,
+            "ma20": ma20,
+            "above_ma20": None if ma20 is None else self.last > ma20,
+            "ma200": ma200,
+            "above_ma200": None if ma200 is None else self.last > ma200,
+            "momentum": self.trend.momentum,
+            "trend": self.trend.value,
+            "volatility": vol,
+            "volatility_regime": None if vol is None else classify_volatility(vol)
+        }
+
+    def result(self) -> dict:
+        return score_indicators(self.indicators())
+
+    def snapshot(self) -> dict:
+        return {
+            "last": self.last,
+            "rsi": self.rsi.snapshot(),
+            "ma20": self.ma20.snapshot(),
+            "ma200": self.ma200.snapshot(),
+            "trend": self.trend.snapshot(),
+            "vol": self.vol.snapshot()
+        }
+
+    @classmethod
+    def restore(cls, state: dict):
+        obj = cls.__new__(cls)
+        obj.last = state["last"]
+        obj.rsi = StreamingRSI.restore(state["rsi"])
+        obj.ma20 = RollingMean.restore(state["ma20"])
+        obj.ma200 = RollingMean.restore(state["ma200"])
+        obj.trend = StreamingTrend.restore(state["trend"])
+        obj.vol = StreamingVolatility.restore(state["vol"])
+        return obj
@@ -1,14 +1,24 @@
-from core.ta.rsi import calculate_rsi
-from core.ta.ma_20 import ma_20
-from core.ta.ma_200 import ma_200
-from core.ta.trend_strength import trend_strength
+from core.ta.fused import compute_indicators
+from core.ta.inputs import close_series
 
 def run_ta(price_df):
-    price_series = price_df["price"]
+    price_series = close_series(price_df)
+
+    # One pass over the tail windows (see core/ta/fused.py)
+    ind = compute_indicators(price_series.to_numpy(dtype=float))
+
+    return score_indicators(ind)
+
+
+def score_indicators(ind: dict) -> dict:
+    """
+    TA score + drivers from an indicator dict
+    (compute_indicators or StreamingTA.indicators).
+    """
     drivers = []
     score = 50
 
-    rsi = calculate_rsi(price_series)
+    rsi = ind["rsi"]
     if rsi is not None:
         if rsi < 30:
             drivers.append("RSI: Oversold (Bullish)")
@@ -19,7 +29,7 @@ def run_ta(price_df):
         else:
             drivers.append("RSI: Neutral")
 
-    ma20 = ma_20(price_series)
+    ma20 = ind["above_ma20"]
     if ma20 is True:
         drivers.append("MA20: Bullish")
         score += 10
@@ -29,7 +39,7 @@ def run_ta(price_df):
     else:
         drivers.append("MA20: Insufficient data")
 
-    ma200 = ma_200(price_series)
+    ma200 = ind["above_ma200"]
     if ma200 is True:
         drivers.append("MA200: Bullish")
         score += 10
@@ -39,7 +49,7 @@ def run_ta(price_df):
     else:
         drivers.append("MA200: Insufficient data")
 
-    trend = trend_strength(price_series)
+    trend = ind["trend"]
     drivers.append(f"Trend: {trend}")
 
     score = max(0, min(100, score))
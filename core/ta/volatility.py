@@ -1,19 +1,22 @@
 import numpy as np
 
+from core.ta.inputs import close_series
 
-def calculate_volatility(price_df):
-    returns = price_df["close"].pct_change().dropna()
-
-    vol = returns.std()
 
+def classify_volatility(vol: float) -> str:
     if vol < 0.01:
-        regime = "Low"
+        return "Low"
     elif vol < 0.03:
-        regime = "Normal"
-    else:
-        regime = "High"
+        return "Normal"
+    return "High"
+
+
+def calculate_volatility(price_df):
+    returns = close_series(price_df).pct_change().dropna()
+
+    vol = returns.std()
 
     return {
         "volatility": float(vol),
-        "regime": regime
+        "regime": classify_volatility(vol)
     }
@@ -0,0 +1 @@
+# canonical bar normalization
@@ -0,0 +1,167 @@
+# data/normalize/bars.py
+"""
+Canonical OHLC bars.
+
+Every source is converted to the same shape before indicators run:
+fixed-interval bars keyed by bar-open time, float32 open/high/low/close,
+no gaps. CoinGecko's market_chart (5-minute / hourly / daily samples
+depending on `days`, single "price" column) and yfinance (hourly
+Open/High/Low/Close) both end up identical.
+"""
+
+import numpy as np
+import pandas as pd
+
+INTERVAL_MS = {
+    "5m": 5 * 60 * 1000,
+    "15m": 15 * 60 * 1000,
+    "1h": 60 * 60 * 1000,
+    "4h": 4 * 60 * 60 * 1000,
+    "1d": 24 * 60 * 60 * 1000
+}
+
+OHLC = ("open", "high", "low", "close")
+PRICE_COLUMNS = ("close", "Close", "price", "Price")
+
+
+def _source_columns(df: pd.DataFrame) -> dict:
+    """
+    Map a raw frame to open/high/low/close arrays. Single-price sources
+    use the price as all four.
+    """
+    lower = {c.lower(): c for c in df.columns}
+
+    if all(k in lower for k in OHLC):
+        return {k: df[lower[k]].to_numpy(dtype=np.float64) for k in OHLC}
+
+    for col in PRICE_COLUMNS:
+        if col in df.columns:
+            price = df[col].to_numpy(dtype=np.float64)
+            return {k: price for k in OHLC}
+
+    raise ValueError(f"No price column in {list(df.columns)}")
+
+
+def _timestamps_ms(index) -> np.ndarray:
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ms").asi8
+
+
+def normalize_bars(df: pd.DataFrame, interval: str = "1h", fill_gaps: bool = True) -> pd.DataFrame:
+    """
+    Raw samples (any source) -> canonical bars.
+
+    - bucketed on bar-open time (UTC) at `interval`
+    - open = first, high = max, low = min, close = last sample per bucket
+    - empty buckets (fill_gaps) become flat bars at the previous close,
+      flagged in the `filled` column
+    - float32 OHLC, DatetimeIndex named "timestamp"
+    """
+    if interval not in INTERVAL_MS:
+        raise ValueError(f"Unsupported interval: {interval}")
+    step = INTERVAL_MS[interval]
+
+    if df is None or df.empty:
+        return empty_bars()
+
+    ts = _timestamps_ms(df.index)
+    cols = _source_columns(df)
+
+    keep = np.isfinite(cols["close"])
+    order = np.argsort(ts[keep], kind="stable")
+    ts = ts[keep][order]
+    cols = {k: v[keep][order] for k, v in cols.items()}
+    if ts.shape[0] == 0:
+        return empty_bars()
+
+    # -----------------------------
+    # Bucket + reduce (one pass per column)
+    # -----------------------------
+    bucket = ts // step * step
+    starts = np.flatnonzero(np.concatenate(([True], bucket[1:] != bucket[:-1])))
+    ends = np.concatenate((starts[1:], [bucket.shape[0]])) - 1
+
+    bar_ts = bucket[starts]
+    bars = {
+        "open": cols["open"][starts],
+        "high": np.maximum.reduceat(cols["high"], starts),
+        "low": np.minimum.reduceat(cols["low"], starts),
+        "close": cols["close"][ends]
+    }
+    filled = np.zeros(bar_ts.shape[0], dtype=bool)
+
+    # -----------------------------
+    # Fill gaps with flat bars
+    # -----------------------------
+    if fill_gaps and bar_ts.shape[0] > 1:
+        full_ts = np.arange(bar_ts[0], bar_ts[-1] + step, step, dtype=np.int64)
+        if full_ts.shape[0] != bar_ts.shape[0]:
+            pos = (bar_ts - bar_ts[0]) // step
+            present = np.zeros(full_ts.shape[0], dtype=bool)
+            present[pos] = True
+
+            # index of the latest real bar at or before each slot
+            last_real = np.maximum.accumulate(np.where(present, np.arange(full_ts.shape[0]), 0))
+            src = np.cumsum(present) - 1
+            prev_close = bars["close"][src[last_real]]
+
+            new = {}
+            for k in OHLC:
+                col = np.empty(full_ts.shape[0])
+                col[present] = bars[k]
+                col[~present] = prev_close[~present]
+                new[k] = col
+            bars, bar_ts, filled = new, full_ts, ~present
+
+    return from_arrays({"timestamp": bar_ts, **bars, "filled": filled})
+
+
+def to_price_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Raw samples (any source) -> the price store's shape: one float64
+    "price" column (the close for OHLC sources), sorted naive-UTC
+    DatetimeIndex named "timestamp".
+    """
+    if df is None or df.empty:
+        return pd.DataFrame({"price": np.empty(0)}, index=pd.DatetimeIndex([], name="timestamp"))
+
+    ts = _timestamps_ms(df.index)
+    price = _source_columns(df)["close"]
+    keep = np.isfinite(price)
+    order = np.argsort(ts[keep], kind="stable")
+
+    return pd.DataFrame(
+        {"price": price[keep][order]},
+        index=pd.DatetimeIndex(pd.to_datetime(ts[keep][order], unit="ms"), name="timestamp")
+    )
+
+
+def empty_bars() -> pd.DataFrame:
+    return from_arrays({
+        "timestamp": np.empty(0, dtype=np.int64),
+        **{k: np.empty(0, dtype=np.float32) for k in OHLC},
+        "filled": np.empty(0, dtype=bool)
+    })
+
+
+def to_arrays(bars: pd.DataFrame) -> dict:
+    """
+    Canonical bars -> compact arrays:
+    timestamp int64 (epoch ms), OHLC float32, filled bool.
+    """
+    return {
+        "timestamp": _timestamps_ms(bars.index),
+        **{k: bars[k].to_numpy(dtype=np.float32) for k in OHLC},
+        "filled": bars["filled"].to_numpy(dtype=bool)
+    }
+
+
+def from_arrays(arrays: dict) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {k: np.asarray(arrays[k], dtype=np.float32) for k in OHLC},
+        index=pd.DatetimeIndex(pd.to_datetime(arrays["timestamp"], unit="ms"), name="timestamp")
+    )
+    df["filled"] = np.asarray(arrays["filled"], dtype=bool)
+    return df
@@ -1,10 +1,356 @@
-from data.sources.coingecko import (
-    fetch_sol_price,
-    fetch_sol_price_history
-)
+# data/router/price_router.py
+"""
+Routes spot / history requests over several price sources.
+
+- per-source health: median latency and error rate over recent calls
+- healthy sources are tried fastest first; failures fail over to the next
+- optional hedging: if the first source has not answered after
+  `hedge_after` seconds, the next one is asked too and the first
+  answer wins
+- circuit breaker: a source that keeps failing is skipped for
+  `cooldown` seconds, then gets a single trial call (half-open)
+
+Sources are plain objects with `name`, `spot(symbol)`,
+`history(symbol, days)` and `history_range(symbol, start_ms, end_ms)`; see CoinGeckoSource / YFinanceSource below and
+data/sources/fake_sources.py for offline fakes.
+"""
+
+import math
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from data.normalize.bars import normalize_bars, to_price_frame
+from data.sources.coingecko import fetch_price_history, fetch_price_history_range, fetch_spot_price
+from data.store.price_store import SUPPORTED_SYMBOLS, sample_granularity
+from telemetry.metrics import record_error, span
+
+# ---------------------------------------
+# CONFIG
+# ---------------------------------------
+HEDGE_AFTER_SECONDS = float(os.environ.get("DEFITUNA_HEDGE_AFTER_SECONDS", "0.75"))
+REQUEST_DEADLINE_SECONDS = 15.0
+
+HEALTH_WINDOW = 50          # recent calls behind the error rate
+LATENCY_WINDOW = 20         # recent calls behind the latency median
+REPROBE_SECONDS = 30.0      # a source idle this long is tried again first
+FAILURE_THRESHOLD = 5       # consecutive failures that open the breaker
+ERROR_RATE_THRESHOLD = 0.5  # ...or this error rate over >= MIN_SAMPLES calls
+MIN_SAMPLES = 10
+COOLDOWN_SECONDS = 30.0
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+# ---------------------------------------
+# REAL SOURCES
+# ---------------------------------------
+class CoinGeckoSource:
+    name = "coingecko"
+
+    def spot(self, symbol: str) -> float:
+        price = fetch_spot_price(SUPPORTED_SYMBOLS[symbol])
+        if price is None:
+            raise ValueError(f"CoinGecko has no spot price for {symbol}")
+        return price
+
+    def history(self, symbol: str, days: int) -> pd.DataFrame:
+        return fetch_price_history(SUPPORTED_SYMBOLS[symbol], days=days)
+
+    def history_range(self, symbol: str, start_ms: int, end_ms: int) -> pd.DataFrame:
+        return fetch_price_history_range(SUPPORTED_SYMBOLS[symbol], start_ms, end_ms)
+
+
+class YFinanceSource:
+    name = "yfinance"
+
+    @staticmethod
+    def _ticker(symbol: str) -> str:
+        return f"{symbol.upper()}-USD"
+
+    def spot(self, symbol: str) -> float:
+        return float(self.history(symbol, days=1)["close"].iloc[-1])
+
+    def history(self, symbol: str, days: int) -> pd.DataFrame:
+        # yfinance is slow to import; only pay for it when it is used
+        from data.sources.yfinance_source import fetch_price_history as fetch_yf
+
+        # Same sample interval CoinGecko picks for `days`, so either source
+        # can fill a store (hourly up to 90 days, daily beyond)
+        return fetch_yf(self._ticker(symbol), days=days, interval=sample_granularity(days))
+
+    def history_range(self, symbol: str, start_ms: int, end_ms: int) -> pd.DataFrame:
+        # yfinance works in whole days back from now; trim to the range
+        days = max(1, math.ceil((time.time() * 1000 - start_ms) / 86_400_000))
+        df = to_price_frame(self.history(symbol, days))
+        return df[(df.index >= pd.to_datetime(start_ms, unit="ms")) & (df.index <= pd.to_datetime(end_ms, unit="ms"))]
+
+
+# ---------------------------------------
+# HEALTH + CIRCUIT BREAKER
+# ---------------------------------------
+class SourceHealth:
+
+    def __init__(
+        self,
+        window: int = HEALTH_WINDOW,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        error_rate_threshold: float = ERROR_RATE_THRESHOLD,
+        cooldown: float = COOLDOWN_SECONDS
+    ):
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.cooldown = cooldown
+
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._outcomes = deque(maxlen=window)
+        self._last_call = 0.0
+        self._consecutive_failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial_inflight = False
+        self._lock = threading.Lock()
+
+    @property
+    def latency(self) -> float | None:
+        """
+        Median of recent call latencies in seconds (None before the
+        first call). A median, so one stalled call does not bury an
+        otherwise fast source.
+        """
+        with self._lock:
+            return statistics.median(self._latencies) if self._latencies else None
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self._outcomes:
+                return 0.0
+            return 1 - sum(self._outcomes) / len(self._outcomes)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                return HALF_OPEN
+            return self._state
+
+    def acquire(self) -> bool:
+        """
+        True if a call may go to this source now. In half-open state
+        only one trial call is let through.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if time.monotonic() - self._opened_at < self.cooldown or self._trial_inflight:
+                return False
+            self._state = HALF_OPEN
+            self._trial_inflight = True
+            return True
+
+    def record(self, ok: bool, latency: float) -> bool:
+        """
+        Returns True if this outcome opened the breaker.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._outcomes.append(ok)
+            self._last_call = time.monotonic()
+            self._trial_inflight = False
+
+            if ok:
+                self._consecutive_failures = 0
+                self._state = CLOSED
+                return False
+
+            self._consecutive_failures += 1
+            errors = len(self._outcomes) - sum(self._outcomes)
+            tripped = (
+                self._state == HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+                or (
+                    len(self._outcomes) >= MIN_SAMPLES
+                    and errors / len(self._outcomes) >= self.error_rate_threshold
+                )
+            )
+            if tripped:
+                opened = self._state != OPEN
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                return opened
+            return False
+
+    def score(self, assumed_latency: float) -> float:
+        """
+        Lower is better: expected latency, penalised by error rate.
+        Sources never called, or idle for REPROBE_SECONDS, are assumed
+        to take `assumed_latency`, so they rank behind sources known to
+        be faster but can still win back traffic from slower ones.
+        """
+        latency = self.latency
+        if latency is None or time.monotonic() - self._last_call >= REPROBE_SECONDS:
+            return assumed_latency
+        return latency * (1 + 4 * self.error_rate)
+
+    def summary(self) -> dict:
+        return {
+            "state": self.state,
+            "latency_ms": None if self.latency is None else round(self.latency * 1000, 1),
+            "error_rate": round(self.error_rate, 3)
+        }
+
+
+# ---------------------------------------
+# ROUTER
+# ---------------------------------------
+class PriceRouter:
+    """
+    hedge_after: seconds before a hedged request goes to the next
+                 source (None disables hedging)
+    deadline:    overall time budget per request
+    """
+
+    def __init__(
+        self,
+        sources,
+        hedge_after: float | None = HEDGE_AFTER_SECONDS,
+        deadline: float = REQUEST_DEADLINE_SECONDS,
+        max_workers: int = 8,
+        **health_kwargs
+    ):
+        self.sources = list(sources)
+        self.hedge_after = hedge_after
+        self.deadline = deadline
+        self.health = {s.name: SourceHealth(**health_kwargs) for s in self.sources}
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="price-router")
+
+    def _ranked(self) -> list:
+        # Ties (e.g. nothing measured yet) keep the configured order
+        assumed = self.hedge_after if self.hedge_after is not None else HEDGE_AFTER_SECONDS
+        return sorted(
+            (s for s in self.sources if self.health[s.name].state != OPEN),
+            key=lambda s: self.health[s.name].score(assumed)
+        )
+
+    def _call(self, source, method: str, args: tuple):
+        # Runs on the pool; a losing hedge still reports its outcome
+        t0 = time.perf_counter()
+        try:
+            with span(f"router.{source.name}"):
+                result = getattr(source, method)(*args)
+        except Exception as e:
+            record_error(source.name, type(e).__name__)
+            if self.health[source.name].record(False, time.perf_counter() - t0):
+                record_error("router", f"{source.name}_breaker_open")
+            raise
+        self.health[source.name].record(True, time.perf_counter() - t0)
+        return result
+
+    def request(self, method: str, *args):
+        """
+        Calls `method` on the best available source, failing over and
+        hedging as configured. Raises RuntimeError if no source answers.
+        """
+        candidates = iter(self._ranked())
+        pending = {}
+        errors = []
+        hedged = False
+        deadline = time.monotonic() + self.deadline
+
+        def launch() -> bool:
+            for source in candidates:
+                if self.health[source.name].acquire():
+                    pending[self._pool.submit(self._call, source, method, args)] = source
+                    return True
+            return False
+
+        if not launch():
+            raise RuntimeError("No healthy price source available")
+        started = time.monotonic()
+
+        while pending:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+
+            timeout = deadline - now
+            hedge_due = self.hedge_after is not None and not hedged
+            if hedge_due:
+                timeout = min(timeout, max(0.0, started + self.hedge_after - now))
+
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                if hedge_due and time.monotonic() >= started + self.hedge_after:
+                    hedged = True
+                    launch()
+                continue
+
+            for future in done:
+                source = pending.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    errors.append(f"{source.name}: {e}")
+                    # Fail over at once, independent of the hedge timer
+                    if not pending:
+                        launch()
+
+        raise RuntimeError(
+            "All price sources failed: " + ("; ".join(errors) or "deadline exceeded")
+        )
+
+    def spot(self, symbol: str) -> float:
+        return self.request("spot", symbol.lower())
+
+    def history(self, symbol: str, days: int = 7, interval: str = "1h") -> pd.DataFrame:
+        """
+        History from whichever source answers, as canonical bars
+        (see data/normalize/bars.py) so sources are interchangeable.
+        """
+        return normalize_bars(self.request("history", symbol.lower(), days), interval=interval)
+
+    def prices(self, symbol: str, days: int = 7) -> pd.DataFrame:
+        """
+        Raw price samples from whichever source answers, in the price
+        store's shape (see normalize.bars.to_price_frame).
+        """
+        return to_price_frame(self.request("history", symbol.lower(), days))
+
+    def prices_range(self, symbol: str, start_ms: int, end_ms: int) -> pd.DataFrame:
+        return to_price_frame(self.request("history_range", symbol.lower(), start_ms, end_ms))
+
+    def status(self) -> dict:
+        return {name: h.summary() for name, h in self.health.items()}
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ---------------------------------------
+# DEFAULT ROUTER
+# ---------------------------------------
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_router() -> PriceRouter:
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = PriceRouter([CoinGeckoSource(), YFinanceSource()])
+        return _router
+
 
 def get_sol_price():
-    return fetch_sol_price()
+    return get_router().spot("sol")
+
 
 def get_sol_price_history(days=200):
-    return fetch_sol_price_history(days)
+    return get_router().history("sol", days=days)
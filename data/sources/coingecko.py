@@ -1,18 +1,40 @@
-import requests
+import os
+import threading
+
 import pandas as pd
 from datetime import datetime
 
-BASE_URL = "https://api.coingecko.com/api/v3"
+from data.sources.http_client import SourceClient
 
-def fetch_price_history(symbol: str, days: int = 7) -> pd.DataFrame:
-    symbol = symbol.lower()
-    url = f"{BASE_URL}/coins/{symbol}/market_chart"
-    params = {"vs_currency": "usd", "days": days}
+BASE_URL = os.environ.get("COINGECKO_BASE_URL", "https://api.coingecko.com/api/v3")
+
+# ---------------------------------------
+# CLIENT CONFIG (free tier ≈ 30 calls/min)
+# ---------------------------------------
+RATE_PER_SEC = float(os.environ.get("COINGECKO_RATE_PER_SEC", "0.5"))
+RATE_BURST = int(os.environ.get("COINGECKO_RATE_BURST", "5"))
+
+HISTORY_CACHE_SECONDS = 60
+SPOT_CACHE_SECONDS = 5
+
+_client = None
+_client_lock = threading.Lock()
 
-    r = requests.get(url, params=params, timeout=10)
-    r.raise_for_status()
 
-    prices = r.json().get("prices", [])
+def get_client() -> SourceClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SourceClient(
+                BASE_URL,
+                name="coingecko",
+                rate_per_sec=RATE_PER_SEC,
+                burst=RATE_BURST
+            )
+        return _client
+
+
+def _prices_to_frame(prices) -> pd.DataFrame:
     if not prices:
         return pd.DataFrame()
 
@@ -21,3 +43,47 @@ def fetch_price_history(symbol: str, days: int = 7) -> pd.DataFrame:
     df.set_index("timestamp", inplace=True)
 
     return df
+
+
+def fetch_price_history(symbol: str, days: int = 7) -> pd.DataFrame:
+    symbol = symbol.lower()
+    payload = get_client().get_json(
+        f"coins/{symbol}/market_chart",
+        params={"vs_currency": "usd", "days": days},
+        cache_ttl=HISTORY_CACHE_SECONDS
+    )
+
+    return _prices_to_frame(payload.get("prices", []))
+
+
+def fetch_price_history_range(symbol: str, start_ms: int, end_ms: int) -> pd.DataFrame:
+    """
+    Bars between two epoch-millisecond timestamps (used for tail refreshes).
+    """
+    symbol = symbol.lower()
+    payload = get_client().get_json(
+        f"coins/{symbol}/market_chart/range",
+        params={
+            "vs_currency": "usd",
+            "from": int(start_ms // 1000),
+            "to": int(end_ms // 1000)
+        },
+        cache_ttl=HISTORY_CACHE_SECONDS
+    )
+
+    return _prices_to_frame(payload.get("prices", []))
+
+
+def fetch_spot_price(symbol: str) -> float | None:
+    """
+    Latest USD price from the lightweight simple/price endpoint.
+    """
+    symbol = symbol.lower()
+    payload = get_client().get_json(
+        "simple/price",
+        params={"ids": symbol, "vs_currencies": "usd"},
+        cache_ttl=SPOT_CACHE_SECONDS
+    )
+
+    price = payload.get(symbol, {}).get("usd")
+    return float(price) if price is not None else None
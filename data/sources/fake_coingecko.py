@@ -0,0 +1,147 @@
+# data/sources/fake_coingecko.py
+"""
+Local stand-in for the CoinGecko endpoints we use, for offline
+benchmarks and tests.
+
+    python -m data.sources.fake_coingecko --port 8765 --latency-ms 40 --error-rate 0.05
+    COINGECKO_BASE_URL=http://127.0.0.1:8765/api/v3 streamlit run app/main.py
+
+Prices are a deterministic function of time, so full-window and
+range requests always agree with each other.
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DAY_MS = 86_400_000
+BASE_PRICES = {"solana": 150.0, "bitcoin": 60000.0, "ethereum": 3000.0}
+
+
+def synthetic_price(coin_id: str, ts_ms: int) -> float:
+    base = BASE_PRICES.get(coin_id, 10.0)
+    t = ts_ms / DAY_MS
+    return base * (
+        1.0
+        + 0.08 * math.sin(2 * math.pi * t / 30)
+        + 0.03 * math.sin(2 * math.pi * t / 3)
+        + 0.01 * math.sin(2 * math.pi * t * 8)
+    )
+
+
+def _granularity_ms(span_ms: int) -> int:
+    # Mirrors CoinGecko's automatic granularity
+    if span_ms <= DAY_MS:
+        return 5 * 60 * 1000
+    if span_ms <= 90 * DAY_MS:
+        return 60 * 60 * 1000
+    return DAY_MS
+
+
+def synthetic_series(coin_id: str, start_ms: int, end_ms: int) -> list:
+    step = _granularity_ms(end_ms - start_ms)
+    first = (start_ms // step + 1) * step
+    return [
+        [ts, round(synthetic_price(coin_id, ts), 6)]
+        for ts in range(first, end_ms + 1, step)
+    ]
+
+
+class FakeCoinGeckoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload: dict, headers: dict | None = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.request_count += 1
+
+        if server.latency_ms:
+            time.sleep(server.latency_ms / 1000)
+
+        if server.error_rate and random.random() < server.error_rate:
+            return self._send(429, {"error": "rate limited"}, {"Retry-After": "0"})
+
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        parts = [p for p in url.path.split("/") if p]
+        now_ms = int(time.time() * 1000)
+
+        # /api/v3/simple/price?ids=solana&vs_currencies=usd
+        if parts[-2:] == ["simple", "price"]:
+            ids = query.get("ids", "").split(",")
+            return self._send(200, {
+                coin: {"usd": round(synthetic_price(coin, now_ms), 6)}
+                for coin in ids if coin
+            })
+
+        # /api/v3/coins/<id>/market_chart[/range]
+        if "coins" in parts:
+            coin_id = parts[parts.index("coins") + 1]
+
+            if parts[-1] == "market_chart":
+                days = float(query.get("days", 1))
+                prices = synthetic_series(coin_id, now_ms - int(days * DAY_MS), now_ms)
+                return self._send(200, {"prices": prices})
+
+            if parts[-2:] == ["market_chart", "range"]:
+                start_ms = int(query.get("from", 0)) * 1000
+                end_ms = min(int(query.get("to", 0)) * 1000, now_ms)
+                return self._send(200, {"prices": synthetic_series(coin_id, start_ms, end_ms)})
+
+        self._send(404, {"error": "not found"})
+
+
+def serve(host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0, error_rate: float = 0.0):
+    """
+    Starts the fake server on a daemon thread.
+    Returns (server, base_url); call server.shutdown() to stop.
+    """
+    server = ThreadingHTTPServer((host, port), FakeCoinGeckoHandler)
+    server.daemon_threads = True
+    server.latency_ms = latency_ms
+    server.error_rate = error_rate
+    server.request_count = 0
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, f"http://{host}:{server.server_address[1]}/api/v3"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake CoinGecko API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, base_url = serve(args.host, args.port, args.latency_ms, args.error_rate)
+    print(f"Fake CoinGecko listening on {base_url}")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
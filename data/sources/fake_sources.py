@@ -0,0 +1,95 @@
+# data/sources/fake_sources.py
+"""
+In-process price sources with controllable latency and failures, for
+exercising data/router/price_router.py offline.
+
+    fast = FakePriceSource("fast", latency_ms=20)
+    flaky = FakePriceSource("flaky", latency_ms=20, tail_ms=2000, tail_rate=0.1)
+    router = PriceRouter([flaky, fast], hedge_after=0.1)
+
+Prices come from fake_coingecko.synthetic_price, so every fake agrees
+with the others and with the fake HTTP server.
+"""
+
+import random
+import threading
+import time
+
+import pandas as pd
+
+from data.sources.fake_coingecko import synthetic_price
+from data.store.price_store import SUPPORTED_SYMBOLS
+
+HOUR_MS = 3_600_000
+
+
+class FakePriceSource:
+    """
+    Same interface as the router's real sources (name, spot, history,
+    history_range).
+
+    latency_ms: base latency of every call
+    tail_ms:    extra latency added to a `tail_rate` fraction of calls
+    error_rate: fraction of calls that raise ConnectionError
+    """
+
+    def __init__(
+        self,
+        name: str,
+        latency_ms: float = 0.0,
+        tail_ms: float = 0.0,
+        tail_rate: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = None
+    ):
+        self.name = name
+        self.latency_ms = latency_ms
+        self.tail_ms = tail_ms
+        self.tail_rate = tail_rate
+        self.error_rate = error_rate
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def degrade(self, **settings):
+        """
+        Change latency_ms / tail_ms / tail_rate / error_rate on the fly.
+        """
+        with self._lock:
+            for k, v in settings.items():
+                if not hasattr(self, k):
+                    raise AttributeError(k)
+                setattr(self, k, v)
+
+    def _behave(self):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency_ms
+            if self._rng.random() < self.tail_rate:
+                delay += self.tail_ms
+            fail = self._rng.random() < self.error_rate
+
+        time.sleep(delay / 1000)
+        if fail:
+            raise ConnectionError(f"{self.name}: injected failure")
+
+    def spot(self, symbol: str) -> float:
+        self._behave()
+        coin_id = SUPPORTED_SYMBOLS.get(symbol, symbol)
+        return synthetic_price(coin_id, int(time.time() * 1000))
+
+    def history(self, symbol: str, days: int) -> pd.DataFrame:
+        end = int(time.time() * 1000) // HOUR_MS * HOUR_MS
+        return self.history_range(symbol, end - days * 24 * HOUR_MS, end)
+
+    def history_range(self, symbol: str, start_ms: int, end_ms: int) -> pd.DataFrame:
+        self._behave()
+        coin_id = SUPPORTED_SYMBOLS.get(symbol, symbol)
+        first = -(-start_ms // HOUR_MS) * HOUR_MS
+        stamps = range(first, end_ms + 1, HOUR_MS)
+
+        df = pd.DataFrame({
+            "timestamp": pd.to_datetime(list(stamps), unit="ms"),
+            "price": [synthetic_price(coin_id, ts) for ts in stamps]
+        })
+        return df.set_index("timestamp")
@@ -0,0 +1,167 @@
+# data/sources/http_client.py
+
+import random
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from telemetry.metrics import record_cache, record_error, span
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens per second, up to `capacity` banked.
+    acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                wait = (1.0 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class SourceClient:
+    """
+    Shared HTTP client for a data source:
+    - pooled keep-alive connections (one Session)
+    - token-bucket rate limit
+    - jittered exponential backoff on 429/5xx and network errors
+    - small TTL response cache keyed on (path, params)
+
+    `name` labels this source's timings, cache ratio and error counts.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        name: str = "http",
+        rate_per_sec: float = 0.5,
+        burst: int = 5,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        timeout: float = 10.0,
+        pool_size: int = 10,
+        cache_size: int = 256
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.name = name
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate_per_sec, burst)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._cache = OrderedDict()  # key -> (expires_at, payload)
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
+    # -----------------------------
+    # RESPONSE CACHE
+    # -----------------------------
+    @staticmethod
+    def _cache_key(path: str, params: dict | None) -> tuple:
+        return path, tuple(sorted((params or {}).items()))
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is None:
+                return None
+            if hit[0] < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return hit[1]
+
+    def _cache_put(self, key, payload, ttl: float):
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, payload)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+    # -----------------------------
+    # REQUESTS
+    # -----------------------------
+    def _backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        if retry_after:
+            try:
+                return min(self.backoff_cap, float(retry_after))
+            except ValueError:
+                pass
+        # Full jitter: uniform(0, base * 2^attempt)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def get_json(self, path: str, params: dict | None = None, cache_ttl: float = 0.0):
+        key = self._cache_key(path, params)
+        if cache_ttl > 0:
+            cached = self._cache_get(key)
+            record_cache(self.name, cached is not None)
+            if cached is not None:
+                return cached
+
+        url = f"{self.base_url}/{path.lstrip('/')}"
+
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            last_try = attempt == self.max_retries
+
+            try:
+                with span(f"source.{self.name}"):
+                    r = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                record_error(self.name, type(e).__name__)
+                if last_try:
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+
+            if r.status_code >= 400:
+                record_error(self.name, str(r.status_code))
+
+            if r.status_code in RETRY_STATUS and not last_try:
+                time.sleep(self._backoff(attempt, r.headers.get("Retry-After")))
+                continue
+
+            r.raise_for_status()
+            payload = r.json()
+
+            if cache_ttl > 0:
+                self._cache_put(key, payload, cache_ttl)
+
+            return payload
@@ -1,19 +1,29 @@
 import yfinance as yf
 import pandas as pd
 
+from telemetry.metrics import record_error, span
 
-def fetch_price_history(symbol: str, days: int = 7) -> pd.DataFrame:
+
+def fetch_price_history(symbol: str, days: int = 7, interval: str = "1h") -> pd.DataFrame:
+    # yfinance serves 1h bars for the last ~730 days only; use "1d" beyond
     try:
         ticker = yf.Ticker(symbol)
-        df = ticker.history(period=f"{days}d", interval="1h")
+        with span("source.yfinance"):
+            df = ticker.history(period=f"{days}d", interval=interval)
 
         if df.empty:
             raise ValueError("Empty data from yFinance")
 
-        df = df.rename(columns={"Close": "close"})
-        df = df[["close"]]
+        df = df.rename(columns={
+            "Open": "open",
+            "High": "high",
+            "Low": "low",
+            "Close": "close"
+        })
+        df = df[["open", "high", "low", "close"]]
 
         return df
 
     except Exception as e:
+        record_error("yfinance", type(e).__name__)
         raise RuntimeError(f"yFinance price fetch failed: {e}")
@@ -1 +1,17 @@
-from .price_store import get_current_price, get_price_history
+# Re-exports resolve on first access (PEP 562), so importing a light
+# module such as data.store.snapshot_store does not load pandas and the
+# HTTP sources behind price_store.
+_LAZY = {
+    "get_current_price": "price_store",
+    "get_price_history": "price_store",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,222 @@
+# data/store/column_file.py
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
+
+META_FILE = "meta.json"
+LOCK_FILE = ".lock"
+
+
+class ColumnFile:
+    """
+    Append-only columnar series on disk.
+
+    Layout (one directory per series):
+        meta.json              -> {"rows", "high_water", "generation", ...}
+        <column>.<gen>.bin     -> raw little-endian values, one file per column
+
+    Readers only trust meta["rows"], so a writer that dies mid-append
+    never exposes a torn tail. Rewrites go to a new generation and are
+    published by swapping meta.json, so open memory maps stay valid.
+    Other meta keys belong to the caller (see update_meta) and survive
+    appends and rewrites.
+    """
+
+    def __init__(self, path: str, schema: dict, key: str = "timestamp"):
+        self.path = path
+        self.key = key
+        self.schema = {name: np.dtype(dtype).newbyteorder("<") for name, dtype in schema.items()}
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_fd = None
+        os.makedirs(path, exist_ok=True)
+
+    # -----------------------------
+    # LOCKING (threads + processes)
+    # -----------------------------
+    @contextmanager
+    def lock(self):
+        with self._thread_lock:
+            if self._lock_depth == 0:
+                self._lock_fd = open(os.path.join(self.path, LOCK_FILE), "a+")
+                if fcntl is not None:
+                    fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    if fcntl is not None:
+                        fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_UN)
+                    self._lock_fd.close()
+                    self._lock_fd = None
+
+    # -----------------------------
+    # META
+    # -----------------------------
+    def read_meta(self) -> dict:
+        try:
+            with open(os.path.join(self.path, META_FILE)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"rows": 0, "high_water": None, "generation": 0}
+
+    def _write_meta(self, meta: dict):
+        final = os.path.join(self.path, META_FILE)
+        tmp = f"{final}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, final)
+
+    def update_meta(self, **fields):
+        """
+        Set caller-owned meta keys (e.g. when the series was last synced).
+        """
+        with self.lock():
+            self._write_meta({**self.read_meta(), **fields})
+
+    def _column_path(self, name: str, generation: int) -> str:
+        return os.path.join(self.path, f"{name}.{generation}.bin")
+
+    # -----------------------------
+    # WRITE
+    # -----------------------------
+    def _coerce(self, columns: dict) -> dict:
+        arrays = {
+            name: np.ascontiguousarray(columns[name], dtype=dtype)
+            for name, dtype in self.schema.items()
+        }
+        lengths = {len(a) for a in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Column length mismatch: {lengths}")
+        return arrays
+
+    def append(self, columns: dict, replace_last: bool = False) -> int:
+        """
+        Append rows whose key is strictly above the high-water mark.
+        replace_last: a first row whose key equals the high-water mark
+        replaces the last row instead of being dropped.
+        Returns the number of rows written.
+        """
+        arrays = self._coerce(columns)
+
+        with self.lock():
+            meta = self.read_meta()
+            high_water = meta["high_water"]
+
+            if replace_last and meta["rows"] and len(arrays[self.key]) and arrays[self.key][0] == high_water:
+                # Unpublish the old last row first, so readers that follow
+                # meta never see it half overwritten
+                rows = meta["rows"] - 1
+                keys = self._map(self.key, meta["generation"], meta["rows"])
+                high_water = keys[rows - 1].item() if rows else None
+                del keys
+                meta = {**meta, "rows": rows, "high_water": high_water}
+                self._write_meta(meta)
+
+            if high_water is not None:
+                keep = arrays[self.key] > high_water
+                arrays = {name: a[keep] for name, a in arrays.items()}
+
+            n = len(arrays[self.key])
+            if n == 0:
+                return 0
+
+            rows = meta["rows"]
+            generation = meta["generation"]
+
+            for name, arr in arrays.items():
+                path = self._column_path(name, generation)
+                mode = "r+b" if os.path.exists(path) else "w+b"
+                with open(path, mode) as f:
+                    # Overwrite anything past the committed rows (torn tail)
+                    f.seek(rows * arr.itemsize)
+                    f.write(arr.tobytes())
+                    f.truncate()
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            self._write_meta({
+                **meta,
+                "rows": rows + n,
+                "high_water": arrays[self.key][-1].item(),
+                "generation": generation
+            })
+            return n
+
+    def rewrite(self, columns: dict):
+        """
+        Replace the whole series (e.g. after a backfill) as a new generation.
+        """
+        arrays = self._coerce(columns)
+
+        with self.lock():
+            old = self.read_meta()
+            generation = old["generation"] + 1
+
+            for name, arr in arrays.items():
+                with open(self._column_path(name, generation), "wb") as f:
+                    f.write(arr.tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            n = len(arrays[self.key])
+            self._write_meta({
+                **old,
+                "rows": n,
+                "high_water": arrays[self.key][-1].item() if n else None,
+                "generation": generation
+            })
+
+            # Readers holding maps of the old generation keep them (POSIX)
+            for name in self.schema:
+                try:
+                    os.remove(self._column_path(name, old["generation"]))
+                except FileNotFoundError:
+                    pass
+
+    # -----------------------------
+    # READ
+    # -----------------------------
+    def read(self, columns=None) -> dict:
+        """
+        Returns {column: read-only array} for the committed rows,
+        memory-mapped from disk.
+        """
+        names = list(columns) if columns is not None else list(self.schema)
+
+        for attempt in range(2):
+            meta = self.read_meta()
+            rows = meta["rows"]
+            try:
+                return {
+                    name: self._map(name, meta["generation"], rows)
+                    for name in names
+                }
+            except FileNotFoundError:
+                # A concurrent rewrite swapped generations under us
+                if attempt:
+                    raise
+
+    def _map(self, name: str, generation: int, rows: int) -> np.ndarray:
+        dtype = self.schema[name]
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(
+            self._column_path(name, generation),
+            dtype=dtype,
+            mode="r",
+            shape=(rows,)
+        )
@@ -0,0 +1,12 @@
+# data/store/paths.py
+"""
+Local store location, kept dependency-free so snapshot readers can
+find the store without importing pandas or the HTTP sources.
+"""
+
+import os
+
+STORE_DIR = os.environ.get(
+    "DEFITUNA_STORE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "defituna")
+)
@@ -0,0 +1,340 @@
+# data/store/pipeline_history.py
+"""
+Append-only history of pipeline outputs (TA, market state, fusion,
+ranges, scenarios), so recommendations can be charted over time.
+
+Layout (one ColumnFile per segment):
+    <HISTORY_DIR>/<symbol>/<YYYY-MM-DD>/<column>.<gen>.bin
+
+Rows are keyed by the pipeline's last bar (ms) and written to that
+day's segment; re-recording the same bar replaces its row, so each bar
+keeps the latest (most complete) run inside it. A segment covers
+its first day up to the next segment's first day, so compaction can
+merge closed days into one segment without readers seeing gaps or
+duplicates.
+
+Reads map only the segments and columns asked for:
+    state_as_of(symbol, when)       -> last recorded row at or before `when`
+    history(symbol, start, end)     -> DataFrame of rows in [start, end]
+
+apply_retention() drops segments past the retention window and merges
+(and thins) older closed days, so disk use stays bounded.
+"""
+
+import os
+import shutil
+import time
+from bisect import bisect_right
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from data.store.column_file import ColumnFile
+from data.store.paths import STORE_DIR
+
+# ---------------------------------------
+# CONFIG
+# ---------------------------------------
+HISTORY_DIR = os.path.join(STORE_DIR, "history")
+
+RETENTION_DAYS = 180
+COMPACT_AFTER_DAYS = 7               # closed days older than this are merged...
+COMPACT_SPACING_SECONDS = 3600       # ...keeping at most one row per hour
+
+DAY_MS = 86_400_000
+MODES = ("Defensive", "Balanced", "Aggressive")
+
+# column -> (dtype, path into the run_pipeline output)
+COLUMNS = {
+    "timestamp": ("int64", None),
+    "recorded_ms": ("int64", None),
+    "current_price": ("float64", ("current_price",)),
+    "volatility_pct": ("float64", ("volatility_pct",)),
+    "regime": ("S16", ("regime",)),
+    "ta_score": ("float64", ("ta", "ta_score")),
+    "ta_trend": ("S16", ("ta", "trend")),
+    "ta_volatility": ("S16", ("ta", "volatility")),
+    "state_direction": ("S16", ("market_state", "direction")),
+    "state_regime": ("S16", ("market_state", "regime")),
+    "state_confidence": ("float64", ("market_state", "confidence")),
+    "fusion_direction": ("S16", ("fusion", "direction")),
+    "fusion_confidence": ("float64", ("fusion", "confidence")),
+    "fusion_ta_score": ("float64", ("fusion", "ta_score")),
+}
+for _mode in MODES:
+    _m = _mode.lower()
+    COLUMNS.update({
+        f"{_m}_allocation": ("float64", ("multi_ranges", "allocation", _mode)),
+        f"{_m}_range_low": ("float64", ("multi_ranges", "ranges", _mode, "range_low")),
+        f"{_m}_range_high": ("float64", ("multi_ranges", "ranges", _mode, "range_high")),
+        f"{_m}_width_pct": ("float64", ("multi_ranges", "ranges", _mode, "width_pct")),
+        f"{_m}_allocated_usd": ("float64", ("scenarios", _mode, "allocated_usd")),
+        f"{_m}_fees_7d": ("float64", ("scenarios", _mode, "fees_7d")),
+        f"{_m}_price_appreciation": ("float64", ("scenarios", _mode, "price_appreciation")),
+        f"{_m}_net_scenario": ("float64", ("scenarios", _mode, "net_scenario")),
+    })
+
+SCHEMA = {name: dtype for name, (dtype, _) in COLUMNS.items()}
+
+
+# ---------------------------------------
+# HELPERS
+# ---------------------------------------
+def to_ms(when) -> int:
+    """
+    ms / datetime / pandas Timestamp / ISO string -> epoch ms.
+    Naive values are taken as UTC (as in the price store).
+    """
+    if isinstance(when, (int, np.integer)):
+        return int(when)
+    ts = pd.Timestamp(when)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return int(ts.value // 1_000_000)
+
+
+def _day(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _day_start_ms(day: str) -> int:
+    return int(datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def _lookup(output: dict, path: tuple):
+    value = output
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def flatten(pipeline: dict, recorded_ms: int) -> dict:
+    """
+    One run_pipeline output -> {column: value}. Missing numbers become
+    NaN and missing labels "".
+    """
+    row = {"timestamp": to_ms(pipeline["last_bar"]), "recorded_ms": recorded_ms}
+    for name, (dtype, path) in COLUMNS.items():
+        if path is None:
+            continue
+        value = _lookup(pipeline, path)
+        if dtype.startswith("S"):
+            row[name] = "" if value is None else str(value)
+        else:
+            row[name] = np.nan if value is None else float(value)
+    return row
+
+
+def _decode(arr: np.ndarray) -> np.ndarray:
+    return np.char.decode(arr, "utf-8") if arr.dtype.kind == "S" else arr
+
+
+# ---------------------------------------
+# STORE
+# ---------------------------------------
+class PipelineHistory:
+
+    def __init__(self, directory: str = HISTORY_DIR):
+        self.directory = directory
+
+    def _symbol_dir(self, symbol: str) -> str:
+        return os.path.join(self.directory, symbol.lower())
+
+    def segments(self, symbol: str) -> list:
+        """
+        Segment names (first day covered), oldest first.
+        """
+        try:
+            names = os.listdir(self._symbol_dir(symbol))
+        except FileNotFoundError:
+            return []
+        return sorted(n for n in names if not n.startswith("."))
+
+    def _segment(self, symbol: str, name: str) -> ColumnFile:
+        return ColumnFile(os.path.join(self._symbol_dir(symbol), name), SCHEMA)
+
+    def _read_segment(self, symbol: str, segments: list, i: int, columns: list) -> dict:
+        # Rows from before the segment's first day or from the next
+        # segment's range (mid-compaction) are not this segment's
+        cols = self._segment(symbol, segments[i]).read(["timestamp", *columns])
+        ts = cols["timestamp"]
+        lo = np.searchsorted(ts, _day_start_ms(segments[i]), side="left")
+        hi = len(ts)
+        if i + 1 < len(segments):
+            hi = np.searchsorted(ts, _day_start_ms(segments[i + 1]), side="left")
+        return {name: arr[lo:hi] for name, arr in cols.items()}
+
+    # -----------------------------
+    # WRITE
+    # -----------------------------
+    def record(self, symbol: str, pipeline: dict, recorded_ms: int | None = None) -> int:
+        """
+        Appends one pipeline output, replacing the row of the same last
+        bar if it is the newest one. Returns rows written.
+        """
+        recorded_ms = int(time.time() * 1000) if recorded_ms is None else recorded_ms
+        row = flatten(pipeline, recorded_ms)
+
+        # Bars only move forward; a late row for an older, already
+        # closed day is dropped rather than reopening that segment
+        segments = self.segments(symbol)
+        day = _day(row["timestamp"])
+        if segments and day < segments[-1]:
+            return 0
+
+        store = self._segment(symbol, day)
+        return store.append({name: [value] for name, value in row.items()}, replace_last=True)
+
+    # -----------------------------
+    # READ
+    # -----------------------------
+    def state_as_of(self, symbol: str, when, columns=None) -> dict | None:
+        """
+        The last recorded row with timestamp <= `when`, or None.
+        """
+        when_ms = to_ms(when)
+        columns = [c for c in (columns or SCHEMA) if c != "timestamp"]
+        segments = self.segments(symbol)
+
+        i = bisect_right(segments, _day(when_ms)) - 1
+        while i >= 0:
+            cols = self._read_segment(symbol, segments, i, columns)
+            j = int(np.searchsorted(cols["timestamp"], when_ms, side="right")) - 1
+            if j >= 0:
+                return {name: _decode(arr[j:j + 1])[0].item() for name, arr in cols.items()}
+            i -= 1
+        return None
+
+    def history(self, symbol: str, start, end=None, columns=None) -> pd.DataFrame:
+        """
+        Rows with start <= timestamp <= end (end defaults to now),
+        indexed by timestamp (naive UTC, as in the price store).
+        """
+        start_ms = to_ms(start)
+        end_ms = int(time.time() * 1000) if end is None else to_ms(end)
+        columns = [c for c in (columns or SCHEMA) if c != "timestamp"]
+        segments = self.segments(symbol)
+
+        first = max(0, bisect_right(segments, _day(start_ms)) - 1)
+        last = bisect_right(segments, _day(end_ms))
+
+        parts = []
+        for i in range(first, last):
+            cols = self._read_segment(symbol, segments, i, columns)
+            ts = cols["timestamp"]
+            lo = np.searchsorted(ts, start_ms, side="left")
+            hi = np.searchsorted(ts, end_ms, side="right")
+            if hi > lo:
+                parts.append({name: _decode(arr[lo:hi]) for name, arr in cols.items()})
+
+        if not parts:
+            return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name="timestamp"))
+
+        merged = {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}
+        ts = merged.pop("timestamp")
+        df = pd.DataFrame(merged, index=pd.to_datetime(ts, unit="ms"))
+        df.index.name = "timestamp"
+        return df
+
+    # -----------------------------
+    # RETENTION + COMPACTION
+    # -----------------------------
+    def apply_retention(
+        self,
+        symbol: str,
+        now=None,
+        retention_days: float = RETENTION_DAYS,
+        compact_after_days: float = COMPACT_AFTER_DAYS,
+        spacing_seconds: float = COMPACT_SPACING_SECONDS
+    ) -> dict:
+        """
+        Drops segments that ended before the retention window, then
+        merges closed day segments older than `compact_after_days`
+        into one segment per month, keeping the last row per
+        `spacing_seconds` bucket.
+        """
+        now_ms = int(time.time() * 1000) if now is None else to_ms(now)
+        root = self._symbol_dir(symbol)
+        segments = self.segments(symbol)
+        summary = {"dropped": 0, "compacted": 0}
+
+        # Retention: a segment is gone once its successor starts before the cutoff
+        cutoff = _day(now_ms - int(retention_days * DAY_MS))
+        while len(segments) > 1 and segments[1] <= cutoff:
+            shutil.rmtree(os.path.join(root, segments.pop(0)), ignore_errors=True)
+            summary["dropped"] += 1
+
+        # Compaction: group closed, old segments by month (never the newest segment)
+        closed_before = _day(now_ms - int(compact_after_days * DAY_MS))
+        groups = {}
+        for name in segments[:-1]:
+            if name < closed_before:
+                groups.setdefault(name[:7], []).append(name)
+
+        spacing_ms = int(spacing_seconds * 1000)
+        for names in groups.values():
+            if len(names) < 2 and not self._needs_thinning(symbol, names[0], spacing_ms):
+                continue
+            self._merge(symbol, names, spacing_ms)
+            summary["compacted"] += len(names)
+
+        return summary
+
+    def _needs_thinning(self, symbol: str, name: str, spacing_ms: int) -> bool:
+        ts = self._segment(symbol, name).read(["timestamp"])["timestamp"]
+        buckets = ts // spacing_ms
+        return bool(len(buckets) > 1 and (buckets[1:] == buckets[:-1]).any())
+
+    def _merge(self, symbol: str, names: list, spacing_ms: int):
+        root = self._symbol_dir(symbol)
+        segments = self.segments(symbol)
+
+        parts = [self._read_segment(symbol, segments, segments.index(n), list(SCHEMA)) for n in names]
+        merged = {name: np.concatenate([p[name] for p in parts]) for name in SCHEMA}
+
+        buckets = merged["timestamp"] // spacing_ms
+        keep = np.r_[buckets[1:] != buckets[:-1], True]
+        merged = {name: arr[keep] for name, arr in merged.items()}
+
+        # rewrite() publishes a new generation by swapping meta.json, so
+        # readers see the first day's rows or the merged rows, never a
+        # partial segment; until the merged days are removed, readers
+        # clip the merged segment to its own range, so no row shows twice
+        self._segment(symbol, names[0]).rewrite(merged)
+        for name in names[1:]:
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+    def disk_usage(self, symbol: str) -> int:
+        total = 0
+        for dirpath, _, files in os.walk(self._symbol_dir(symbol)):
+            for f in files:
+                try:
+                    total += os.path.getsize(os.path.join(dirpath, f))
+                except FileNotFoundError:
+                    pass
+        return total
+
+
+# ---------------------------------------
+# DEFAULT STORE
+# ---------------------------------------
+_history = PipelineHistory()
+
+
+def record_pipeline(symbol: str, pipeline: dict, recorded_ms: int | None = None) -> int:
+    return _history.record(symbol, pipeline, recorded_ms)
+
+
+def state_as_of(symbol: str, when, columns=None) -> dict | None:
+    return _history.state_as_of(symbol, when, columns)
+
+
+def history(symbol: str, start, end=None, columns=None) -> pd.DataFrame:
+    return _history.history(symbol, start, end, columns)
+
+
+def apply_retention(symbol: str, now=None, **kwargs) -> dict:
+    return _history.apply_retention(symbol, now, **kwargs)
@@ -1,20 +1,325 @@
+import os
+import threading
+import time
+
+import numpy as np
 import pandas as pd
-from data.sources.coingecko import fetch_price_history
+from data.normalize.bars import normalize_bars
+from data.store.column_file import ColumnFile
+from data.store.paths import STORE_DIR
+from telemetry.metrics import record_cache
 
 SUPPORTED_SYMBOLS = {
-    "sol": "solana"
+    "sol": "solana",
+    "btc": "bitcoin",
+    "eth": "ethereum",
+    "jup": "jupiter-exchange-solana",
+    "jto": "jito-governance-token",
+    "ray": "raydium",
+    "bonk": "bonk",
+    "wif": "dogwifcoin"
 }
 
+# ---------------------------------------
+# CONFIG
+# ---------------------------------------
+PRICE_DIR = os.path.join(STORE_DIR, "prices")
+
+# CoinGecko's market_chart picks the sample interval from `days`:
+# 5-minute for 1 day, hourly up to 90 days, daily beyond. Each interval
+# gets its own store, so a long daily backfill never leaves a short
+# window reading daily points (nor a short one truncating a long one).
+#
+# A store holds one row per closed bucket of its granularity (keyed by
+# bucket-open time, price = the bucket's last sample), whatever the
+# source returned. The still-open bucket's latest sample is kept in
+# meta["open"] instead, so it can be replaced until the bucket closes.
+GRANULARITY_MS = {"1h": 3_600_000, "1d": 86_400_000}
+GRANULARITIES = tuple(GRANULARITY_MS)
+HOURLY_MAX_DAYS = 90
+
+TAIL_REFRESH_SECONDS = 60      # min time since the last sync before asking for more
+BACKFILL_TOLERANCE_MS = 86_400_000  # first bar may sit up to one bar (1d) past the window start
+
+SPOT_TTL_SECONDS = float(os.environ.get("DEFITUNA_SPOT_TTL_SECONDS", "15"))
+
+PRICE_SCHEMA = {"timestamp": "int64", "price": "float64"}
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+# ---------------------------------------
+# SPOT CACHE + IN-FLIGHT REQUESTS
+# ---------------------------------------
+_spot_cache = {}     # symbol -> (fetched_at, price)
+_inflight = {}       # symbol -> {"event", "result", "error"}
+_inflight_lock = threading.Lock()
+
+
+def sample_granularity(days: int) -> str:
+    """
+    "1h" or "1d": the sample interval a `days`-long window is stored at,
+    and the interval every source is asked for.
+    """
+    return "1h" if days <= HOURLY_MAX_DAYS else "1d"
+
+
+def _get_store(symbol: str, granularity: str = "1h") -> ColumnFile:
+    with _stores_lock:
+        store = _stores.get((symbol, granularity))
+        if store is None:
+            store = ColumnFile(os.path.join(PRICE_DIR, granularity, symbol), PRICE_SCHEMA)
+            _stores[(symbol, granularity)] = store
+        return store
+
+
+def _bucket(df: pd.DataFrame, granularity: str, now_ms: int):
+    """
+    Raw samples (sorted, see normalize.bars.to_price_frame) -> store
+    columns for the closed buckets, plus the open bucket's latest
+    sample as [timestamp, price] (None if the frame has none).
+    """
+    if df.empty:
+        return {"timestamp": np.empty(0, dtype="int64"), "price": np.empty(0)}, None
+
+    step = GRANULARITY_MS[granularity]
+    ts = df.index.as_unit("ms").asi8
+    price = df["price"].to_numpy(dtype="float64")
+
+    bucket = ts // step * step
+    last = np.flatnonzero(np.append(bucket[1:] != bucket[:-1], True))
+    ts, bucket, price = ts[last], bucket[last], price[last]
+
+    closed = bucket + step <= now_ms
+    open_sample = [int(ts[~closed][-1]), float(price[~closed][-1])] if not closed.all() else None
+    return {"timestamp": bucket[closed], "price": price[closed]}, open_sample
+
+
+def _open_sample(meta: dict, granularity: str):
+    # Latest sample of the bucket after the last stored one, if any
+    sample = meta.get("open")
+    if sample is None:
+        return None
+    if meta["high_water"] is not None and sample[0] < meta["high_water"] + GRANULARITY_MS[granularity]:
+        return None
+    return sample
+
+
+def _synced_at(meta: dict) -> int:
+    # When the store last heard from a source. The newest sample is
+    # usually minutes older than that (CoinGecko buckets), so it can't
+    # stand in for it; stores written before checked_at existed fall back.
+    return meta.get("checked_at", meta["high_water"])
+
+
+def _router():
+    # Imported here: the router imports this module, and requests + the
+    # HTTP clients load only when a download is needed; reads served
+    # from a fresh local store never import them
+    from data.router.price_router import get_router
+    return get_router()
+
+
+def _sync(store: ColumnFile, symbol: str, granularity: str, start_ms: int, now_ms: int):
+    """
+    Bring the on-disk series up to date, downloading only what is missing.
+    Downloads go through the price router (failover, hedging, circuit
+    breaker); if every source fails, the stored series is kept as is.
+    Held under the store lock so concurrent processes share one download.
+    """
+    with store.lock():
+        meta = store.read_meta()
+
+        unusable = meta["rows"] == 0 or meta.get("granularity") != granularity
+        first_ms = None if unusable else int(store.read(["timestamp"])["timestamp"][0])
+
+        # A source with less history than the window (new listing, shallow
+        # provider) leaves first_ms late for good; once a backfill has asked
+        # from start_ms or earlier, the window is as covered as it gets
+        short = (
+            first_ms is not None
+            and first_ms > start_ms + BACKFILL_TOLERANCE_MS
+            and meta.get("backfilled_from", now_ms) > start_ms
+        )
+
+        # -----------------------------
+        # BACKFILL (empty, too short, or coarser than needed),
+        # at most one attempt per TAIL_REFRESH_SECONDS, failed or not
+        # -----------------------------
+        if unusable or short:
+            if now_ms - meta.get("backfill_at", 0) < TAIL_REFRESH_SECONDS * 1000:
+                if unusable:
+                    return
+            else:
+                store.update_meta(backfill_at=now_ms)
+                days = max(1, int(np.ceil((now_ms - start_ms) / 86_400_000)))
+                try:
+                    df = _router().prices(symbol, days=days)
+                except RuntimeError:
+                    return
+                columns, open_sample = _bucket(df, granularity, now_ms)
+                if not df.empty:
+                    store.rewrite(columns)
+                store.update_meta(
+                    granularity=granularity,
+                    checked_at=now_ms,
+                    open=open_sample,
+                    backfilled_from=start_ms
+                )
+                return
+
+        # -----------------------------
+        # TAIL (only buckets past high-water)
+        # -----------------------------
+        if now_ms - _synced_at(meta) < TAIL_REFRESH_SECONDS * 1000:
+            return
+
+        try:
+            df = _router().prices_range(symbol, meta["high_water"] + GRANULARITY_MS[granularity], now_ms)
+        except RuntimeError:
+            return
+        columns, open_sample = _bucket(df, granularity, now_ms)
+        store.append(columns)
+        store.update_meta(checked_at=now_ms, open=open_sample or _open_sample(store.read_meta(), granularity))
+
+
+def _read_window(store: ColumnFile, granularity: str, start_ms: int) -> pd.DataFrame:
+    """
+    Stored buckets from start_ms on, then the open bucket's latest sample.
+    """
+    meta = store.read_meta()
+    cols = store.read()
+    ts = cols["timestamp"]
+    price = cols["price"]
+
+    sample = _open_sample(meta, granularity)
+    if sample is not None:
+        ts = np.append(ts, sample[0])
+        price = np.append(price, sample[1])
+    if len(ts) == 0:
+        return pd.DataFrame()
+
+    i = int(np.searchsorted(ts, start_ms, side="left"))
+
+    df = pd.DataFrame(
+        {"price": price[i:]},
+        index=pd.to_datetime(ts[i:], unit="ms")
+    )
+    df.index.name = "timestamp"
+    return df
+
+
 def get_price_history(symbol: str, days: int = 7) -> pd.DataFrame:
     symbol = symbol.lower()
     if symbol not in SUPPORTED_SYMBOLS:
         raise ValueError(f"Unsupported symbol: {symbol}")
 
-    df = fetch_price_history(SUPPORTED_SYMBOLS[symbol], days=days)
-    return df
+    granularity = sample_granularity(days)
+    store = _get_store(symbol, granularity)
+    now_ms = int(time.time() * 1000)
+    start_ms = now_ms - days * 86_400_000
 
-def get_current_price(symbol: str) -> float | None:
-    df = get_price_history(symbol, days=1)
-    if df.empty:
-        return None
-    return float(df["price"].iloc[-1])
+    _sync(store, symbol, granularity, start_ms, now_ms)
+    return _read_window(store, granularity, start_ms)
+
+
+def get_bars(symbol: str, days: int = 7, interval: str = "1h") -> pd.DataFrame:
+    """
+    Stored history as canonical OHLC bars (see data/normalize/bars.py).
+    """
+    return normalize_bars(get_price_history(symbol, days=days), interval=interval)
+
+
+def get_price_matrix(symbols, days: int = 7, interval: str = "1h") -> pd.DataFrame:
+    """
+    Aligned (time x symbol) close matrix for core.ta.batch.evaluate_symbols,
+    built from canonical bars. Shorter histories keep leading NaNs so the
+    batch engine can mask them.
+    """
+    columns = {
+        symbol.upper(): get_bars(symbol, days=days, interval=interval)["close"].astype("float64")
+        for symbol in symbols
+    }
+
+    return pd.concat(columns, axis=1).sort_index().ffill()
+
+
+def _coalesced(key: str, fn):
+    """
+    Run fn once per key at a time; concurrent callers wait for
+    the leader's result instead of issuing their own request.
+    """
+    with _inflight_lock:
+        call = _inflight.get(key)
+        leader = call is None
+        if leader:
+            call = {"event": threading.Event(), "result": None, "error": None}
+            _inflight[key] = call
+
+    if not leader:
+        call["event"].wait()
+        if call["error"] is not None:
+            raise call["error"]
+        return call["result"]
+
+    try:
+        call["result"] = fn()
+        return call["result"]
+    except Exception as e:
+        call["error"] = e
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        call["event"].set()
+
+
+def _last_bar_if_fresh(symbol: str, now_ms: int) -> float | None:
+    for granularity in GRANULARITIES:
+        store = _get_store(symbol, granularity)
+        meta = store.read_meta()
+        if now_ms - (_synced_at(meta) or 0) >= TAIL_REFRESH_SECONDS * 1000:
+            continue
+        sample = _open_sample(meta, granularity)
+        if sample is not None:
+            return sample[1]
+        if meta["rows"]:
+            return float(store.read(["price"])["price"][-1])
+    return None
+
+
+def get_current_price(symbol: str, ttl_seconds: float | None = None) -> float | None:
+    symbol = symbol.lower()
+    if symbol not in SUPPORTED_SYMBOLS:
+        raise ValueError(f"Unsupported symbol: {symbol}")
+
+    ttl = SPOT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    now = time.time()
+
+    # -----------------------------
+    # TTL CACHE
+    # -----------------------------
+    cached = _spot_cache.get(symbol)
+    hit = cached is not None and now - cached[0] < ttl
+    record_cache("spot", hit)
+    if hit:
+        return cached[1]
+
+    # -----------------------------
+    # FRESH HISTORY → LAST BAR
+    # -----------------------------
+    price = _last_bar_if_fresh(symbol, int(now * 1000))
+
+    # -----------------------------
+    # SPOT VIA ROUTER (coalesced)
+    # -----------------------------
+    if price is None:
+        try:
+            price = _coalesced(symbol, lambda: _router().spot(symbol))
+        except RuntimeError:
+            price = None
+
+    if price is not None:
+        _spot_cache[symbol] = (time.time(), price)
+
+    return price
@@ -0,0 +1,98 @@
+# data/store/snapshot_store.py
+"""
+Immutable dashboard snapshots on local disk.
+
+Each snapshot is written once as snap-<created_ms>.json, then the
+LATEST pointer file is swapped atomically (os.replace). Readers follow
+the pointer, so they always see a complete snapshot and never block
+on the writer.
+
+The worker only publishes when its output changes, so on quiet data the
+latest snapshot can be old while the worker is healthy. It also touches
+the HEARTBEAT file (epoch ms) as it runs; readers get that as
+"heartbeat_ms" and judge staleness by it.
+"""
+
+import json
+import os
+import time
+
+from data.store.paths import STORE_DIR
+
+SNAPSHOT_DIR = os.path.join(STORE_DIR, "snapshots")
+LATEST_FILE = "LATEST"
+HEARTBEAT_FILE = "HEARTBEAT"
+KEEP_SNAPSHOTS = 20
+
+
+def _dir(symbol: str) -> str:
+    return os.path.join(SNAPSHOT_DIR, symbol.lower())
+
+
+def _atomic_write(path: str, text: str):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def publish_snapshot(symbol: str, snapshot: dict) -> str:
+    """
+    Writes a new snapshot and makes it the latest. Returns its file name.
+    """
+    directory = _dir(symbol)
+    os.makedirs(directory, exist_ok=True)
+
+    created_ms = int(time.time() * 1000)
+    name = f"snap-{created_ms}.json"
+    body = dict(snapshot, created_at_ms=created_ms)
+
+    _atomic_write(os.path.join(directory, name), json.dumps(body, default=str))
+    _atomic_write(os.path.join(directory, LATEST_FILE), name)
+    _atomic_write(os.path.join(directory, HEARTBEAT_FILE), str(created_ms))
+
+    _prune(directory, keep=KEEP_SNAPSHOTS)
+    return name
+
+
+def write_heartbeat(symbol: str):
+    """
+    Marks the worker for `symbol` as alive, without publishing.
+    """
+    directory = _dir(symbol)
+    os.makedirs(directory, exist_ok=True)
+    _atomic_write(os.path.join(directory, HEARTBEAT_FILE), str(int(time.time() * 1000)))
+
+
+def read_latest_snapshot(symbol: str) -> dict | None:
+    """
+    The latest snapshot plus "heartbeat_ms": when the worker last ran
+    (its created_at_ms if no heartbeat was written).
+    """
+    directory = _dir(symbol)
+    try:
+        with open(os.path.join(directory, LATEST_FILE)) as f:
+            name = f.read().strip()
+        with open(os.path.join(directory, name)) as f:
+            snapshot = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    try:
+        with open(os.path.join(directory, HEARTBEAT_FILE)) as f:
+            heartbeat_ms = int(f.read().strip())
+    except (FileNotFoundError, ValueError):
+        heartbeat_ms = 0
+    snapshot["heartbeat_ms"] = max(heartbeat_ms, snapshot.get("created_at_ms", 0))
+    return snapshot
+
+
+def _prune(directory: str, keep: int):
+    snaps = sorted(n for n in os.listdir(directory) if n.startswith("snap-") and n.endswith(".json"))
+    for name in snaps[:-keep]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
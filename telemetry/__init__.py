@@ -0,0 +1,12 @@
+# telemetry package
+from .metrics import (
+    enable,
+    is_enabled,
+    record_cache,
+    record_error,
+    snapshot,
+    span,
+    timed,
+    to_prometheus,
+    write_metrics
+)
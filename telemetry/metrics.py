@@ -0,0 +1,247 @@
+# telemetry/metrics.py
+"""
+Process-wide stage timings, cache hit ratios and upstream error counts.
+
+    from telemetry.metrics import span, record_cache, record_error
+
+    with span("ta"):
+        ta = run_ta(price_df)
+
+Disabled by default (enable with DEFITUNA_METRICS=1 or enable()).
+While disabled, span() hands back a shared no-op context and the
+record_* helpers return after one flag check, so instrumented code
+pays next to nothing.
+
+Export with to_prometheus() (text exposition format) or
+write_metrics(path) (.json -> JSON snapshot, anything else -> Prometheus text).
+"""
+
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+
+# Upper bounds in seconds; the last bucket is +Inf
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PREFIX = "defituna"
+
+_enabled = os.environ.get("DEFITUNA_METRICS", "").lower() in ("1", "true", "yes")
+_lock = threading.Lock()
+
+_histograms = {}   # stage -> {"counts": [...], "sum": s, "count": n, "max": m}
+_cache = {}        # cache -> [hits, misses]
+_errors = {}       # (source, error) -> n
+
+
+def enable(flag: bool = True):
+    global _enabled
+    _enabled = bool(flag)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _cache.clear()
+        _errors.clear()
+
+
+# -----------------------------
+# RECORDING
+# -----------------------------
+def observe(stage: str, seconds: float):
+    if not _enabled:
+        return
+    with _lock:
+        h = _histograms.get(stage)
+        if h is None:
+            h = {"counts": [0] * (len(BUCKETS) + 1), "sum": 0.0, "count": 0, "max": 0.0}
+            _histograms[stage] = h
+        h["counts"][bisect.bisect_left(BUCKETS, seconds)] += 1
+        h["sum"] += seconds
+        h["count"] += 1
+        h["max"] = max(h["max"], seconds)
+
+
+def record_cache(cache: str, hit: bool):
+    if not _enabled:
+        return
+    with _lock:
+        counts = _cache.setdefault(cache, [0, 0])
+        counts[0 if hit else 1] += 1
+
+
+def record_error(source: str, error: str):
+    if not _enabled:
+        return
+    with _lock:
+        key = (source, error)
+        _errors[key] = _errors.get(key, 0) + 1
+
+
+class _Span:
+    __slots__ = ("stage", "t0")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        observe(self.stage, time.perf_counter() - self.t0)
+        if exc_type is not None:
+            record_error(self.stage, exc_type.__name__)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(stage: str):
+    """
+    Times the enclosed block into the `stage` histogram; an exception
+    escaping the block is also counted as an error for that stage.
+    """
+    if not _enabled:
+        return _NOOP
+    return _Span(stage)
+
+
+def timed(stage: str):
+    """
+    Decorator form of span().
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# -----------------------------
+# READING
+# -----------------------------
+def _quantile(h: dict, q: float) -> float:
+    """
+    Upper bound of the bucket holding the q-th observation,
+    capped at the largest observation.
+    """
+    rank = q * h["count"]
+    seen = 0
+    for i, c in enumerate(h["counts"]):
+        seen += c
+        if seen >= rank and c:
+            return min(BUCKETS[i], h["max"]) if i < len(BUCKETS) else h["max"]
+    return h["max"]
+
+
+def snapshot() -> dict:
+    """
+    {
+        "stages": {stage: {"count", "mean_ms", "p50_ms", "p95_ms", "max_ms"}},
+        "caches": {cache: {"hits", "misses", "hit_ratio"}},
+        "errors": {source: {error: n}}
+    }
+    p50 / p95 are bucket upper bounds, not exact quantiles.
+    """
+    with _lock:
+        stages = {
+            stage: {
+                "count": h["count"],
+                "mean_ms": round(h["sum"] / h["count"] * 1000, 3) if h["count"] else 0.0,
+                "p50_ms": round(_quantile(h, 0.50) * 1000, 3),
+                "p95_ms": round(_quantile(h, 0.95) * 1000, 3),
+                "max_ms": round(h["max"] * 1000, 3)
+            }
+            for stage, h in sorted(_histograms.items())
+        }
+
+        caches = {
+            name: {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None
+            }
+            for name, (hits, misses) in sorted(_cache.items())
+        }
+
+        errors = {}
+        for (source, error), n in sorted(_errors.items()):
+            errors.setdefault(source, {})[error] = n
+
+    return {"stages": stages, "caches": caches, "errors": errors}
+
+
+def _labels(**labels) -> str:
+    body = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in labels.items()
+    )
+    return "{" + body + "}"
+
+
+def to_prometheus() -> str:
+    lines = []
+
+    with _lock:
+        name = f"{PREFIX}_stage_seconds"
+        lines.append(f"# HELP {name} Stage latency.")
+        lines.append(f"# TYPE {name} histogram")
+        for stage, h in sorted(_histograms.items()):
+            cumulative = 0
+            for bound, c in zip(BUCKETS + ("+Inf",), h["counts"]):
+                cumulative += c
+                lines.append(f"{name}_bucket{_labels(stage=stage, le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(stage=stage)} {h['sum']:.6f}")
+            lines.append(f"{name}_count{_labels(stage=stage)} {h['count']}")
+
+        name = f"{PREFIX}_cache_requests_total"
+        lines.append(f"# HELP {name} Cache lookups by result.")
+        lines.append(f"# TYPE {name} counter")
+        for cache, (hits, misses) in sorted(_cache.items()):
+            lines.append(f"{name}{_labels(cache=cache, result='hit')} {hits}")
+            lines.append(f"{name}{_labels(cache=cache, result='miss')} {misses}")
+
+        name = f"{PREFIX}_errors_total"
+        lines.append(f"# HELP {name} Upstream and stage errors.")
+        lines.append(f"# TYPE {name} counter")
+        for (source, error), n in sorted(_errors.items()):
+            lines.append(f"{name}{_labels(source=source, error=error)} {n}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path: str):
+    """
+    Atomically writes the current metrics to `path`
+    (JSON for *.json, Prometheus text otherwise).
+    """
+    text = json.dumps(snapshot()) if path.endswith(".json") else to_prometheus()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
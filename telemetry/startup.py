@@ -0,0 +1,192 @@
+# telemetry/startup.py
+"""
+Cold-start measurements.
+
+In-process: import this module first, then mark() milestones; times
+are milliseconds since this module was imported.
+
+    from telemetry import startup
+    ...imports...
+    startup.mark("imports")
+    ...render...
+    startup.mark("first_render")
+
+Offline CLI: each entry point is imported in a fresh interpreter with
+-X importtime, so numbers are true cold starts.
+
+    python -m telemetry.startup
+    python -m telemetry.startup app.pipeline core.fa.fa_aggregator --top 15
+    python -m telemetry.startup --render    # time-to-first-render of app/main.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_T0 = time.perf_counter()
+_marks = {}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("numpy", "pandas", "requests", "feedparser", "yfinance", "streamlit")
+
+DEFAULT_TARGETS = (
+    "data.store.snapshot_store",
+    "data.store.price_store",
+    "core.fa.fa_aggregator",
+    "app.pipeline",
+    "app.snapshot_worker",
+)
+
+
+# -----------------------------
+# IN-PROCESS MARKS
+# -----------------------------
+def mark(name: str) -> float:
+    """
+    Records `name` the first time it is reached in this process
+    (Streamlit reruns the script; later runs are ignored).
+    """
+    if name not in _marks:
+        _marks[name] = round((time.perf_counter() - _T0) * 1000, 2)
+    return _marks[name]
+
+
+def marks() -> dict:
+    return dict(_marks)
+
+
+def loaded_heavy_modules() -> list:
+    return [m for m in HEAVY_MODULES if m in sys.modules]
+
+
+# -----------------------------
+# COLD IMPORT PROFILE
+# -----------------------------
+def _parse_importtime(stderr: str) -> list:
+    """
+    -X importtime lines -> [(module, self_us, cumulative_us)].
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def profile_import(module: str, top: int = 10) -> dict:
+    code = (
+        "import sys, json, time; t0 = time.perf_counter(); "
+        f"import {module}; "
+        "print(json.dumps({'ms': (time.perf_counter() - t0) * 1000, "
+        f"'heavy': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))"
+    )
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    process_ms = (time.perf_counter() - t0) * 1000
+
+    if proc.returncode != 0:
+        return {"module": module, "error": proc.stderr.strip().splitlines()[-1]}
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    rows = _parse_importtime(proc.stderr)
+
+    # Top-level packages by total self time
+    by_package = {}
+    for name, self_us, _ in rows:
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+
+    return {
+        "module": module,
+        "import_ms": round(result["ms"], 1),
+        "process_ms": round(process_ms, 1),
+        "heavy_modules": result["heavy"],
+        "slowest_packages_ms": {
+            k: round(v / 1000, 1)
+            for k, v in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]
+        }
+    }
+
+
+# -----------------------------
+# TIME TO FIRST RENDER
+# -----------------------------
+def profile_render(script: str = "app/main.py", offline: bool = True, timeout: float = 120) -> dict:
+    """
+    Runs the Streamlit script headless (streamlit.testing AppTest) in a
+    fresh interpreter and times its first complete run.
+
+    offline: point CoinGecko at the local fake server and use an empty
+             temporary store, so the inline pipeline path runs without
+             network access.
+    """
+    code = (
+        "import json, time; t0 = time.perf_counter(); "
+        "from streamlit.testing.v1 import AppTest; "
+        "t1 = time.perf_counter(); "
+        f"at = AppTest.from_file({script!r}, default_timeout={timeout}); at.run(); "
+        "t2 = time.perf_counter(); "
+        "print(json.dumps({'streamlit_import_ms': (t1 - t0) * 1000, "
+        "'first_render_ms': (t2 - t1) * 1000, 'errors': [str(e.value) for e in at.exception]}))"
+    )
+
+    env = dict(os.environ)
+    server = None
+    if offline:
+        from data.sources.fake_coingecko import serve
+
+        server, base_url = serve()
+        env["COINGECKO_BASE_URL"] = base_url
+        env["DEFITUNA_STORE_DIR"] = tempfile.mkdtemp(prefix="defituna-startup-")
+
+    try:
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT, env=env, capture_output=True, text=True, timeout=timeout
+        )
+        process_ms = (time.perf_counter() - t0) * 1000
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    if proc.returncode != 0:
+        return {"script": script, "error": proc.stderr.strip().splitlines()[-1]}
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {
+        "script": script,
+        "process_ms": round(process_ms, 1),
+        "streamlit_import_ms": round(result["streamlit_import_ms"], 1),
+        "first_render_ms": round(result["first_render_ms"], 1),
+        "errors": result["errors"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import and render profile")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_TARGETS))
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--render", action="store_true", help="also time app/main.py's first render")
+    parser.add_argument("--online", action="store_true", help="render against the real upstreams")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        print(json.dumps(profile_import(module, args.top)))
+
+    if args.render:
+        print(json.dumps(profile_render(offline=not args.online)))
+
+
+if __name__ == "__main__":
+    main()